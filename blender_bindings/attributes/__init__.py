@@ -7,6 +7,22 @@ from SourceIO.blender_bindings.operators.shared_operators import SOURCEIO_UL_Mou
 
 def register_props():
     bpy.types.Scene.TextureCachePath = StringProperty(name="TextureCachePath", subtype="FILE_PATH")
+    bpy.types.Scene.DecodedTextureCachePath = StringProperty(name="DecodedTextureCachePath", subtype="DIR_PATH",
+                                                             description="Directory to keep decoded VTF/vtex "
+                                                                         "pixels in between imports")
+    bpy.types.Scene.DecodedTextureCacheSize = IntProperty(name="DecodedTextureCacheSize", default=2048, min=64,
+                                                          subtype="UNSIGNED",
+                                                          description="Decoded texture cache size limit in MB")
+    bpy.types.Scene.UseMountManifest = bpy.props.BoolProperty(
+        name="Use mount manifest",
+        description="Store discovered game content next to game root and reuse it on next import",
+        default=False
+    )
+    bpy.types.Scene.UsePathIndex = bpy.props.BoolProperty(
+        name="Use path index",
+        description="Look files up in a merged listing of all mounted content instead of querying each source",
+        default=False
+    )
 
     bpy.types.Scene.use_bvlg = bpy.props.BoolProperty(
         name="Use BVLG",
@@ -37,6 +53,10 @@ def register_props():
 
 def unregister_props():
     del bpy.types.Scene.TextureCachePath
+    del bpy.types.Scene.DecodedTextureCachePath
+    del bpy.types.Scene.DecodedTextureCacheSize
+    del bpy.types.Scene.UseMountManifest
+    del bpy.types.Scene.UsePathIndex
     del bpy.types.Mesh.flex_controllers
     del bpy.types.Mesh.flex_selected_index
     del bpy.types.Scene.use_bvlg
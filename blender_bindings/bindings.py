@@ -25,6 +25,7 @@ from .operators.source2_operators import (SOURCEIO_OT_VMAPImport,
                                           SOURCEIO_OT_DMXCameraImport)
 from .ui.export_nodes import register_nodes, unregister_nodes
 from .utils.bpy_utils import is_blender_4_1
+from .utils.texture_utils import reset_texture_registry
 
 
 custom_icons = {}
@@ -204,6 +205,9 @@ def register():
     register_nodes()
     register_props()
     bpy.types.TOPBAR_MT_file_import.append(menu_import)
+    # Image index is only valid for data it was built from
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        handlers.append(reset_texture_registry)
 
     # if is_vtflib_supported():
     #     from ..library.source1.vtf import VTFLib
@@ -212,6 +216,9 @@ def register():
 
 def unregister():
     bpy.types.TOPBAR_MT_file_import.remove(menu_import)
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if reset_texture_registry in handlers:
+            handlers.remove(reset_texture_registry)
 
     # Taken from https://github.com/lasa01/Plumber/blob/master/plumber/__init__.py
     # if is_windows and False:
@@ -1,6 +1,8 @@
 from typing import Optional
 
-from SourceIO.blender_bindings.models.model_tags import MODEL_HANDLERS, choose_model_importer
+from SourceIO.blender_bindings.models.model_tags import (MODEL_HANDLERS, MODEL_PARSERS, ModelFiles, ModelImportFunction,
+                                                         ModelParseFunction, ParsedModel, choose_model_importer,
+                                                         find_model_files)
 from SourceIO.blender_bindings.operators.import_settings_base import ModelOptions
 from SourceIO.blender_bindings.shared.model_container import ModelContainer
 from SourceIO.library.shared.app_id import SteamAppId
@@ -14,19 +16,47 @@ log_manager = SourceLogMan()
 logger = log_manager.get_logger('MDL loader')
 
 
+def _find_model_handler(model_path: TinyPath, buffer: Buffer,
+                        content_provider: ContentManager,
+                        override_steam_id: Optional[SteamAppId] = None) -> Optional[ModelImportFunction]:
+    ident, version = buffer.read_fmt("4sI")
+    buffer.seek(0)
+    logger.info(f"Detected magic: {ident!r}, version:{version}")
+    steam_id = content_provider.get_steamid_from_asset(model_path)
+    handler = choose_model_importer(ident, version, (override_steam_id or steam_id or None))
+    if handler is None:
+        logger.error(f"No handler found for ident {ident} version: {version}")
+    return handler
+
+
+def find_model_parser(model_path: TinyPath, buffer: Buffer,
+                      content_provider: ContentManager,
+                      options: ModelOptions,
+                      override_steam_id: Optional[SteamAppId] = None,
+                      ) -> Optional[tuple[ModelParseFunction, ModelFiles]]:
+    """Resolve model files and return parser for them, None if model format can't be parsed ahead of import.
+
+    Must be called on the main thread, returned parser only reads given files and can run on any thread.
+    Its result is passed to import_model as `parsed`.
+    """
+    handler = _find_model_handler(model_path, buffer, content_provider, override_steam_id)
+    parser = MODEL_PARSERS.get(handler, None)
+    if parser is None:
+        return None
+    return parser, find_model_files(model_path, buffer, content_provider, options)
+
+
 def import_model(model_path: TinyPath, buffer: Buffer,
                  content_provider: ContentManager,
                  options: ModelOptions,
                  override_steam_id: Optional[SteamAppId] = None,
+                 parsed: Optional[ParsedModel] = None,
                  ) -> Optional[ModelContainer]:
-    ident, version = buffer.read_fmt("4sI")
     logger.info(f"Trying to load model: {model_path}")
-    logger.info(f"Detected magic: {ident!r}, version:{version}")
-    steam_id = content_provider.get_steamid_from_asset(model_path)
-    handler = choose_model_importer(ident, version, (override_steam_id or steam_id or None))
+    handler = _find_model_handler(model_path, buffer, content_provider, override_steam_id)
     if handler is None:
-        logger.error(f"No handler found for ident {ident} version: {version}")
         return None
-    buffer.seek(0)
+    if parsed is not None:
+        return handler(model_path, buffer, content_provider, options, parsed)
     container = handler(model_path, buffer, content_provider, options)
     return container
@@ -1,6 +1,7 @@
 from typing import Optional
 
-from SourceIO.blender_bindings.models.model_tags import register_model_importer
+from SourceIO.blender_bindings.models.model_tags import (ModelFiles, ParsedModel, find_model_files,
+                                                         register_model_importer, register_model_parser)
 from SourceIO.blender_bindings.models.mdl36.import_mdl import import_model, import_materials
 from SourceIO.blender_bindings.operators.import_settings_base import ModelOptions
 from SourceIO.blender_bindings.shared.exceptions import RequiredFileNotFound
@@ -11,7 +12,6 @@ from SourceIO.library.models.phy.phy import Phy
 from SourceIO.library.models.vtx import open_vtx
 from SourceIO.library.shared.content_manager import ContentManager
 from SourceIO.library.utils import Buffer
-from SourceIO.library.utils.path_utilities import find_vtx_cm
 from SourceIO.library.utils.tiny_path import TinyPath
 from SourceIO.logger import SourceLogMan
 
@@ -19,15 +19,24 @@ log_manager = SourceLogMan()
 logger = log_manager.get_logger('MDL loader')
 
 
-@register_model_importer(b"IDST", 36)
-def import_mdl36(model_path: TinyPath, buffer: Buffer,
-                 content_manager: ContentManager, options: ModelOptions) -> Optional[ModelContainer]:
-    mdl = MdlV36.from_buffer(buffer)
-    vtx_buffer = find_vtx_cm(model_path, content_manager)
-    if vtx_buffer is None:
+def parse_mdl36(model_path: TinyPath, files: ModelFiles) -> ParsedModel:
+    mdl = MdlV36.from_buffer(files.mdl)
+    if files.vtx is None:
         logger.error(f"Could not find VTX file for {model_path}")
         raise RequiredFileNotFound(f"Could not find VVD file for {model_path}")
-    vtx = open_vtx(vtx_buffer)
+    vtx = open_vtx(files.vtx)
+    phy = Phy.from_buffer(files.phy) if files.phy is not None else None
+    return ParsedModel(mdl, vtx, phy=phy, phy_buffer=files.phy)
+
+
+@register_model_importer(b"IDST", 36)
+@register_model_parser(parse_mdl36)
+def import_mdl36(model_path: TinyPath, buffer: Buffer,
+                 content_manager: ContentManager, options: ModelOptions,
+                 parsed: Optional[ParsedModel] = None) -> Optional[ModelContainer]:
+    if parsed is None:
+        parsed = parse_mdl36(model_path, find_model_files(model_path, buffer, content_manager, options))
+    mdl = parsed.mdl
 
     if options.import_textures:
         try:
@@ -37,13 +46,11 @@ def import_mdl36(model_path: TinyPath, buffer: Buffer,
             import traceback
             traceback.print_exc()
 
-    container = import_model(content_manager, mdl, vtx, options.scale, options.create_flex_drivers)
+    container = import_model(content_manager, mdl, parsed.vtx, options.scale, options.create_flex_drivers)
     if options.import_physics:
-        phy_buffer = content_manager.find_file(model_path.with_suffix(".phy"))
-        if phy_buffer is None:
+        if parsed.phy is None:
             logger.error(f"Could not find PHY file for {model_path}")
         else:
-            phy = Phy.from_buffer(phy_buffer)
-            import_physics(phy, phy_buffer, mdl, container, options.scale)
+            import_physics(parsed.phy, parsed.phy_buffer, mdl, container, options.scale)
     
     return container
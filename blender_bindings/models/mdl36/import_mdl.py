@@ -10,7 +10,8 @@ from SourceIO.blender_bindings.material_loader.material_loader import Source1Mat
 from SourceIO.blender_bindings.material_loader.shaders.source1_shader_base import Source1ShaderBase
 from SourceIO.blender_bindings.models.common import merge_meshes
 from SourceIO.blender_bindings.shared.model_container import ModelContainer
-from SourceIO.blender_bindings.utils.bpy_utils import add_material, is_blender_4_1, get_or_create_material
+from SourceIO.blender_bindings.utils.bpy_utils import (add_material, add_vertex_weights, get_or_create_material,
+                                                       is_blender_4_1)
 from SourceIO.blender_bindings.utils.fast_mesh import FastMesh
 from SourceIO.library.models.mdl.structs.header import StudioHDRFlags
 from SourceIO.library.models.mdl.v36.mdl_file import MdlV36
@@ -143,13 +144,8 @@ def import_model(content_manager: ContentManager, mdl: MdlV36, vtx: Vtx,
                         type="ARMATURE", name="Armature")
                     modifier.object = armature
                     mesh_obj.parent = armature
-                weight_groups = {bone.name: mesh_obj.vertex_groups.new(name=bone.name) for bone in mdl.bones}
-
-                for n, (bone_indices, bone_weights) in enumerate(zip(vertices['bone_id'], vertices['weight'])):
-                    for bone_index, weight in zip(bone_indices, bone_weights):
-                        if weight > 0:
-                            bone_name = mdl.bones[bone_index].name
-                            weight_groups[bone_name].add([n], weight, 'REPLACE')
+                add_vertex_weights(mesh_obj, [bone.name for bone in mdl.bones], vertices['bone_id'],
+                                   vertices['weight'])
 
                 mesh_obj.shape_key_add(name='base')
                 for mesh in model.meshes:
@@ -1,7 +1,8 @@
 from typing import Optional
 
 from SourceIO.blender_bindings.models.mdl36 import import_materials
-from SourceIO.blender_bindings.models.model_tags import register_model_importer
+from SourceIO.blender_bindings.models.model_tags import (ModelFiles, ParsedModel, find_model_files,
+                                                         register_model_importer, register_model_parser)
 from SourceIO.blender_bindings.models.mdl44.import_mdl import import_model
 from SourceIO.blender_bindings.operators.import_settings_base import ModelOptions
 from SourceIO.blender_bindings.shared.exceptions import RequiredFileNotFound
@@ -13,7 +14,6 @@ from SourceIO.library.models.vtx import open_vtx
 from SourceIO.library.models.vvd import Vvd
 from SourceIO.library.shared.content_manager import ContentManager
 from SourceIO.library.utils import Buffer
-from SourceIO.library.utils.path_utilities import find_vtx_cm
 from SourceIO.library.utils.tiny_path import TinyPath
 from SourceIO.logger import SourceLogMan
 
@@ -21,6 +21,17 @@ log_manager = SourceLogMan()
 logger = log_manager.get_logger('MDL loader')
 
 
+def parse_mdl44(model_path: TinyPath, files: ModelFiles) -> ParsedModel:
+    mdl = MdlV44.from_buffer(files.mdl)
+    if files.vtx is None or files.vvd is None:
+        logger.error(f"Could not find VTX and/or VVD file for {model_path}")
+        raise RequiredFileNotFound(f"Could not find VTX and/or VVD file for {model_path}")
+    vtx = open_vtx(files.vtx)
+    vvd = Vvd.from_buffer(files.vvd)
+    phy = Phy.from_buffer(files.phy) if files.phy is not None else None
+    return ParsedModel(mdl, vtx, vvd, phy=phy, phy_buffer=files.phy)
+
+
 @register_model_importer(b"IDST", 37)
 @register_model_importer(b"IDST", 38)
 @register_model_importer(b"IDST", 39)
@@ -29,16 +40,13 @@ logger = log_manager.get_logger('MDL loader')
 @register_model_importer(b"IDST", 42)
 @register_model_importer(b"IDST", 43)
 @register_model_importer(b"IDST", 44)
+@register_model_parser(parse_mdl44)
 def import_mdl44(model_path: TinyPath, buffer: Buffer,
-                 content_manager: ContentManager, options: ModelOptions) -> Optional[ModelContainer]:
-    mdl = MdlV44.from_buffer(buffer)
-    vtx_buffer = find_vtx_cm(model_path, content_manager)
-    vvd_buffer = content_manager.find_file(model_path.with_suffix(".vvd"))
-    if vtx_buffer is None or vvd_buffer is None:
-        logger.error(f"Could not find VTX and/or VVD file for {model_path}")
-        raise RequiredFileNotFound(f"Could not find VTX and/or VVD file for {model_path}")
-    vtx = open_vtx(vtx_buffer)
-    vvd = Vvd.from_buffer(vvd_buffer)
+                 content_manager: ContentManager, options: ModelOptions,
+                 parsed: Optional[ParsedModel] = None) -> Optional[ModelContainer]:
+    if parsed is None:
+        parsed = parse_mdl44(model_path, find_model_files(model_path, buffer, content_manager, options))
+    mdl = parsed.mdl
     if options.import_textures:
         try:
             import_materials(content_manager, mdl, use_bvlg=options.use_bvlg)
@@ -46,14 +54,12 @@ def import_mdl44(model_path: TinyPath, buffer: Buffer,
             logger.error(f'Failed to import materials, caused by {t_ex}')
             import traceback
             traceback.print_exc()
-    container = import_model(content_manager, mdl, vtx, vvd, options.scale, options.create_flex_drivers)
+    container = import_model(content_manager, mdl, parsed.vtx, parsed.vvd, options.scale, options.create_flex_drivers)
     if options.import_physics:
-        phy_buffer = content_manager.find_file(model_path.with_suffix(".phy"))
-        if phy_buffer is None:
+        if parsed.phy is None:
             logger.error(f"Could not find PHY file for {model_path}")
         else:
-            phy = Phy.from_buffer(phy_buffer)
-            import_physics(phy, phy_buffer, mdl, container, options.scale)
+            import_physics(parsed.phy, parsed.phy_buffer, mdl, container, options.scale)
     
 
     return container
@@ -1,6 +1,7 @@
 from typing import Optional
 
-from SourceIO.blender_bindings.models.model_tags import register_model_importer
+from SourceIO.blender_bindings.models.model_tags import (ModelFiles, ParsedModel, find_model_files,
+                                                         register_model_importer, register_model_parser)
 from SourceIO.blender_bindings.models.mdl49 import import_materials
 from SourceIO.blender_bindings.models.mdl52.import_mdl import import_model
 from SourceIO.blender_bindings.operators.import_settings_base import ModelOptions
@@ -14,7 +15,6 @@ from SourceIO.library.models.vvc import Vvc
 from SourceIO.library.models.vvd import Vvd
 from SourceIO.library.shared.content_manager import ContentManager
 from SourceIO.library.utils import Buffer
-from SourceIO.library.utils.path_utilities import find_vtx_cm
 from SourceIO.library.utils.tiny_path import TinyPath
 from SourceIO.logger import SourceLogMan
 
@@ -22,22 +22,29 @@ log_manager = SourceLogMan()
 logger = log_manager.get_logger('MDL loader')
 
 
-@register_model_importer(b"IDST", 52)
-def import_mdl52(model_path: TinyPath, buffer: Buffer,
-                 content_manager: ContentManager, options: ModelOptions) -> Optional[ModelContainer]:
-    mdl = MdlV52.from_buffer(buffer)
-    vtx_buffer = find_vtx_cm(model_path, content_manager)
-    vvd_buffer = content_manager.find_file(model_path.with_suffix(".vvd"))
-    if vtx_buffer is None or vvd_buffer is None:
+def parse_mdl52(model_path: TinyPath, files: ModelFiles) -> ParsedModel:
+    mdl = MdlV52.from_buffer(files.mdl)
+    if files.vtx is None or files.vvd is None:
         logger.error(f"Could not find VTX and/or VVD file for {model_path}")
         raise RequiredFileNotFound(f"Could not find VTX and/or VVD file for {model_path}")
-    vtx = open_vtx(vtx_buffer)
-    vvd = Vvd.from_buffer(vvd_buffer)
-    vvc_buffer = content_manager.find_file(model_path.with_suffix(".vvc"))
-    if vvc_buffer is not None:
-        vvc = Vvc.from_buffer(vvc_buffer)
+    vtx = open_vtx(files.vtx)
+    vvd = Vvd.from_buffer(files.vvd)
+    if files.vvc is not None:
+        vvc = Vvc.from_buffer(files.vvc)
     else:
         vvc = None
+    phy = Phy.from_buffer(files.phy) if files.phy is not None else None
+    return ParsedModel(mdl, vtx, vvd, vvc, phy, files.phy)
+
+
+@register_model_importer(b"IDST", 52)
+@register_model_parser(parse_mdl52)
+def import_mdl52(model_path: TinyPath, buffer: Buffer,
+                 content_manager: ContentManager, options: ModelOptions,
+                 parsed: Optional[ParsedModel] = None) -> Optional[ModelContainer]:
+    if parsed is None:
+        parsed = parse_mdl52(model_path, find_model_files(model_path, buffer, content_manager, options))
+    mdl = parsed.mdl
 
     if options.import_textures:
         try:
@@ -47,14 +54,12 @@ def import_mdl52(model_path: TinyPath, buffer: Buffer,
             import traceback
             traceback.print_exc()
 
-    container = import_model(content_manager, mdl, vtx, vvd, vvc, options.scale)
+    container = import_model(content_manager, mdl, parsed.vtx, parsed.vvd, parsed.vvc, options.scale)
     if options.import_physics:
-        phy_buffer = content_manager.find_file(model_path.with_suffix(".phy"))
-        if phy_buffer is None:
+        if parsed.phy is None:
             logger.error(f"Could not find PHY file for {model_path}")
         else:
-            phy = Phy.from_buffer(phy_buffer)
-            import_physics(phy, phy_buffer, mdl, container, options.scale)
+            import_physics(parsed.phy, parsed.phy_buffer, mdl, container, options.scale)
 
     
     return container
@@ -1,11 +1,12 @@
 from dataclasses import field, dataclass
-from typing import Optional, Callable
+from typing import Any, Optional, Callable
 
 from SourceIO.blender_bindings.operators.import_settings_base import ModelOptions
 from SourceIO.blender_bindings.shared.model_container import ModelContainer
 from SourceIO.library.shared.app_id import SteamAppId
 from SourceIO.library.shared.content_manager import ContentManager
 from SourceIO.library.utils import Buffer
+from SourceIO.library.utils.path_utilities import find_vtx_cm
 from SourceIO.library.utils.tiny_path import TinyPath
 
 
@@ -16,8 +17,31 @@ class ModelImporterTag:
     steam_id: Optional[SteamAppId] = field(default=None)
 
 
+@dataclass(slots=True)
+class ModelFiles:
+    """Companion files of a Source1 model, resolved through content manager."""
+    mdl: Buffer
+    vtx: Optional[Buffer] = field(default=None)
+    vvd: Optional[Buffer] = field(default=None)
+    vvc: Optional[Buffer] = field(default=None)
+    phy: Optional[Buffer] = field(default=None)
+
+
+@dataclass(slots=True)
+class ParsedModel:
+    """Model files parsed ahead of import. Holds no Blender data, so it can be produced on worker threads."""
+    mdl: Any
+    vtx: Any = field(default=None)
+    vvd: Any = field(default=None)
+    vvc: Any = field(default=None)
+    phy: Any = field(default=None)
+    phy_buffer: Optional[Buffer] = field(default=None)
+
+
 ModelImportFunction = Callable[[TinyPath, Buffer, ContentManager, ModelOptions], ModelContainer]
+ModelParseFunction = Callable[[TinyPath, ModelFiles], ParsedModel]
 MODEL_HANDLERS: list[tuple[ModelImporterTag, ModelImportFunction]] = []
+MODEL_PARSERS: dict[ModelImportFunction, ModelParseFunction] = {}
 
 
 def register_model_importer(ident: bytes, version: int,
@@ -29,6 +53,26 @@ def register_model_importer(ident: bytes, version: int,
     return inner
 
 
+def register_model_parser(parser: ModelParseFunction):
+    """Mark importer as able to take ParsedModel produced by given parser instead of parsing files itself."""
+
+    def inner(func: ModelImportFunction) -> ModelImportFunction:
+        MODEL_PARSERS[func] = parser
+        return func
+
+    return inner
+
+
+def find_model_files(model_path: TinyPath, buffer: Buffer, content_manager: ContentManager,
+                     options: ModelOptions) -> ModelFiles:
+    files = ModelFiles(buffer, find_vtx_cm(model_path, content_manager),
+                       content_manager.find_file(model_path.with_suffix(".vvd")),
+                       content_manager.find_file(model_path.with_suffix(".vvc")))
+    if options.import_physics:
+        files.phy = content_manager.find_file(model_path.with_suffix(".phy"))
+    return files
+
+
 def choose_model_importer(ident: bytes, version: int, steam_id: Optional[int] = None) -> Optional[ModelImportFunction]:
     best_match = None
     best_score = 0  # Start with a score lower than any possible match score
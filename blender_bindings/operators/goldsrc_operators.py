@@ -4,6 +4,7 @@ from bpy.props import (BoolProperty, CollectionProperty, FloatProperty,
 
 from SourceIO.blender_bindings.goldsrc.bsp.import_bsp import BSP
 from SourceIO.library.global_config import GoldSrcConfig
+from SourceIO.blender_bindings.utils.resource_utils import sync_content_manager_settings
 from SourceIO.library.shared.content_manager import ContentManager
 from SourceIO.library.utils.math_utilities import SOURCE1_HAMMER_UNIT_TO_METERS
 from SourceIO.library.utils.tiny_path import TinyPath
@@ -34,6 +35,7 @@ class SOURCEIO_OT_GBSPImport(bpy.types.Operator):
         else:
             directory = TinyPath(self.filepath).absolute()
         content_provider = ContentManager()
+        sync_content_manager_settings(content_provider)
         content_provider.scan_for_content(directory)
         for n, file in enumerate(self.files):
             logger.info(f"Loading {n}/{len(self.files)}")
@@ -43,6 +45,7 @@ class SOURCEIO_OT_GBSPImport(bpy.types.Operator):
                       single_collection=self.single_collection,
                       fix_rotation=self.fix_rotation)
             bsp.load_map()
+        content_provider.log_stats()
         return {'FINISHED'}
 
     def invoke(self, context, event):
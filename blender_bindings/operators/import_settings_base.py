@@ -1,8 +1,17 @@
-from bpy.props import BoolProperty, FloatProperty
+from bpy.props import BoolProperty, EnumProperty, FloatProperty
 
 from ...library.utils.math_utilities import SOURCE1_HAMMER_UNIT_TO_METERS
 
 
+STATIC_PROP_MODES = (
+    ('PLACEHOLDERS', "Placeholders", "Create an empty per static prop, models can be loaded later with Entity loader"),
+    ('INSTANCES', "Collection instances",
+     "Load every unique model once and place static props as collection instances"),
+    ('POINT_CLOUD', "Geometry nodes instances",
+     "Load every unique model once and instance it on a point cloud with geometry nodes"),
+)
+
+
 class SharedOptions:
     scale: FloatProperty(name="World scale", default=SOURCE1_HAMMER_UNIT_TO_METERS, precision=6)
 
@@ -29,6 +38,7 @@ class GoldSrcBspSettings(BSPOptions):
 
 class Source1BSPSettings(GoldSrcBspSettings, Source1SharedSettings):
     import_cubemaps: BoolProperty(name="Import cubemaps", default=False, subtype='UNSIGNED')
+    static_prop_mode: EnumProperty(name="Static props", items=STATIC_PROP_MODES, default='PLACEHOLDERS')
 
 
 class ModelOptions(SharedOptions, Source1SharedSettings):
@@ -1,8 +1,11 @@
 import itertools
 import operator
+import os
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from hashlib import md5
 from itertools import chain
-from typing import Any, MutableMapping, Iterable
+from typing import Any, MutableMapping, Iterable, Mapping, Optional
 
 from bpy.props import (StringProperty)
 from bpy.types import (Panel,
@@ -13,15 +16,16 @@ import bpy
 from mathutils import Matrix
 
 from .import_settings_base import ModelOptions
-from SourceIO.blender_bindings.models import import_model
+from SourceIO.blender_bindings.models import find_model_parser, import_model
 from SourceIO.blender_bindings.models.common import put_into_collections as s1_put_into_collections
 from SourceIO.blender_bindings.shared.exceptions import RequiredFileNotFound
 from SourceIO.blender_bindings.shared.model_container import ModelContainer
-from SourceIO.blender_bindings.source2.vmdl_loader import load_model, ImportContext
+from SourceIO.blender_bindings.source2.vmdl_loader import load_model, preload_model, ImportContext
 from SourceIO.blender_bindings.source2.vmdl_loader import put_into_collections as s2_put_into_collections
 from SourceIO.blender_bindings.utils.bpy_utils import (get_or_create_collection, find_layer_collection,
                                                        pause_view_layer_update)
-from SourceIO.blender_bindings.utils.resource_utils import deserialize_mounted_content, serialize_mounted_content
+from SourceIO.blender_bindings.utils.resource_utils import deserialize_mounted_content, serialize_mounted_content, \
+    sync_content_manager_settings
 from SourceIO.library.shared.content_manager import ContentManager
 from SourceIO.library.source2 import CompiledModelResource
 from SourceIO.library.utils.path_utilities import path_stem
@@ -75,29 +79,104 @@ class SourceIO_OT_LoadEntity(Operator):
         master_instance_lcollection.exclude = True
         win = bpy.context.window_manager
 
+        # Placeholders of the same model and skin get loaded together, model files are only parsed once
+        placeholders: dict[tuple[str, str], list[bpy.types.Object]] = defaultdict(list)
+        for obj in context.selected_objects:
+            if obj.get("entity_data", None):
+                custom_prop_data = obj['entity_data']
+                prop_path = custom_prop_data.get('prop_path', None)
+                if prop_path is None or custom_prop_data.get("imported", False):
+                    continue
+                if TinyPath(prop_path).suffix not in ('.vmdl_c', '.mdl', ".md3"):
+                    continue
+                placeholders[(TinyPath(prop_path).as_posix().lower(),
+                              str(custom_prop_data.get('skin', None)))].append(obj)
+        placeholder_count = sum(map(len, placeholders.values()))
+
         with pause_view_layer_update():
-            win.progress_begin(0, len(context.selected_objects))
-            for n, obj in enumerate(context.selected_objects):
-                print(f'Loading {obj.name}')
+            # First phase: resolve files on the main thread, parse them in worker threads
+            prepared = self.prepare_models(content_manager, context, placeholders)
+            win.progress_begin(0, len(prepared) + placeholder_count)
+            for n, _ in enumerate(as_completed(prepared.values())):
                 win.progress_update(n)
-                if obj.get("entity_data", None):
-                    custom_prop_data = obj['entity_data']
-                    prop_path = custom_prop_data.get('prop_path', None)
-                    if prop_path is None or custom_prop_data.get("imported", False):
-                        continue
-                    prop_path = TinyPath(prop_path)
-                    model_type = prop_path.suffix
-                    if model_type == '.vmdl_c':
-                        self.load_vmdl(content_manager, context, obj)
-                    elif model_type in ('.mdl', ".md3"):
-                        self.load_mdl(content_manager, context, obj)
+
+            # Second phase: create Blender data from parsed models
+            n = len(prepared)
+            for (model_key, _), objects in placeholders.items():
+                for obj in objects:
+                    print(f'Loading {obj.name}')
+                    win.progress_update(n)
+                    n += 1
+                    prop_path = TinyPath(obj['entity_data']['prop_path'])
+                    if prop_path.suffix == '.vmdl_c':
+                        self.load_vmdl(content_manager, context, obj, prepared.get(model_key, None))
+                    else:
+                        self.load_mdl(content_manager, context, obj, prepared.get(model_key, None))
         win.progress_end()
+        content_manager.log_stats()
 
         return {'FINISHED'}
 
-    def load_mdl(self, content_manager: ContentManager, context: bpy.context, obj: bpy.types.Object):
+    @staticmethod
+    def get_model_options(context: bpy.context) -> ModelOptions:
+        options = ModelOptions()
+        options.import_textures = context.scene.import_materials
+        options.import_physics = False
+        options.create_flex_drivers = False
+        options.scale = 1.0
+        options.use_bvlg = context.scene.use_bvlg
+        options.bodygroup_grouping = False
+        options.import_animations = False
+        options.import_physics = context.scene.import_physics
+        return options
+
+    def prepare_models(self, content_manager: ContentManager, context: bpy.context,
+                       placeholders: Mapping[tuple[str, str], list[bpy.types.Object]],
+                       max_workers: Optional[int] = None) -> dict[str, Future]:
+        """Start parsing every model given placeholders need into bpy free data in worker threads.
+
+        Returns futures keyed by lowercase model path, resolving to ParsedModel for MDL files
+        and to CompiledModelResource with decoded mesh blocks for VMDL_c files.
+        """
+        use_collections = context.scene.use_instances
+        options = self.get_model_options(context)
+        jobs = {}
+        for (model_key, _), objects in placeholders.items():
+            if model_key in jobs:
+                continue
+            custom_prop_data = objects[0]['entity_data']
+            prop_path = TinyPath(custom_prop_data['prop_path'])
+            if prop_path.suffix == '.vmdl_c':
+                if (use_collections and custom_prop_data['type'] != "aggregate_static_prop"
+                        and get_collection(prop_path)):
+                    continue
+                vmld_file = content_manager.find_file(prop_path)
+                if vmld_file:
+                    jobs[model_key] = (preload_model, CompiledModelResource.from_buffer(vmld_file, prop_path),
+                                       ImportContext(lod_mask=1))
+            else:
+                if use_collections and all(get_collection(prop_path, obj['entity_data']['entity'].get("defaultanim"))
+                                           for obj in objects):
+                    continue
+                mdl_file = content_manager.find_file(prop_path)
+                if not mdl_file:
+                    continue
+                steamapp_id = content_manager.get_steamid_from_asset(prop_path)
+                parser = find_model_parser(prop_path, mdl_file, content_manager, options, steamapp_id)
+                if parser is not None:
+                    jobs[model_key] = (parser[0], prop_path, parser[1])
+
+        futures = {}
+        if jobs:
+            executor = ThreadPoolExecutor(max_workers=min(len(jobs), max_workers or os.cpu_count() or 1))
+            for model_key, (func, *args) in jobs.items():
+                futures[model_key] = executor.submit(func, *args)
+            executor.shutdown(wait=False)
+        return futures
+
+    def load_mdl(self, content_manager: ContentManager, context: bpy.context, obj: bpy.types.Object,
+                 prepared: Optional[Future] = None):
         use_collections = context.scene.use_instances
-        import_materials = context.scene.import_materials
         replace_entity = context.scene.replace_entity and not use_collections
         master_instance_collection = get_or_create_collection("MASTER_INSTANCES_DO_NOT_EDIT",
                                                               bpy.context.scene.collection)
@@ -124,18 +203,11 @@ class SourceIO_OT_LoadEntity(Operator):
                         f"Failed to find MDL file for prop {prop_path}")
             return
         steamapp_id = content_manager.get_steamid_from_asset(prop_path)
-        options = ModelOptions()
-        options.import_textures = import_materials
-        options.import_physics = False
-        options.create_flex_drivers = False
-        options.scale = 1.0
-        options.use_bvlg = context.scene.use_bvlg
-        options.bodygroup_grouping = False
-        options.import_animations = False
-        options.import_physics = context.scene.import_physics
+        options = self.get_model_options(context)
         try:
             model_container = import_model(prop_path, mdl_file,
-                                           content_manager, options, steamapp_id)
+                                           content_manager, options, steamapp_id,
+                                           prepared.result() if prepared is not None else None)
         except RequiredFileNotFound as e:
             self.report({"ERROR"}, e.message)
             return
@@ -231,7 +303,8 @@ class SourceIO_OT_LoadEntity(Operator):
         #
         # bpy.data.objects.remove(obj)
 
-    def load_vmdl(self, content_manager: ContentManager, context: bpy.context, obj: bpy.types.Object):
+    def load_vmdl(self, content_manager: ContentManager, context: bpy.context, obj: bpy.types.Object,
+                  prepared: Optional[Future] = None):
         use_collections = context.scene.use_instances
         import_materials = context.scene.import_materials
         replace_entity = context.scene.replace_entity and not use_collections
@@ -254,8 +327,9 @@ class SourceIO_OT_LoadEntity(Operator):
         )
 
         if prop_type == "aggregate_static_prop":
-            vmld_file = content_manager.find_file(prop_path)
-            if vmld_file:
+            if prepared is not None:
+                model_resource = prepared.result()
+            elif vmld_file := content_manager.find_file(prop_path):
                 model_resource = CompiledModelResource.from_buffer(vmld_file, prop_path)
             else:
                 self.report({"WARNING"}, f"Failed to find VMDL_c file for prop {prop_path}")
@@ -314,30 +388,32 @@ class SourceIO_OT_LoadEntity(Operator):
                 obj["entity_data"]["imported"] = True
                 return
 
-        vmld_file = content_manager.find_file(prop_path)
-        if vmld_file:
-            # skin = custom_prop_data.get('skin', None)
+        if prepared is not None:
+            model_resource = prepared.result()
+        elif vmld_file := content_manager.find_file(prop_path):
             model_resource = CompiledModelResource.from_buffer(vmld_file, prop_path)
-            container = load_model(content_manager, model_resource, import_context)
-            if replace_entity:
-                imported_collection = get_or_create_collection(f"IMPORTED_{parent.name}", parent)
-                s2_put_into_collections(container, model_resource.name, imported_collection)
-            else:
-                prop_collection = get_or_create_collection(prop_path.stem, master_instance_collection)
-                s2_put_into_collections(container, model_resource.name, prop_collection)
-            obj["entity_data"]["prop_path"] = None
-            obj["entity_data"]["imported"] = True
-
-            if use_collections:
-                add_collection(prop_path, container.master_collection)
-
-                obj.instance_type = 'COLLECTION'
-                obj.instance_collection = container.master_collection
-                return
-            if replace_entity:
-                self.replace_placeholder(container, obj)
         else:
             self.report({'INFO'}, f"Model '{prop_path}' not found!")
+            return
+        # skin = custom_prop_data.get('skin', None)
+        container = load_model(content_manager, model_resource, import_context)
+        if replace_entity:
+            imported_collection = get_or_create_collection(f"IMPORTED_{parent.name}", parent)
+            s2_put_into_collections(container, model_resource.name, imported_collection)
+        else:
+            prop_collection = get_or_create_collection(prop_path.stem, master_instance_collection)
+            s2_put_into_collections(container, model_resource.name, prop_collection)
+        obj["entity_data"]["prop_path"] = None
+        obj["entity_data"]["imported"] = True
+
+        if use_collections:
+            add_collection(prop_path, container.master_collection)
+
+            obj.instance_type = 'COLLECTION'
+            obj.instance_collection = container.master_collection
+            return
+        if replace_entity:
+            self.replace_placeholder(container, obj)
 
     @staticmethod
     def add_matrix(container: ModelContainer, matrix: Matrix):
@@ -640,6 +716,7 @@ class SOURCEIO_OT_NewResource(Operator):
         new_resource = context.scene.mounted_resources.add()
         new_resource.path = self.filepath
         new_resource.name = TinyPath(self.filepath).name
+        sync_content_manager_settings(cm)
         cm.scan_for_content(TinyPath(self.filepath))
         deserialize_mounted_content(cm)
         serialize_mounted_content(cm)
@@ -761,6 +838,10 @@ class SOURCEIO_PT_Scene(Panel):
         layout = self.layout
         layout.label(text="SourceIO configuration")
         layout.prop(context.scene, "TextureCachePath")
+        layout.prop(context.scene, "DecodedTextureCachePath")
+        layout.prop(context.scene, "DecodedTextureCacheSize")
+        layout.prop(context.scene, "UseMountManifest")
+        layout.prop(context.scene, "UsePathIndex")
 
         box = layout.box()
         box.label(text='Mounted Resources')
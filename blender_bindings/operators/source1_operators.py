@@ -12,10 +12,11 @@ from SourceIO.blender_bindings.shared.exceptions import RequiredFileNotFound
 from SourceIO.blender_bindings.source1.bsp.import_bsp import import_bsp
 from SourceIO.blender_bindings.source1.vtf import import_texture, load_skybox_texture
 from SourceIO.blender_bindings.utils.bpy_utils import get_or_create_material, is_blender_4_1
-from SourceIO.blender_bindings.utils.resource_utils import serialize_mounted_content, deserialize_mounted_content
+from SourceIO.blender_bindings.utils.resource_utils import serialize_mounted_content, deserialize_mounted_content, \
+    sync_content_manager_settings
 from SourceIO.library.shared.app_id import SteamAppId
 from SourceIO.library.shared.content_manager import ContentManager
-from SourceIO.library.utils import FileBuffer
+from SourceIO.library.utils import FileBuffer, MMapBuffer
 from SourceIO.library.utils.path_utilities import path_stem
 from SourceIO.library.utils.tiny_path import TinyPath
 from SourceIO.logger import SourceLogMan
@@ -40,6 +41,7 @@ class SOURCEIO_OT_MDLImport(ImportOperatorHelper, ModelOptions):
 
         content_manager = ContentManager()
         if self.discover_resources:
+            sync_content_manager_settings(content_manager)
             content_manager.scan_for_content(directory)
             serialize_mounted_content(content_manager)
         else:
@@ -61,6 +63,7 @@ class SOURCEIO_OT_MDLImport(ImportOperatorHelper, ModelOptions):
             #     from ...library.source1.qc.qc import generate_qc
             #     qc_file = bpy.data.texts.new('{}.qc'.format(TinyPath(file.name).stem))
             #     generate_qc(model_container.mdl, qc_file, ".".join(map(str, bl_info['version'])))
+        content_manager.log_stats()
         return {'FINISHED'}
 
 
@@ -88,16 +91,18 @@ class SOURCEIO_OT_BSPImport(ImportOperatorHelper, Source1BSPSettings):
         content_manager = ContentManager()
         filepath = TinyPath(self.filepath)
         if self.discover_resources:
+            sync_content_manager_settings(content_manager)
             content_manager.scan_for_content(filepath)
         else:
             deserialize_mounted_content(content_manager)
-        with FileBuffer(filepath) as f:
+        with MMapBuffer(filepath) as f:
             import_bsp(filepath, f, content_manager, self,
                        SteamAppId(int(self.steam_app_id)) if self.steam_app_id != "-999" else None)
 
         if self.discover_resources:
             serialize_mounted_content(content_manager)
 
+        content_manager.log_stats()
         return {'FINISHED'}
 
 
@@ -185,6 +190,7 @@ class SOURCEIO_OT_SkyboxImport(ImportOperatorHelper):
         directory = self.get_directory()
         content_manager = ContentManager()
         if self.discover_resources:
+            sync_content_manager_settings(content_manager)
             content_manager.scan_for_content(directory)
             serialize_mounted_content(content_manager)
         else:
@@ -192,6 +198,7 @@ class SOURCEIO_OT_SkyboxImport(ImportOperatorHelper):
         for file in self.files:
             skybox_name = path_stem(file.name)
             load_skybox_texture(skybox_name[:-2], content_manager, int(self.resolution))
+        content_manager.log_stats()
         return {'FINISHED'}
 
     def invoke(self, context, event):
@@ -216,6 +223,7 @@ class SOURCEIO_OT_VMTImport(ImportOperatorHelper):
         directory = self.get_directory()
         content_manager = ContentManager()
         if self.discover_resources:
+            sync_content_manager_settings(content_manager)
             content_manager.scan_for_content(directory)
             serialize_mounted_content(content_manager)
         else:
@@ -1,5 +1,5 @@
 import bpy
-from bpy.props import (BoolProperty, FloatProperty,
+from bpy.props import (BoolProperty, EnumProperty, FloatProperty,
                        IntProperty, StringProperty)
 
 from SourceIO.library.shared.content_manager import ContentManager
@@ -10,6 +10,7 @@ from SourceIO.library.source2.resource_types.compiled_world_resource import Comp
 from SourceIO.library.utils import FileBuffer
 from SourceIO.library.utils.math_utilities import SOURCE2_HAMMER_UNIT_TO_METERS
 from SourceIO.library.utils.tiny_path import TinyPath
+from .import_settings_base import STATIC_PROP_MODES
 from .operator_helper import ImportOperatorHelper
 from SourceIO.blender_bindings.source2.dmx.camera_loader import load_camera
 from SourceIO.blender_bindings.source2.vmat_loader import load_material
@@ -19,7 +20,8 @@ from SourceIO.blender_bindings.source2.vphy_loader import load_physics
 from SourceIO.blender_bindings.source2.vtex_loader import import_texture
 from SourceIO.blender_bindings.source2.vwrld.loader import load_map
 from SourceIO.blender_bindings.utils.bpy_utils import get_new_unique_collection, is_blender_4_1
-from SourceIO.blender_bindings.utils.resource_utils import serialize_mounted_content, deserialize_mounted_content
+from SourceIO.blender_bindings.utils.resource_utils import serialize_mounted_content, deserialize_mounted_content, \
+    sync_content_manager_settings
 from SourceIO.library.source2.blocks.phys_block import PhysBlock
 
 
@@ -44,6 +46,7 @@ class SOURCEIO_OT_VMDLImport(ImportOperatorHelper):
         directory = self.get_directory()
         content_manager = ContentManager()
         if self.discover_resources:
+            sync_content_manager_settings(content_manager)
             content_manager.scan_for_content(directory)
             serialize_mounted_content(content_manager)
         else:
@@ -60,6 +63,7 @@ class SOURCEIO_OT_VMDLImport(ImportOperatorHelper):
             master_collection = get_new_unique_collection(model_resource.name, bpy.context.scene.collection)
             put_into_collections(container, TinyPath(model_resource.name).stem, master_collection, False)
 
+        content_manager.log_stats()
         return {'FINISHED'}
 
 
@@ -75,6 +79,7 @@ class SOURCEIO_OT_VMAPImport(ImportOperatorHelper):
     # invert_uv: BoolProperty(name="invert UV?", default=True)
     import_physics: BoolProperty(name="Import physics", default=False)
     scale: FloatProperty(name="World scale", default=SOURCE2_HAMMER_UNIT_TO_METERS, precision=6)
+    static_prop_mode: EnumProperty(name="Static props", items=STATIC_PROP_MODES, default='PLACEHOLDERS')
 
     def execute(self, context):
         directory = self.get_directory()
@@ -82,6 +87,7 @@ class SOURCEIO_OT_VMAPImport(ImportOperatorHelper):
             print(f"Loading {n}/{len(self.files)}")
             content_manager = ContentManager()
             if self.discover_resources:
+                sync_content_manager_settings(content_manager)
                 content_manager.scan_for_content(directory.parent)
                 serialize_mounted_content(content_manager)
             else:
@@ -92,7 +98,7 @@ class SOURCEIO_OT_VMAPImport(ImportOperatorHelper):
                 content_manager.add_child(VPKContentProvider(map_vpk_file))
             with FileBuffer(directory / file.name) as buffer:
                 model = CompiledMapResource.from_buffer(buffer, TinyPath(file.name))
-                load_map(model, content_manager, self.scale)
+                load_map(model, content_manager, self.scale, self.static_prop_mode)
 
             if self.import_physics:
                 map_collection = bpy.data.collections[file_stem]
@@ -119,6 +125,7 @@ class SOURCEIO_OT_VMAPImport(ImportOperatorHelper):
                         phys_collection.objects.link(obj)
 
             serialize_mounted_content(content_manager)
+            content_manager.log_stats()
         return {'FINISHED'}
 
 
@@ -134,12 +141,14 @@ class SOURCEIO_OT_VPK_VMAPImport(ImportOperatorHelper):
     # invert_uv: BoolProperty(name="invert UV?", default=True)
     import_physics: BoolProperty(name="Import physics", default=False)
     scale: FloatProperty(name="World scale", default=SOURCE2_HAMMER_UNIT_TO_METERS, precision=6)
+    static_prop_mode: EnumProperty(name="Static props", items=STATIC_PROP_MODES, default='PLACEHOLDERS')
 
     def execute(self, context):
         vpk_path = TinyPath(self.filepath)
         assert vpk_path.is_file(), 'Not a file'
         content_manager = ContentManager()
         if self.discover_resources:
+            sync_content_manager_settings(content_manager)
             content_manager.scan_for_content(vpk_path.parent)
             serialize_mounted_content(content_manager)
         else:
@@ -150,7 +159,7 @@ class SOURCEIO_OT_VPK_VMAPImport(ImportOperatorHelper):
         assert map_buffer is not None, "Failed to find world file in selected VPK"
 
         model = CompiledMapResource.from_buffer(map_buffer, vpk_path)
-        load_map(model, content_manager, self.scale)
+        load_map(model, content_manager, self.scale, self.static_prop_mode)
         if self.import_physics:
             map_collection = bpy.data.collections[vpk_path.stem]
             phys_filename = TinyPath(f"maps/{vpk_path.stem}/world_physics.vphys_c")
@@ -177,6 +186,7 @@ class SOURCEIO_OT_VPK_VMAPImport(ImportOperatorHelper):
 
         serialize_mounted_content(content_manager)
 
+        content_manager.log_stats()
         return {'FINISHED'}
 
 
@@ -196,6 +206,7 @@ class SOURCEIO_OT_VMATImport(ImportOperatorHelper):
         directory = self.get_directory()
         content_manager = ContentManager()
         if self.discover_resources:
+            sync_content_manager_settings(content_manager)
             content_manager.scan_for_content(directory)
             serialize_mounted_content(content_manager)
         else:
@@ -205,6 +216,7 @@ class SOURCEIO_OT_VMATImport(ImportOperatorHelper):
             with FileBuffer(directory / file.name) as f:
                 material_resource = CompiledMaterialResource.from_buffer(f, directory / file.name)
                 load_material(content_manager, material_resource, TinyPath(file.name))
+        content_manager.log_stats()
         return {'FINISHED'}
 
 
@@ -257,6 +269,7 @@ class SOURCEIO_OT_VPHYSImport(ImportOperatorHelper):
         directory = self.get_directory()
         content_manager = ContentManager()
         if self.discover_resources:
+            sync_content_manager_settings(content_manager)
             content_manager.scan_for_content(directory)
             serialize_mounted_content(content_manager)
         else:
@@ -272,6 +285,7 @@ class SOURCEIO_OT_VPHYSImport(ImportOperatorHelper):
             for obj in objects:
                 master_collection.objects.link(obj)
 
+        content_manager.log_stats()
         return {'FINISHED'}
 
 
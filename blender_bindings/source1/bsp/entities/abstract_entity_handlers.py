@@ -1,54 +1,37 @@
+from __future__ import annotations
+
 import math
 import re
 from pprint import pformat
+from typing import TYPE_CHECKING
 
 import bpy
 import numpy as np
 from mathutils import Euler
 
-from SourceIO.blender_bindings.source1.bsp.entities.base_entity_classes import *
 from SourceIO.blender_bindings.source1.vtf import import_texture
 from SourceIO.blender_bindings.operators.import_settings_base import Source1BSPSettings
 from SourceIO.blender_bindings.utils.bpy_utils import add_material, get_or_create_collection, get_or_create_material
 from SourceIO.library.source1.bsp.bsp_file import BSPFile
-from SourceIO.library.source1.bsp.datatypes.face import Face
-from SourceIO.library.source1.bsp.datatypes.model import Model
-from SourceIO.library.source1.bsp.datatypes.texture_data import TextureData
-from SourceIO.library.source1.bsp.datatypes.texture_info import TextureInfo
+from SourceIO.library.source1.bsp.geometry import extract_brush_model, get_brush_model_material_names
 from SourceIO.library.source1.vmt import VMT
+from SourceIO.library.utils.entity_class_registry import load_entity_classes
 from SourceIO.library.utils.math_utilities import SOURCE1_HAMMER_UNIT_TO_METERS
 from SourceIO.library.utils.path_utilities import path_stem
 from SourceIO.library.utils.perf_sampler import timed
 from SourceIO.library.utils.tiny_path import TinyPath
 from SourceIO.logger import SourceLogMan
 
-strip_patch_coordinates = re.compile(r"_-?\d+_-?\d+_-?\d+.*$")
-log_manager = SourceLogMan()
-
-
-def gather_vertex_ids(model: Model, faces: list[Face], surf_edges: np.ndarray, edges: np.ndarray):
-    vertex_offset = 0
-    material_ids = []
-    vertex_count = 0
-    for map_face in faces[model.first_face:model.first_face + model.face_count]:
-        vertex_count += map_face.edge_count
-    vertex_ids = np.zeros(vertex_count, dtype=np.uint32)
-    for map_face in faces[model.first_face:model.first_face + model.face_count]:
-        if map_face.disp_info_id != -1:
-            continue
-        first_edge = map_face.first_edge
-        edge_count = map_face.edge_count
-        material_ids.append(map_face.tex_info_id)
+if TYPE_CHECKING:
+    from .base_entity_classes import *
 
-        used_surf_edges = surf_edges[first_edge:first_edge + edge_count]
-        reverse = np.subtract(1, (used_surf_edges > 0).astype(np.uint8))
-        used_edges = edges[np.abs(used_surf_edges)]
-        tmp = np.arange(len(used_edges))
-        face_vertex_ids = used_edges[tmp, reverse]
-        vertex_ids[vertex_offset:vertex_offset + edge_count] = face_vertex_ids
-        vertex_offset += edge_count
+base_entity_classes = load_entity_classes(f"{__package__}.base_entity_classes")
+Base = base_entity_classes.Base
+parse_float_vector = base_entity_classes.parse_float_vector
+parse_source_value = base_entity_classes.parse_source_value
 
-    return vertex_ids, material_ids
+strip_patch_coordinates = re.compile(r"_-?\d+_-?\d+_-?\d+.*$")
+log_manager = SourceLogMan()
 
 
 def _srgb2lin(s: float) -> float:
@@ -133,115 +116,49 @@ class AbstractEntityHandler:
 
     @timed
     def _load_brush_model(self, model_id, model_name):
-        def _get_string(string_id):
-            strings: list[str] = self._bsp.get_lump('LUMP_TEXDATA_STRING_TABLE').strings
-            return strings[string_id] or "NO_NAME"
-
-        model = self._bsp.get_lump("LUMP_MODELS").models[model_id]
         mesh_data = bpy.data.meshes.new(f"{model_name}_MESH")
         mesh_obj = bpy.data.objects.new(model_name, mesh_data)
-        faces = []
-        material_indices = []
-
-        bsp_surf_edges: np.ndarray = self._bsp.get_lump('LUMP_SURFEDGES').surf_edges
-        bsp_vertices: np.ndarray = self._bsp.get_lump('LUMP_VERTICES').vertices
-        bsp_edges: np.ndarray = self._bsp.get_lump('LUMP_EDGES').edges
-        bsp_faces: list[Face] = self._bsp.get_lump('LUMP_FACES').faces
-        bsp_textures_info: list[TextureInfo] = self._bsp.get_lump('LUMP_TEXINFO').texture_info
-        bsp_textures_data: list[TextureData] = self._bsp.get_lump('LUMP_TEXDATA').texture_data
-
-        vertex_ids, material_ids = gather_vertex_ids(model, bsp_faces, bsp_surf_edges, bsp_edges)
-        unique_vertex_ids = np.unique(vertex_ids)
-
-        tmp2 = np.searchsorted(unique_vertex_ids, vertex_ids)
-        remapped = dict(zip(vertex_ids, tmp2))
 
-        material_lookup_table = {}
+        material_slots = {}
         skippable_materials = set()
-        for texture_info_id in sorted(set(material_ids)):
-            texture_info = bsp_textures_info[texture_info_id]
-            texture_data = bsp_textures_data[texture_info.texture_data_id]
-            material_name = _get_string(texture_data.name_id)
+        for material_name in get_brush_model_material_names(self._bsp, model_id):
+            full_material_name = material_name
             if self.settings and self.settings.import_textures:
                 material_file = self.content_manager.find_file(TinyPath("materials") / (material_name + ".vmt"))
                 if material_file:
                     vmt = VMT(material_file, material_name, self.content_manager)
-                    material_name = strip_patch_coordinates.sub("", material_name)
+                    full_material_name = strip_patch_coordinates.sub("", material_name)
                     if vmt.get_int("$abovewater", 1) == 0:
-                        skippable_materials.add(texture_info_id)
+                        skippable_materials.add(material_name)
                 else:
-                    material_name = strip_patch_coordinates.sub("", material_name)
-                    material_file = self.content_manager.find_file(TinyPath("materials") / (material_name + ".vmt"))
+                    full_material_name = strip_patch_coordinates.sub("", material_name)
+                    material_file = self.content_manager.find_file(
+                        TinyPath("materials") / (full_material_name + ".vmt"))
                     if material_file:
-                        vmt = VMT(material_file, material_name, self.content_manager)
+                        vmt = VMT(material_file, full_material_name, self.content_manager)
                         if vmt.get_int("$abovewater", 1) == 0:
-                            skippable_materials.add(texture_info_id)
-            material = get_or_create_material(path_stem(material_name), material_name)
-            material_lookup_table[texture_data.name_id] = add_material(material, mesh_obj)
-
-        uvs_per_face = []
-        luvs_per_face = []
-
-        for map_face in bsp_faces[model.first_face:model.first_face + model.face_count]:
-            if map_face.disp_info_id != -1:
-                continue
-            if map_face.tex_info_id in skippable_materials:
-                continue
-
-            uvs = {}
-            luvs = {}
-            face = []
-            first_edge = map_face.first_edge
-            edge_count = map_face.edge_count
-
-            used_surf_edges = bsp_surf_edges[first_edge:first_edge + edge_count]
-            reverse = np.subtract(1, (used_surf_edges > 0).astype(np.uint8))
-            used_edges = bsp_edges[np.abs(used_surf_edges)]
-            tmp = np.arange(len(used_edges))
-            face_vertex_ids = used_edges[tmp, reverse]
-            face_vertex_ids = np.array(list(dict.fromkeys(face_vertex_ids)))
-
-            uv_vertices = bsp_vertices[face_vertex_ids]
-
-            texture_info = bsp_textures_info[map_face.tex_info_id]
-            texture_data = bsp_textures_data[texture_info.texture_data_id]
-            tv1, tv2 = texture_info.texture_vectors
-            lv1, lv2 = texture_info.lightmap_vectors
-
-            u = (np.dot(uv_vertices, tv1[:3]) + tv1[3]) / (texture_data.width or 512)
-            v = 1 - ((np.dot(uv_vertices, tv2[:3]) + tv2[3]) / (texture_data.height or 512))
-
-            lu = (np.dot(uv_vertices, lv1[:3]) + lv1[3]) / (texture_data.width or 512)
-            lv = 1 - ((np.dot(uv_vertices, lv2[:3]) + lv2[3]) / (texture_data.height or 512))
-
-            v_uvs = np.dstack([u, v]).reshape((-1, 2))
-            l_uvs = np.dstack([lu, lv]).reshape((-1, 2))
+                            skippable_materials.add(material_name)
+            material = get_or_create_material(path_stem(full_material_name), full_material_name)
+            material_slots[material_name] = add_material(material, mesh_obj)
 
-            for vertex_id, uv, luv in zip(face_vertex_ids, v_uvs, l_uvs):
-                new_vertex_id = remapped[vertex_id]
-                face.append(new_vertex_id)
-                uvs[new_vertex_id] = uv
-                luvs[new_vertex_id] = luv
+        geometry = extract_brush_model(self._bsp, model_id, skippable_materials)
 
-            material_indices.append(material_lookup_table[texture_data.name_id])
-            uvs_per_face.append(uvs)
-            luvs_per_face.append(luvs)
-            faces.append(face[::-1])
+        mesh_data.vertices.add(len(geometry.vertices))
+        mesh_data.vertices.foreach_set("co", (geometry.vertices * self.scale).ravel())
+        mesh_data.loops.add(geometry.loop_count)
+        mesh_data.loops.foreach_set("vertex_index", geometry.loop_vertex_indices)
+        mesh_data.polygons.add(geometry.face_count)
+        mesh_data.polygons.foreach_set("loop_start", geometry.face_loop_starts)
+        mesh_data.update()
 
-        mesh_data.from_pydata(bsp_vertices[unique_vertex_ids] * self.scale, [], faces)
-        mesh_data.polygons.foreach_set('material_index', material_indices)
+        slot_lookup = np.array([material_slots[name] for name in geometry.material_names], np.int32)
+        mesh_data.polygons.foreach_set('material_index', slot_lookup[geometry.material_indices])
 
         main_uv = mesh_data.uv_layers.new()
-        uv_data = main_uv.data
-        for poly in mesh_data.polygons:
-            for loop_index in range(poly.loop_start, poly.loop_start + poly.loop_total):
-                uv_data[loop_index].uv = uvs_per_face[poly.index][mesh_data.loops[loop_index].vertex_index]
+        main_uv.data.foreach_set('uv', geometry.uvs.ravel())
 
         lightmap_uv = mesh_data.uv_layers.new(name='lightmap')
-        uv_data = lightmap_uv.data
-        for poly in mesh_data.polygons:
-            for loop_index in range(poly.loop_start, poly.loop_start + poly.loop_total):
-                uv_data[loop_index].uv = luvs_per_face[poly.index][mesh_data.loops[loop_index].vertex_index]
+        lightmap_uv.data.foreach_set('uv', geometry.lightmap_uvs.ravel())
         if mesh_data.validate():
             self.logger.warn(f"Mesh(*{model_id}) had some invalid geometry")
         return mesh_obj
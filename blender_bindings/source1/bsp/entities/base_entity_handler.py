@@ -1,6 +1,9 @@
+from __future__ import annotations
+
 import math
 import re
 import traceback
+from typing import TYPE_CHECKING
 
 import bpy
 import numpy as np
@@ -11,13 +14,18 @@ from SourceIO.blender_bindings.material_loader.shaders.source1_shaders.sky impor
 from SourceIO.blender_bindings.source1.vtf import load_skybox_texture
 from SourceIO.blender_bindings.utils.bpy_utils import add_material, get_or_create_material
 from SourceIO.library.source1.vtf import SkyboxException
+from SourceIO.library.utils.entity_class_registry import load_entity_classes
 from SourceIO.library.utils.math_utilities import ensure_length, lerp_vec
 from SourceIO.library.utils.path_utilities import path_stem
 from SourceIO.library.utils.tiny_path import TinyPath
 from SourceIO.logger import SourceLogMan
 from .abstract_entity_handlers import AbstractEntityHandler, _srgb2lin
-from .base_entity_classes import *
-from .base_entity_classes import entity_class_handle as base_entity_classes
+
+if TYPE_CHECKING:
+    from .base_entity_classes import *
+
+base_entity_classes = load_entity_classes(f"{__package__}.base_entity_classes")
+parse_float_vector = base_entity_classes.parse_float_vector
 
 strip_patch_coordinates = re.compile(r"_-?\d+_-?\d+_-?\d+.*$")
 log_manager = SourceLogMan()
@@ -38,7 +46,7 @@ def srgb_to_linear(srgb: tuple[float]) -> tuple[list[float], float]:
 
 
 class BaseEntityHandler(AbstractEntityHandler):
-    entity_lookup_table = base_entity_classes
+    entity_lookup_table = base_entity_classes.entity_class_handle
     light_power_multiplier = 100000
 
     # pointlight_power_multiplier = 100
@@ -1,12 +1,22 @@
+from __future__ import annotations
+
 import math
+from typing import TYPE_CHECKING
 
 import bpy
 from mathutils import Euler
 
+from SourceIO.library.utils.entity_class_registry import load_entity_classes
 from .abstract_entity_handlers import AbstractEntityHandler, _srgb2lin
-from .bms_entity_classes import *
 from .halflife2_entity_handler import HalfLifeEntityHandler
 
+if TYPE_CHECKING:
+    from .bms_entity_classes import *
+
+bms_entity_classes = load_entity_classes(f"{__package__}.bms_entity_classes")
+entity_class_handle = bms_entity_classes.entity_class_handle
+parse_float_vector = bms_entity_classes.parse_float_vector
+
 local_entity_lookup_table = HalfLifeEntityHandler.entity_lookup_table.copy()
 local_entity_lookup_table.update(entity_class_handle)
 
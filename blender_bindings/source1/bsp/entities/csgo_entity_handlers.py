@@ -1,11 +1,20 @@
+from __future__ import annotations
+
 import math
+from typing import TYPE_CHECKING
 
 import bpy
 from mathutils import Euler
 
-from .csgo_entity_classes import *
+from SourceIO.library.utils.entity_class_registry import load_entity_classes
 from .halflife2_entity_handler import HalfLifeEntityHandler
 
+if TYPE_CHECKING:
+    from .csgo_entity_classes import *
+
+csgo_entity_classes = load_entity_classes(f"{__package__}.csgo_entity_classes")
+entity_class_handle = csgo_entity_classes.entity_class_handle
+
 local_entity_lookup_table = HalfLifeEntityHandler.entity_lookup_table.copy()
 local_entity_lookup_table.update(entity_class_handle)
 
@@ -1,11 +1,20 @@
+from __future__ import annotations
+
 import math
+from typing import TYPE_CHECKING
 
 import bpy
 from mathutils import Euler
 
-from .halflife2_entity_classes import entity_class_handle as hl2_entity_classes
+from SourceIO.library.utils.entity_class_registry import load_entity_classes
 from .halflife2_entity_handler import HalfLifeEntityHandler
-from .left4dead2_entity_classes import *
+
+if TYPE_CHECKING:
+    from .left4dead2_entity_classes import *
+
+left4dead2_entity_classes = load_entity_classes(f"{__package__}.left4dead2_entity_classes")
+Base = left4dead2_entity_classes.Base
+entity_class_handle = left4dead2_entity_classes.entity_class_handle
 
 local_entity_lookup_table = HalfLifeEntityHandler.entity_lookup_table.copy()
 local_entity_lookup_table.update(entity_class_handle)
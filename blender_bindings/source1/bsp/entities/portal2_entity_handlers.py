@@ -1,13 +1,23 @@
+from __future__ import annotations
+
 import math
+from typing import TYPE_CHECKING
 
 import bpy
 from mathutils import Euler
 
+from SourceIO.library.utils.entity_class_registry import load_entity_classes
 from .abstract_entity_handlers import _srgb2lin
 from .base_entity_handler import srgb_to_linear
-from .portal2_entity_classes import *
 from .portal_entity_handlers import PortalEntityHandler
 
+if TYPE_CHECKING:
+    from .portal2_entity_classes import *
+
+portal2_entity_classes = load_entity_classes(f"{__package__}.portal2_entity_classes")
+entity_class_handle = portal2_entity_classes.entity_class_handle
+parse_float_vector = portal2_entity_classes.parse_float_vector
+
 local_entity_lookup_table = PortalEntityHandler.entity_lookup_table.copy()
 local_entity_lookup_table.update(entity_class_handle)
 
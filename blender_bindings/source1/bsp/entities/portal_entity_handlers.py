@@ -1,10 +1,20 @@
+from __future__ import annotations
+
 import math
+from typing import TYPE_CHECKING
 
 import bpy
 from mathutils import Euler
 
+from SourceIO.library.utils.entity_class_registry import load_entity_classes
 from .halflife2_entity_handler import HalfLifeEntityHandler
-from .portal_entity_classes import *
+
+if TYPE_CHECKING:
+    from .portal_entity_classes import *
+
+portal_entity_classes = load_entity_classes(f"{__package__}.portal_entity_classes")
+entity_class_handle = portal_entity_classes.entity_class_handle
+parse_float_vector = portal_entity_classes.parse_float_vector
 
 local_entity_lookup_table = HalfLifeEntityHandler.entity_lookup_table.copy()
 local_entity_lookup_table.update(entity_class_handle)
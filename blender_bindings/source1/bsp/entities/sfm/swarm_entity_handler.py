@@ -1,9 +1,11 @@
 from ......library.source1.bsp.bsp_file import BSPFile
+from ......library.utils.entity_class_registry import load_entity_classes
 from ......library.utils.math_utilities import SOURCE1_HAMMER_UNIT_TO_METERS
 from ..base_entity_handler import BaseEntityHandler
-from .swarm_entity_classes import entity_class_handle as swarm_entity_handlers
+
+swarm_entity_classes = load_entity_classes(f"{__package__}.swarm_entity_classes")
 
 
 class SwarmEntityHandler(BaseEntityHandler):
-    entity_lookup_table = swarm_entity_handlers
+    entity_lookup_table = swarm_entity_classes.entity_class_handle
 
@@ -1,5 +1,7 @@
+from __future__ import annotations
+
 import re
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import bmesh
 import bpy
@@ -8,7 +10,6 @@ from mathutils import Vector, geometry
 
 from SourceIO.blender_bindings.utils.fast_mesh import FastMesh
 from .abstract_entity_handlers import _srgb2lin
-from .base_entity_classes import *
 from .base_entity_handler import BaseEntityHandler
 from SourceIO.blender_bindings.utils.bpy_utils import add_material, get_or_create_material
 from SourceIO.library.source1.bsp.bsp_file import BSPFile
@@ -17,10 +18,18 @@ from SourceIO.library.source1.bsp.lumps import RavenModelLump, RavenFaceLump, Ve
     RavenBrushSidesLump
 from SourceIO.library.source1.bsp.lumps.plane_lump import RavenPlaneLump
 from SourceIO.library.source1.bsp.lumps.surf_edge_lump import RavenIndicesLump
+from SourceIO.library.utils.entity_class_registry import load_entity_classes
 from SourceIO.library.utils.math_utilities import ensure_length, SOURCE1_HAMMER_UNIT_TO_METERS
 from SourceIO.library.utils.path_utilities import path_stem
 from SourceIO.logger import SourceLogMan
 
+if TYPE_CHECKING:
+    from .base_entity_classes import *
+
+base_entity_classes = load_entity_classes(f"{__package__}.base_entity_classes")
+Base = base_entity_classes.Base
+parse_float_vector = base_entity_classes.parse_float_vector
+
 strip_patch_coordinates = re.compile(r"_-?\d+_-?\d+_-?\d+.*$")
 log_manager = SourceLogMan()
 
@@ -1,25 +1,31 @@
+from __future__ import annotations
+
 import math
+from typing import TYPE_CHECKING
 
 import bpy
 from mathutils import Euler
 
 from .....library.source1.bsp.bsp_file import BSPFile
+from .....library.utils.entity_class_registry import load_entity_classes
 from .....library.utils.math_utilities import SOURCE1_HAMMER_UNIT_TO_METERS
 from .base_entity_handler import BaseEntityHandler
-from .tf_entity_classes import dispenser_touch_trigger
-from .tf_entity_classes import entity_class_handle as tf2_entity_handlers
-from .tf_entity_classes import (func_nobuild, func_regenerate,
-                                func_respawnroom, func_respawnroomvisualizer,
-                                info_observer_point, info_player_teamspawn,
-                                item_ammopack_full, item_ammopack_medium,
-                                item_ammopack_small, item_healthkit_full,
-                                item_healthkit_medium, item_healthkit_small,
-                                parse_float_vector, team_control_point,
-                                trigger_capture_area)
+
+if TYPE_CHECKING:
+    from .tf_entity_classes import (dispenser_touch_trigger, func_nobuild, func_regenerate,
+                                    func_respawnroom, func_respawnroomvisualizer,
+                                    info_observer_point, info_player_teamspawn,
+                                    item_ammopack_full, item_ammopack_medium,
+                                    item_ammopack_small, item_healthkit_full,
+                                    item_healthkit_medium, item_healthkit_small,
+                                    team_control_point, trigger_capture_area)
+
+tf_entity_classes = load_entity_classes(f"{__package__}.tf_entity_classes")
+parse_float_vector = tf_entity_classes.parse_float_vector
 
 
 class TF2EntityHandler(BaseEntityHandler):
-    entity_lookup_table = tf2_entity_handlers
+    entity_lookup_table = tf_entity_classes.entity_class_handle
 
     def handle_func_nobuild(self, entity: func_nobuild, entity_raw: dict):
         if 'model' not in entity_raw:
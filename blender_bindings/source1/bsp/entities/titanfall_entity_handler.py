@@ -1,6 +1,9 @@
+from __future__ import annotations
+
 from collections import defaultdict
 from itertools import chain
 from pprint import pformat
+from typing import TYPE_CHECKING
 
 import bpy
 
@@ -12,16 +15,21 @@ from .....library.source1.bsp.lumps.mesh_lump import *
 from .....library.source1.bsp.lumps.vertex_normal_lump import *
 from ....utils.bpy_utils import add_material
 from ..entities.base_entity_handler import BaseEntityHandler
-from ..entities.r1_entity_classes import (Base, entity_class_handle,
-                                          func_window_hint,
-                                          trigger_capture_point,
-                                          trigger_indoor_area,
-                                          trigger_out_of_bounds,
-                                          trigger_soundscape, worldspawn)
+from .....library.utils.entity_class_registry import load_entity_classes
+
+if TYPE_CHECKING:
+    from ..entities.r1_entity_classes import (func_window_hint,
+                                              trigger_capture_point,
+                                              trigger_indoor_area,
+                                              trigger_out_of_bounds,
+                                              trigger_soundscape, worldspawn)
+
+r1_entity_classes = load_entity_classes(f"{__package__}.r1_entity_classes")
+Base = r1_entity_classes.Base
 
 
 class TitanfallEntityHandler(BaseEntityHandler):
-    entity_lookup_table = entity_class_handle
+    entity_lookup_table = r1_entity_classes.entity_class_handle
 
     def _load_brush_model(self, model_id, model_name):
         objs = []
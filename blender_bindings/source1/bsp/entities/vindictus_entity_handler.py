@@ -1,12 +1,22 @@
+from __future__ import annotations
+
 import math
+from typing import TYPE_CHECKING
 
 import bpy
 from mathutils import Euler, Vector
 
+from SourceIO.library.utils.entity_class_registry import load_entity_classes
 from .base_entity_handler import BaseEntityHandler
-from .halflife2_entity_classes import *
 from .halflife2_entity_handler import HalfLifeEntityHandler
 
+if TYPE_CHECKING:
+    from .halflife2_entity_classes import *
+
+halflife2_entity_classes = load_entity_classes(f"{__package__}.halflife2_entity_classes")
+entity_class_handle = halflife2_entity_classes.entity_class_handle
+parse_float_vector = halflife2_entity_classes.parse_float_vector
+
 local_entity_lookup_table = HalfLifeEntityHandler.entity_lookup_table.copy()
 local_entity_lookup_table.update(entity_class_handle)
 
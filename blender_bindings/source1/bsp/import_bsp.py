@@ -1,6 +1,6 @@
 import json
 import re
-from typing import Any, Optional, Type
+from typing import Any, Iterable, Optional, Type
 
 import bpy
 import numpy as np
@@ -8,8 +8,15 @@ import numpy as np
 from SourceIO.blender_bindings.source1.bsp.entities.abstract_entity_handlers import AbstractEntityHandler
 from SourceIO.blender_bindings.source1.bsp.entities.sof_entity_handler import SOFEntityHandler
 from SourceIO.blender_bindings.material_loader.shaders.idtech3.idtech3 import IdTech3Shader
-from SourceIO.blender_bindings.operators.import_settings_base import Source1BSPSettings
+from SourceIO.blender_bindings.models import import_model
+from SourceIO.blender_bindings.models.common import put_into_collections as s1_put_into_collections
+from SourceIO.blender_bindings.operators.import_settings_base import ModelOptions, Source1BSPSettings
+from SourceIO.blender_bindings.shared.exceptions import RequiredFileNotFound
 from SourceIO.blender_bindings.utils.fast_mesh import FastMesh
+from SourceIO.blender_bindings.utils.prop_instancing import (compose_matrices, create_collection_instances,
+                                                             create_instance_point_cloud, create_skin_variant,
+                                                             get_master_instance_collection)
+from SourceIO.blender_bindings.utils.texture_prefetch import TexturePrefetcher
 from SourceIO.library.shared.app_id import SteamAppId
 from SourceIO.library.shared.content_manager import ContentManager
 from SourceIO.library.source1.bsp.bsp_file import open_bsp, BSPFile
@@ -17,6 +24,7 @@ from SourceIO.library.source1.bsp.datatypes.static_prop_lump import StaticPropLu
 from SourceIO.library.source1.bsp.datatypes.face import Face
 from SourceIO.library.source1.bsp.datatypes.texture_data import TextureData
 from SourceIO.library.source1.bsp.datatypes.texture_info import TextureInfo
+from SourceIO.library.source1.bsp.geometry import tessellate_displacements
 from SourceIO.library.source1.bsp.lumps import *
 from SourceIO.library.utils import Buffer, TinyPath, path_stem, SOURCE1_HAMMER_UNIT_TO_METERS
 from SourceIO.library.utils.idtech3_shader_parser import parse_shader_materials
@@ -47,6 +55,24 @@ def get_entity_name(entity_data: dict[str, Any]):
     return f'{entity_data.get("targetname", entity_data.get("hammerid", "missing_hammer_id"))}'
 
 
+# Lumps read while importing world geometry, displacements and entities
+_GEOMETRY_LUMPS = ('LUMP_ENTITIES', 'LUMP_MODELS', 'LUMP_FACES', 'LUMP_VERTICES', 'LUMP_EDGES', 'LUMP_SURFEDGES',
+                   'LUMP_TEXINFO', 'LUMP_TEXDATA', 'LUMP_TEXDATA_STRING_TABLE', 'LUMP_DISPINFO', 'LUMP_DISP_VERTS',
+                   'LUMP_DISP_MULTIBLEND')
+
+
+def get_imported_lump_names(settings: Source1BSPSettings) -> list[str]:
+    """Names of lumps import_bsp reads with given settings."""
+    lump_names = ['LUMP_PAK', *_GEOMETRY_LUMPS]
+    if settings.import_cubemaps:
+        lump_names.append('LUMP_CUBEMAPS')
+    if settings.load_static_props:
+        lump_names.append('LUMP_GAME_LUMP')
+    if settings.import_textures:
+        lump_names.append('LUMP_SHADERS')
+    return lump_names
+
+
 def import_bsp(map_path: TinyPath, buffer: Buffer, content_manager: ContentManager, settings: Source1BSPSettings,
                override_steamappid: Optional[SteamAppId] = None):
     logger = log_manager.get_logger(map_path.name)
@@ -54,18 +80,23 @@ def import_bsp(map_path: TinyPath, buffer: Buffer, content_manager: ContentManag
     bsp = open_bsp(map_path, buffer, content_manager, override_steamappid)
     if bsp is None:
         raise Exception("Could not open map file. This function can only load Source1 BSP files.")
+    try:
+        bsp.prefetch_lumps(get_imported_lump_names(settings))
 
-    pak_lump: Optional[PakLump] = bsp.get_lump('LUMP_PAK')
-    if pak_lump:
-        content_manager.add_child(pak_lump)
+        pak_lump: Optional[PakLump] = bsp.get_lump('LUMP_PAK')
+        if pak_lump:
+            content_manager.add_child(pak_lump)
 
-    master_collection = bpy.data.collections.new(map_path.name)
-    bpy.context.scene.collection.children.link(master_collection)
-    import_entities(bsp, content_manager, settings, master_collection, logger)
-    import_cubemaps(bsp, settings, master_collection, logger)
-    import_static_props(bsp, settings, master_collection, logger)
-    import_materials(bsp, content_manager, settings, logger)
-    import_disp(bsp, settings, master_collection, logger)
+        master_collection = bpy.data.collections.new(map_path.name)
+        bpy.context.scene.collection.children.link(master_collection)
+        import_entities(bsp, content_manager, settings, master_collection, logger)
+        import_cubemaps(bsp, settings, master_collection, logger)
+        import_static_props(bsp, content_manager, settings, master_collection, logger)
+        import_materials(bsp, content_manager, settings, logger)
+        import_disp(bsp, settings, master_collection, logger)
+    finally:
+        # Lumps are views into the map buffer, drop them so it can be unmapped when caller closes it
+        bsp.close()
 
 @timed
 def import_entities(bsp: BSPFile, content_manager: ContentManager, settings: Source1BSPSettings,
@@ -129,37 +160,126 @@ def import_cubemaps(bsp: BSPFile, settings: Source1BSPSettings, master_collectio
         parent_collection.objects.link(obj)
 
 @timed
-def import_static_props(bsp: BSPFile, settings: Source1BSPSettings, master_collection: bpy.types.Collection,
-                        logger: SLogger):
+def import_static_props(bsp: BSPFile, content_manager: ContentManager, settings: Source1BSPSettings,
+                        master_collection: bpy.types.Collection, logger: SLogger):
     gamelump: Optional[GameLump] = bsp.get_lump('LUMP_GAME_LUMP')
     if gamelump and settings.load_static_props:
         static_prop_lump: StaticPropLump = gamelump.game_lumps.get('sprp', None)
         if static_prop_lump:
             parent_collection = get_or_create_collection('static_props', master_collection)
-            for n, prop in enumerate(static_prop_lump.static_props):
-                model_name = static_prop_lump.model_names[prop.prop_type]
-                placeholder = bpy.data.objects.new(f'static_prop_{n}', None)
-                placeholder.location = np.multiply(prop.origin, settings.scale)
-                placeholder.rotation_euler = convert_rotation_source1_to_blender(prop.rotation)
-                placeholder.scale = prop.scaling
-
-                placeholder.scale *= settings.scale
-                placeholder.empty_display_size = 16
-
-                placeholder['entity_data'] = {'parent_path': str(bsp.filepath.parent),
-                                              'prop_path': model_name,
-                                              'scale': settings.scale,
-                                              'type': 'static_props',
-                                              'skin': str(prop.skin - 1 if prop.skin != 0 else 0),
-                                              'entity': {
-                                                  'type': 'static_prop',
-                                                  'origin': '{} {} {}'.format(*prop.origin),
-                                                  'angles': '{} {} {}'.format(*prop.rotation),
-                                                  'scale': '{} {} {}'.format(*prop.scaling),
-                                                  'skin': str(prop.skin - 1 if prop.skin != 0 else 0),
-                                              }
-                                              }
-                parent_collection.objects.link(placeholder)
+            if settings.static_prop_mode == 'PLACEHOLDERS':
+                create_static_prop_placeholders(bsp, settings, static_prop_lump,
+                                                range(static_prop_lump.prop_count), parent_collection)
+            else:
+                import_static_prop_instances(bsp, content_manager, settings, static_prop_lump, parent_collection,
+                                             logger)
+
+
+def get_static_prop_skins(skins: np.ndarray) -> np.ndarray:
+    """Map skin indices stored in static prop lump to skin names of imported models."""
+    return np.where(skins != 0, skins - 1, 0)
+
+
+def create_static_prop_placeholders(bsp: BSPFile, settings: Source1BSPSettings, static_prop_lump: StaticPropLump,
+                                    prop_ids: Iterable[int], parent_collection: bpy.types.Collection):
+    for n in prop_ids:
+        prop = static_prop_lump.static_props[n]
+        origin, rotation, scaling = prop['origin'].tolist(), prop['rotation'].tolist(), prop['scaling'].tolist()
+        skin = str(get_static_prop_skins(prop['skin']))
+        model_name = static_prop_lump.model_names[prop['prop_type']]
+        placeholder = bpy.data.objects.new(f'static_prop_{n}', None)
+        placeholder.location = np.multiply(origin, settings.scale)
+        placeholder.rotation_euler = convert_rotation_source1_to_blender(rotation)
+        placeholder.scale = scaling
+
+        placeholder.scale *= settings.scale
+        placeholder.empty_display_size = 16
+
+        placeholder['entity_data'] = {'parent_path': str(bsp.filepath.parent),
+                                      'prop_path': model_name,
+                                      'scale': settings.scale,
+                                      'type': 'static_props',
+                                      'skin': skin,
+                                      'entity': {
+                                          'type': 'static_prop',
+                                          'origin': '{} {} {}'.format(*origin),
+                                          'angles': '{} {} {}'.format(*rotation),
+                                          'scale': '{} {} {}'.format(*scaling),
+                                          'skin': skin,
+                                      }
+                                      }
+        parent_collection.objects.link(placeholder)
+
+
+def load_static_prop_model(content_manager: ContentManager, settings: Source1BSPSettings, model_name: str,
+                           logger: SLogger) -> Optional[bpy.types.Collection]:
+    model_path = TinyPath(model_name)
+    mdl_file = content_manager.find_file(model_path)
+    if mdl_file is None:
+        logger.warn(f"Failed to find {model_name!r} static prop model")
+        return None
+    options = ModelOptions()
+    options.import_textures = settings.import_textures
+    options.import_physics = False
+    options.create_flex_drivers = False
+    options.scale = 1.0
+    options.use_bvlg = settings.use_bvlg
+    options.bodygroup_grouping = False
+    options.import_animations = False
+    try:
+        container = import_model(model_path, mdl_file, content_manager, options, None)
+    except RequiredFileNotFound as e:
+        logger.error(e.message)
+        return None
+    if container is None:
+        logger.warn(f"Failed to load {model_name!r} static prop model")
+        return None
+    s1_put_into_collections(container, model_path.stem, get_master_instance_collection(), False)
+    return container.master_collection
+
+
+@timed
+def import_static_prop_instances(bsp: BSPFile, content_manager: ContentManager, settings: Source1BSPSettings,
+                                 static_prop_lump: StaticPropLump, parent_collection: bpy.types.Collection,
+                                 logger: SLogger):
+    """Load every unique static prop model once and place props as its instances.
+
+    Props are grouped by model and skin, props of other skins reuse mesh data of the first loaded skin.
+    """
+    if not static_prop_lump.prop_count:
+        return
+    origins = static_prop_lump.origins * settings.scale
+    angles = np.deg2rad(static_prop_lump.angles[:, [2, 0, 1]])
+    scales = static_prop_lump.scales * settings.scale
+
+    skins = get_static_prop_skins(static_prop_lump.skins)
+    groups, group_ids = np.unique(np.stack([static_prop_lump.model_ids, skins], 1), axis=0, return_inverse=True)
+    group_ids = group_ids.reshape(-1)
+    order = np.argsort(group_ids, kind='stable')
+    group_props = np.split(order, np.cumsum(np.bincount(group_ids, minlength=len(groups)))[:-1])
+    logger.info(f"Placing {static_prop_lump.prop_count} static props using {len(groups)} unique models")
+
+    model_collections: dict[int, Optional[bpy.types.Collection]] = {}
+    master_instance_collection = get_master_instance_collection()
+    for (prop_type, skin), prop_ids in zip(groups.tolist(), group_props):
+        model_name = static_prop_lump.model_names[prop_type]
+        if prop_type not in model_collections:
+            model_collections[prop_type] = load_static_prop_model(content_manager, settings, model_name, logger)
+        instance_collection = model_collections[prop_type]
+        if instance_collection is None:
+            create_static_prop_placeholders(bsp, settings, static_prop_lump, prop_ids.tolist(), parent_collection)
+            continue
+        if skin != 0:
+            instance_collection = create_skin_variant(instance_collection, str(skin), master_instance_collection)
+        name = f"{TinyPath(model_name).stem}_skin_{skin}"
+        if settings.static_prop_mode == 'POINT_CLOUD':
+            create_instance_point_cloud(name, instance_collection, origins[prop_ids], angles[prop_ids],
+                                        scales[prop_ids], parent_collection)
+        else:
+            create_collection_instances(name, instance_collection,
+                                        compose_matrices(origins[prop_ids], angles[prop_ids], scales[prop_ids]),
+                                        parent_collection)
+
 
 @timed
 def import_materials(bsp: BSPFile, content_manager: ContentManager, settings: Source1BSPSettings, logger: SLogger):
@@ -175,6 +295,7 @@ def import_materials(bsp: BSPFile, content_manager: ContentManager, settings: So
         pak_lump: Optional[PakLump] = bsp.get_lump('LUMP_PAK')
         if pak_lump:
             content_manager.add_child(pak_lump)
+        loaders: list[tuple[bpy.types.Material, Source1MaterialLoader]] = []
         for texture_data in texture_data_lump.texture_data:
             material_name = strings_lump.strings[texture_data.name_id] or "NO_NAME"
             tmp = strip_patch_coordinates.sub("", material_name)
@@ -191,13 +312,21 @@ def import_materials(bsp: BSPFile, content_manager: ContentManager, settings: So
             if material_file:
                 material_name = strip_patch_coordinates.sub("", material_name)
                 try:
-                    loader = Source1MaterialLoader(content_manager, material_file, material_name)
-                    loader.create_material(mat)
+                    loaders.append((mat, Source1MaterialLoader(content_manager, material_file, material_name)))
                 except Exception as e:
                     logger.exception("Failed to load material due to exception:", e)
             else:
                 logger.error(f'Failed to find {material_name} material')
 
+        # Decode textures of all materials up front in background threads, leaving only image creation to shaders
+        with TexturePrefetcher() as prefetcher:
+            prefetcher.prefetch_source1(content_manager, [loader.vmt for _, loader in loaders])
+            for mat, loader in loaders:
+                try:
+                    loader.create_material(mat)
+                except Exception as e:
+                    logger.exception("Failed to load material due to exception:", e)
+
     def import_idtech3_materials():
         material_definitions = {}
         for _, buffer in content_manager.glob("*.shader"):
@@ -240,156 +369,48 @@ def get_texture_data(tex_info: TextureInfo, bsp: BSPFile) -> Optional[TextureDat
         return tex_datas[tex_info.texture_data_id]
     return None
 
+def _add_alpha_channel(colors: np.ndarray):
+    return np.concatenate((colors, np.ones((colors.shape[0], 1), colors.dtype)), axis=1)
+
+
 @timed
 def import_disp(bsp: BSPFile, settings: Source1BSPSettings,
                 master_collection: bpy.types.Collection, logger: SLogger):
-    disp_info_lump: Optional[DispInfoLump] = bsp.get_lump('LUMP_DISPINFO')
-    if not disp_info_lump or not disp_info_lump.infos:
+    disp_meshes = tessellate_displacements(bsp)
+    if not disp_meshes:
         return
 
-    disp_multiblend: Optional[DispMultiblendLump] = bsp.get_lump('LUMP_DISP_MULTIBLEND')
-    strings_lump: Optional[StringsLump] = bsp.get_lump('LUMP_TEXDATA_STRING_TABLE')
-    vertex_lump: Optional[VertexLump] = bsp.get_lump('LUMP_VERTICES')
-    edge_lump: Optional[EdgeLump] = bsp.get_lump('LUMP_EDGES')
-    surf_edge_lump: Optional[SurfEdgeLump] = bsp.get_lump('LUMP_SURFEDGES')
-    disp_verts_lump: Optional[DispVertLump] = bsp.get_lump('LUMP_DISP_VERTS')
-    surf_edges = surf_edge_lump.surf_edges
-    vertices = vertex_lump.vertices
-    edges = edge_lump.edges
-
-    disp_verts = disp_verts_lump.transformed_vertices
-
     parent_collection = get_or_create_collection('displacements', master_collection)
-    info_count = len(disp_info_lump.infos)
-    multiblend_offset = 0
-    for n, disp_info in enumerate(disp_info_lump.infos):
-        logger.info(f'Processing {n + 1}/{info_count} displacement face')
-        final_vertex_colors = {}
-        src_face = disp_info.get_source_face(bsp)
-
-        texture_info = get_tex_info(src_face, bsp)
-        texture_data = get_texture_data(texture_info, bsp)
-        tv1, tv2 = texture_info.texture_vectors
-
-        first_edge = src_face.first_edge
-        edge_count = src_face.edge_count
-
-        used_surf_edges = surf_edges[first_edge:first_edge + edge_count]
-        reverse = np.subtract(1, (used_surf_edges > 0).astype(np.uint8))
-        used_edges = edges[np.abs(used_surf_edges)]
-        tmp = np.arange(used_edges.shape[0])
-        face_vertex_ids = used_edges[tmp, reverse]
-        face_vertices = vertices[face_vertex_ids] * settings.scale
-
-        start_pos = np.asarray(disp_info.start_position, np.float32)
-        min_index = np.where(
-            np.sum(
-                np.isclose(face_vertices,
-                           start_pos * settings.scale,
-                           0.5e-2),
-                axis=1
-            ) == 3)
-        if min_index[0].shape[0] == 0:
-            lowest = 999.e16
-            for i, value in enumerate(np.sum(face_vertices - start_pos, axis=1)):
-                if value < lowest:
-                    min_index = i
-                    lowest = value
-        else:
-            min_index = min_index[0][0]
-
-        left_edge = face_vertices[(1 + min_index) & 3] - face_vertices[min_index & 3]
-        right_edge = face_vertices[(2 + min_index) & 3] - face_vertices[(3 + min_index) & 3]
-
-        num_edge_vertices = (1 << disp_info.power) + 1
-        subdivide_scale = 1.0 / (num_edge_vertices - 1)
-        left_edge_step = left_edge * subdivide_scale
-        right_edge_step = right_edge * subdivide_scale
-
-        subdiv_vert_count = num_edge_vertices ** 2
-
-        disp_vertices = np.zeros((subdiv_vert_count, 3), dtype=np.float32)
-        disp_uv = np.zeros((subdiv_vert_count, 2), dtype=np.float32)
-        disp_indices = np.arange(0, subdiv_vert_count, dtype=np.uint32) + disp_info.disp_vert_start
-        for i in range(num_edge_vertices):
-            left_end = left_edge_step * i
-            left_end += face_vertices[min_index & 3]
-
-            right_end = right_edge_step * i
-            right_end += face_vertices[(3 + min_index) & 3]
-
-            left_right_seg = right_end - left_end
-            left_right_step = left_right_seg * subdivide_scale
-
-            for j in range(num_edge_vertices):
-                disp_vertices[(i * num_edge_vertices + j)] = left_end + (left_right_step * j)
-        disp_uv[:, 0] = (np.dot(disp_vertices, tv1[:3]) + tv1[3] * settings.scale) / (
-                texture_data.view_width * settings.scale)
-        disp_uv[:, 1] = 1 - ((np.dot(disp_vertices, tv2[:3]) + tv2[3] * settings.scale) / (
-                texture_data.view_height * settings.scale))
-
-        disp_vertices_alpha = disp_verts_lump.vertices['alpha'][disp_indices]
-        final_vertex_colors['vertex_alpha'] = np.concatenate(
-            (np.hstack([disp_vertices_alpha, disp_vertices_alpha, disp_vertices_alpha]),
-             np.ones((disp_vertices_alpha.shape[0], 1))), axis=1)
-
-        if disp_multiblend and disp_info.has_multiblend:
-            multiblend_layers = disp_multiblend.blends[multiblend_offset:multiblend_offset + subdiv_vert_count]
-            final_vertex_colors['multiblend'] = multiblend_layers['multiblend'].copy()
-            red = final_vertex_colors['multiblend'][:, 0].copy()
-            alpha = final_vertex_colors['multiblend'][:, 3].copy()
-
-            final_vertex_colors['multiblend'][:, 3] = red
-            final_vertex_colors['multiblend'][:, 0] = alpha
-
-            final_vertex_colors['alphablend'] = multiblend_layers['alphablend']
-            miltiblend_color_layer = multiblend_layers['multiblend_colors']
-            shape_ = multiblend_layers.shape[0]
-            final_vertex_colors['multiblend_color0'] = np.concatenate((miltiblend_color_layer[:, 0, :],
-                                                                       np.ones((shape_, 1))),
-                                                                      axis=1)
-            final_vertex_colors['multiblend_color1'] = np.concatenate((miltiblend_color_layer[:, 1, :],
-                                                                       np.ones((shape_, 1))),
-                                                                      axis=1)
-            final_vertex_colors['multiblend_color2'] = np.concatenate((miltiblend_color_layer[:, 2, :],
-                                                                       np.ones((shape_, 1))),
-                                                                      axis=1)
-            final_vertex_colors['multiblend_color3'] = np.concatenate((miltiblend_color_layer[:, 3, :],
-                                                                       np.ones((shape_, 1))),
-                                                                      axis=1)
-            multiblend_offset += subdiv_vert_count
-        face_indices = np.zeros(((num_edge_vertices - 1) * (num_edge_vertices - 1) * 2, 3),np.uint32)
-        face_index = 0
-        for i in range(num_edge_vertices - 1):
-            for j in range(num_edge_vertices - 1):
-                index = i * num_edge_vertices + j
-                if index & 1:
-                    face_indices[face_index] = (index, index + 1, index + num_edge_vertices)
-                    face_indices[face_index+1] = (index + 1, index + num_edge_vertices + 1, index + num_edge_vertices)
-                else:
-                    face_indices[face_index] = (index, index + num_edge_vertices + 1, index + num_edge_vertices)
-                    face_indices[face_index+1] = (index, index + 1, index + num_edge_vertices + 1)
-                face_index+=2
-        mesh_data = FastMesh.new(f"{bsp.filepath.stem}_disp_{disp_info.map_face}_MESH")
-        mesh_obj = bpy.data.objects.new(f"{bsp.filepath.stem}_disp_{disp_info.map_face}", mesh_data)
+    for n, disp_mesh in enumerate(disp_meshes):
+        logger.info(f'Processing {n + 1}/{len(disp_meshes)} displacement material '
+                    f'({len(disp_mesh.disp_ids)} displacements)')
+        material_name = strip_patch_coordinates.sub("", disp_mesh.material_name)
+        mesh_name = f"{bsp.filepath.stem}_disp_{path_stem(material_name)}"
+
+        final_vertex_colors = {'vertex_alpha': _add_alpha_channel(np.repeat(disp_mesh.alpha[:, None], 3, axis=1))}
+        if disp_mesh.multiblend is not None:
+            final_vertex_colors['multiblend'] = disp_mesh.multiblend
+            final_vertex_colors['alphablend'] = disp_mesh.alphablend
+            for i in range(4):
+                final_vertex_colors[f'multiblend_color{i}'] = _add_alpha_channel(disp_mesh.multiblend_colors[:, i, :])
+
+        mesh_data = FastMesh.new(f"{mesh_name}_MESH")
+        mesh_obj = bpy.data.objects.new(mesh_name, mesh_data)
         if parent_collection is not None:
             parent_collection.objects.link(mesh_obj)
         else:
             master_collection.objects.link(mesh_obj)
-        mesh_data.from_pydata(disp_vertices + disp_verts[disp_indices] * settings.scale, [], face_indices)
+        mesh_data.from_pydata(disp_mesh.vertices * settings.scale, [], disp_mesh.indices)
 
+        vertex_indices = disp_mesh.indices.ravel()
         uv_data = mesh_data.uv_layers.new().data
-        vertex_indices = np.zeros((len(mesh_data.loops, )), dtype=np.uint32)
-        mesh_data.loops.foreach_get('vertex_index', vertex_indices)
-        uv_data.foreach_set('uv', disp_uv[vertex_indices].flatten())
+        uv_data.foreach_set('uv', disp_mesh.uvs[vertex_indices].ravel())
 
         for name, vertex_color_layer in final_vertex_colors.items():
             vertex_colors = mesh_data.vertex_colors.get(name, False) or mesh_data.vertex_colors.new(name=name)
             vertex_colors_data = vertex_colors.data
-            vertex_colors_data.foreach_set('color', vertex_color_layer[vertex_indices].flatten())
+            vertex_colors_data.foreach_set('color', vertex_color_layer[vertex_indices].ravel())
 
-        material_name = strings_lump.strings[texture_data.name_id] or "NO_NAME"
-        material_name = strip_patch_coordinates.sub("", material_name)
         add_material(get_or_create_material(path_stem(material_name), material_name), mesh_obj)
         mesh_data.validate(clean_customdata=False)
     # def load_physics(self):
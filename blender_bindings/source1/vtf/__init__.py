@@ -1,6 +1,7 @@
 import numpy as np
 
-from SourceIO.blender_bindings.utils.texture_utils import create_and_cache_texture
+from SourceIO.blender_bindings.utils.texture_prefetch import pop_prefetched_texture
+from SourceIO.blender_bindings.utils.texture_utils import create_and_cache_texture, sync_decoded_texture_cache
 from SourceIO.library.shared.content_manager import ContentManager
 from SourceIO.library.source1.vtf import convert_skybox_to_equiangular
 from SourceIO.library.source1.vtf import load_texture
@@ -13,7 +14,11 @@ logger = log_manager.get_logger('Source1::VTF')
 
 def import_texture(texture_path: TinyPath, file_object, update=False):
     logger.info(f'Loading "{texture_path.name}" texture')
-    rgba_data, image_height, image_width = load_texture(file_object)
+    if (prefetched := pop_prefetched_texture(texture_path)) is not None:
+        rgba_data, (image_width, image_height), _ = prefetched
+    else:
+        sync_decoded_texture_cache()
+        rgba_data, image_height, image_width = load_texture(file_object)
 
     return create_and_cache_texture(texture_path, (image_width, image_height), rgba_data, False, False)
 
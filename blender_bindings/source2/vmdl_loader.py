@@ -13,12 +13,12 @@ from mathutils import Matrix, Quaternion, Vector
 from SourceIO.blender_bindings.shared.model_container import ModelContainer
 from SourceIO.blender_bindings.utils.bpy_utils import (add_material, find_layer_collection,
                                                        get_new_unique_collection, get_or_create_material,
-                                                       is_blender_4_1)
+                                                       group_vertex_weights, is_blender_4_1)
 from SourceIO.library.shared.content_manager import ContentManager
 from SourceIO.library.source2 import (CompiledMaterialResource, CompiledModelResource, CompiledMorphResource,
                                       CompiledPhysicsResource, CompiledTextureResource, CompiledMeshResource)
 from SourceIO.library.source2.common import convert_normals, convert_normals_2
-from SourceIO.library.source2.blocks.kv3_block import KVBlock
+from SourceIO.library.source2.blocks.kv3_block import KVBlock, LazyKVBlock
 from SourceIO.library.source2.blocks.morph_block import MorphBlock
 from SourceIO.library.source2.blocks.phys_block import PhysBlock
 from SourceIO.library.source2.blocks.vertex_index_buffer import VertexIndexBuffer, IndexBuffer
@@ -33,6 +33,7 @@ from SourceIO.library.utils.perf_sampler import timed
 from .vmat_loader import load_material
 from .vphy_loader import load_physics
 from ..utils.fast_mesh import FastMesh
+from ..utils.texture_prefetch import TexturePrefetcher
 
 
 def put_into_collections(model_container, model_name, parent_collection=None, bodygroup_grouping=False):
@@ -98,6 +99,27 @@ def load_model(content_manager: ContentManager, resource: CompiledModelResource,
     return container
 
 
+def preload_model(resource: CompiledModelResource, import_contex: ImportContext) -> CompiledModelResource:
+    """Decode blocks load_model is going to read, without touching Blender data, so it can run on worker thread.
+
+    Only embedded meshes are decoded, external ones need content manager lookups and are left to load_model.
+    """
+    lod_mask = unpack("Q", pack("q", import_contex.lod_mask))[0]
+    data = resource.get_block(KVBlock, block_name='DATA')
+    if data is None:
+        return resource
+    for i, mesh in enumerate(data['m_refMeshes']):
+        if data['m_refLODGroupMasks'][i] & lod_mask == 0:
+            continue
+        if isinstance(mesh, NullObject) or not mesh:
+            mesh_info = resource.get_block(KVBlock, block_name='CTRL')['embedded_meshes'][i]
+            resource.get_block(LazyKVBlock, block_id=mesh_info['data_block'])
+            resource.get_block(VertexIndexBuffer, block_id=mesh_info['vbib_block'])
+            resource.get_block(VertexIndexBuffer, block_id=mesh_info.get('tools_vb_block', -1))
+            resource.get_block(MorphBlock, block_id=mesh_info['morph_block'])
+    return resource
+
+
 def clear_selection():
     for obj in bpy.context.selected_objects:
         obj.select_set(False)
@@ -199,7 +221,7 @@ def load_internal_mesh(content_manager: ContentManager, model_resource: Compiled
                        container: ModelContainer, mesh_info: Mapping[str, Any], import_context: ImportContext
                        ):
     mesh_index = mesh_info['mesh_index']
-    data_block = model_resource.get_block(KVBlock, block_id=mesh_info['data_block'])
+    data_block = model_resource.get_block(LazyKVBlock, block_id=mesh_info['data_block'])
     vbib_block = model_resource.get_block(VertexIndexBuffer, block_id=mesh_info['vbib_block'])
     tbuf_block = model_resource.get_block(VertexIndexBuffer, block_id=mesh_info.get('tools_vb_block',-1))
     morph_block = model_resource.get_block(MorphBlock, block_id=mesh_info['morph_block'])
@@ -227,7 +249,7 @@ def load_external_mesh(content_manager: ContentManager, model_resource: Compiled
                        container: ModelContainer, mesh_id: int, mesh_resource: CompiledMeshResource,
                        import_context: ImportContext
                        ):
-    data_block = mesh_resource.get_block(KVBlock, block_name='DATA')
+    data_block = mesh_resource.get_block(LazyKVBlock, block_name='DATA')
     vbib_block = mesh_resource.get_block(VertexIndexBuffer, block_name='VBIB')
     morph_block = None
     texture = None
@@ -304,12 +326,8 @@ def _add_vertex_groups(model_resource: CompiledModelResource,
             raise NotImplementedError(f"Blendindices of type {indices_array.dtype} not supported")
         weights_array = np.ones_like(indices_array, dtype=np.float32)
     remapped_indices = remap_table[indices_array]
-    for n, bone_indices in enumerate(remapped_indices):
-        weights = weights_array[n]
-        for bone_index, weight in zip(bone_indices, weights):
-            if weight > 0:
-                bone_name = bones[bone_index]
-                weight_groups[bone_name].add([n], weight, 'REPLACE')
+    for bone_index, weight, vertex_ids in group_vertex_weights(remapped_indices, weights_array):
+        weight_groups[bones[bone_index]].add(vertex_ids, weight, 'REPLACE')
 
 
 def convert_to_float32(uv_array: np.ndarray):
@@ -374,13 +392,34 @@ def create_mesh(content_manager: ContentManager, model_resource: CompiledModelRe
     if import_context.import_attachments:
         load_attachments(data_block["m_attachments"], container, import_context.scale)
 
-    for scene_object in data_block['m_sceneObjects']:
-        import_scene_object(content_manager, data_block, g_vertex_offset, import_context, index_buffers, mesh_id,
-                            mesh_name, mesh_resource, model_resource, morph_block, morph_texture, objects, scene_object,
-                            vertex_buffers, extra_vertex_buffers)
+    with TexturePrefetcher() as prefetcher:
+        if import_context.import_materials:
+            prefetch_mesh_textures(prefetcher, content_manager, data_block, mesh_resource)
+        for scene_object in data_block['m_sceneObjects']:
+            import_scene_object(content_manager, data_block, g_vertex_offset, import_context, index_buffers, mesh_id,
+                                mesh_name, mesh_resource, model_resource, morph_block, morph_texture, objects,
+                                scene_object, vertex_buffers, extra_vertex_buffers)
     return objects
 
 
+@timed
+def prefetch_mesh_textures(prefetcher: TexturePrefetcher, content_manager: ContentManager, data_block: KVBlock,
+                           mesh_resource: CompiledMeshResource):
+    material_resources = []
+    seen = set()
+    for scene_object in data_block['m_sceneObjects']:
+        for draw_call in scene_object["m_drawCalls"]:
+            material_name = draw_call['m_material', 'm_pMaterial']
+            if isinstance(material_name, NullObject) or material_name in seen:
+                continue
+            seen.add(material_name)
+            material_resource = mesh_resource.get_child_resource(material_name, content_manager,
+                                                                 CompiledMaterialResource)
+            if material_resource is not None:
+                material_resources.append(material_resource)
+    prefetcher.prefetch_source2(content_manager, material_resources)
+
+
 @timed
 def import_scene_object(content_manager: ContentManager, data_block, g_vertex_offset, import_context, index_buffers,
                         mesh_id, mesh_name,
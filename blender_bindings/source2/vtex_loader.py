@@ -1,6 +1,7 @@
 import bpy
 
-from SourceIO.blender_bindings.utils.texture_utils import create_and_cache_texture
+from SourceIO.blender_bindings.utils.texture_prefetch import pop_prefetched_texture
+from SourceIO.blender_bindings.utils.texture_utils import create_and_cache_texture, sync_decoded_texture_cache
 from SourceIO.library.utils.tiny_path import TinyPath
 from SourceIO.library.source2.blocks.texture_data import VTexFormat
 from SourceIO.library.source2.resource_types import CompiledTextureResource
@@ -14,14 +15,19 @@ def import_texture(resource: CompiledTextureResource, texture_path: TinyPath, in
         # logger.info('Using already loaded texture')
         return bpy.data.images[f'{texture_path.stem}.png']
     logger.info(f'Loading {texture_path} texture')
-    pixel_data, (width, height) = resource.get_texture_data(0)
+    if (prefetched := pop_prefetched_texture(texture_path)) is not None:
+        pixel_data, (width, height), is_hdr = prefetched
+        if pixel_data is None:
+            return None
+    else:
+        sync_decoded_texture_cache()
+        pixel_data, (width, height) = resource.get_texture_data(0)
+        is_hdr = resource.get_texture_format() in (VTexFormat.RGBA16161616F, VTexFormat.BC6H)
 
     if pixel_data.shape[0] == 0:
         return None
 
-    pixel_format = resource.get_texture_format()
-    image = create_and_cache_texture(texture_path, (width, height), pixel_data,
-                                     pixel_format in (VTexFormat.RGBA16161616F, VTexFormat.BC6H), invert_y)
+    image = create_and_cache_texture(texture_path, (width, height), pixel_data, is_hdr, invert_y)
 
     image.alpha_mode = 'CHANNEL_PACKED'
     del pixel_data
@@ -1,21 +1,31 @@
+from __future__ import annotations
+
 import math
 import re
 from pprint import pformat
+from typing import TYPE_CHECKING
 
 import bpy
+import numpy as np
 from mathutils import Euler
 
 from SourceIO.blender_bindings.utils.texture_utils import check_texture_cache
 from SourceIO.library.source2.blocks.kv3_block import KVBlock
-from .base_entity_classes import *
 from SourceIO.blender_bindings.source2.vtex_loader import import_texture
 from SourceIO.blender_bindings.utils.bpy_utils import get_or_create_collection
 from SourceIO.library.shared.content_manager import ContentManager
 from SourceIO.library.source2 import CompiledMaterialResource, CompiledTextureResource
+from SourceIO.library.utils.entity_class_registry import load_entity_classes
 from SourceIO.library.utils.math_utilities import SOURCE2_HAMMER_UNIT_TO_METERS
 from SourceIO.library.utils.tiny_path import TinyPath
 from SourceIO.logger import SourceLogMan
 
+if TYPE_CHECKING:
+    from .base_entity_classes import *
+
+base_entity_classes = load_entity_classes(f"{__package__}.base_entity_classes")
+parse_source_value = base_entity_classes.parse_source_value
+
 strip_patch_coordinates = re.compile(r"_-?\d+_-?\d+_-?\d+.*$")
 log_manager = SourceLogMan()
 
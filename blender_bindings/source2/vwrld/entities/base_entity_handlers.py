@@ -1,3 +1,7 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import bpy
 
 from .....library.shared.content_manager.provider import \
@@ -6,12 +10,17 @@ from .....library.source2 import CompiledMaterialResource
 from ....material_loader.shaders.source2_shaders.sky import Skybox
 from .abstract_entity_handlers import (AbstractEntityHandler, get_angles,
                                        get_origin)
-from .base_entity_classes import *
+from .....library.utils.entity_class_registry import load_entity_classes
 from .....library.utils.tiny_path import TinyPath
 
+if TYPE_CHECKING:
+    from .base_entity_classes import *
+
+base_entity_classes = load_entity_classes(f"{__package__}.base_entity_classes")
+
 
 class BaseEntityHandler(AbstractEntityHandler):
-    entity_lookup_table = entity_class_handle
+    entity_lookup_table = base_entity_classes.entity_class_handle
 
     def handle_prop_ragdoll(self, entity: prop_ragdoll, entity_raw: dict):
         obj = self._handle_entity_with_model(entity, entity_raw)
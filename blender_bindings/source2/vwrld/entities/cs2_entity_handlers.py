@@ -1,12 +1,22 @@
+from __future__ import annotations
+
 import math
+from typing import TYPE_CHECKING
 
 import bpy
+import numpy as np
 
 from SourceIO.library.source2.keyvalues3.types import NullObject
-from .abstract_entity_handlers import get_scale, Base
-from .hlvr_entity_classes import point_viewcontrol
+from SourceIO.library.utils.entity_class_registry import load_entity_classes
+from .abstract_entity_handlers import get_scale, Base, parse_source_value
 from .hlvr_entity_handlers import HLVREntityHandler, get_origin, get_angles
-from .cs2_entity_classes import *
+
+if TYPE_CHECKING:
+    from .hlvr_entity_classes import point_viewcontrol
+    from .cs2_entity_classes import *
+
+cs2_entity_classes = load_entity_classes(f"{__package__}.cs2_entity_classes")
+entity_class_handle = cs2_entity_classes.entity_class_handle
 
 local_entity_lookup_table = HLVREntityHandler.entity_lookup_table.copy()
 local_entity_lookup_table.update(entity_class_handle)
@@ -1,13 +1,22 @@
+from __future__ import annotations
+
 import math
+from typing import TYPE_CHECKING
 
 import bpy
+import numpy as np
 
+from SourceIO.library.utils.entity_class_registry import load_entity_classes
 from .abstract_entity_handlers import get_angles, get_origin, get_scale
 from .base_entity_handlers import BaseEntityHandler
-from .hlvr_entity_classes import *
+
+if TYPE_CHECKING:
+    from .hlvr_entity_classes import *
+
+hlvr_entity_classes = load_entity_classes(f"{__package__}.hlvr_entity_classes")
 
 local_entity_lookup_table = BaseEntityHandler.entity_lookup_table.copy()
-local_entity_lookup_table.update(entity_class_handle)
+local_entity_lookup_table.update(hlvr_entity_classes.entity_class_handle)
 
 
 class HLVREntityHandler(BaseEntityHandler):
@@ -1,8 +1,17 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from SourceIO.library.utils.entity_class_registry import load_entity_classes
 from .hlvr_entity_handlers import HLVREntityHandler
-from .sbox_entity_classes import *
+
+if TYPE_CHECKING:
+    from .sbox_entity_classes import *
+
+sbox_entity_classes = load_entity_classes(f"{__package__}.sbox_entity_classes")
 
 local_entity_lookup_table = HLVREntityHandler.entity_lookup_table.copy()
-local_entity_lookup_table.update(entity_class_handle)
+local_entity_lookup_table.update(sbox_entity_classes.entity_class_handle)
 
 
 class SBoxEntityHandler(HLVREntityHandler):
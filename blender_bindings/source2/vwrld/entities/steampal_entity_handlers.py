@@ -1,12 +1,18 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import bpy
 import numpy as np
 
 from .abstract_entity_handlers import Base, get_origin, get_angles, get_scale
-from .hlvr_entity_handlers import HLVREntityHandler
-from .hlvr_entity_classes import *
+from .hlvr_entity_handlers import HLVREntityHandler, hlvr_entity_classes
+
+if TYPE_CHECKING:
+    from .hlvr_entity_classes import *
 
 local_entity_lookup_table = HLVREntityHandler.entity_lookup_table.copy()
-local_entity_lookup_table.update(entity_class_handle)
+local_entity_lookup_table.update(hlvr_entity_classes.entity_class_handle)
 
 
 class SteamPalEntityHandler(HLVREntityHandler):
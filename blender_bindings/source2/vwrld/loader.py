@@ -1,19 +1,29 @@
-from typing import Any, Type
+from collections import defaultdict
+from typing import Any, Optional, Type
 
 import bpy
+import numpy as np
 from mathutils import Matrix
 
 from SourceIO.blender_bindings.shared.exceptions import RequiredFileNotFound
-from SourceIO.blender_bindings.utils.bpy_utils import get_or_create_collection, pause_view_layer_update
+from SourceIO.blender_bindings.source2.vmat_loader import load_material
+from SourceIO.blender_bindings.source2.vmdl_loader import ImportContext, load_model, put_into_collections
+from SourceIO.blender_bindings.utils.bpy_utils import (get_new_unique_collection, get_or_create_collection,
+                                                       pause_view_layer_update)
+from SourceIO.blender_bindings.utils.prop_instancing import (create_collection_instances, create_instance_point_cloud,
+                                                             create_skin_variant, decompose_matrices,
+                                                             get_master_instance_collection)
 from SourceIO.library.shared.app_id import SteamAppId
 from SourceIO.library.shared.content_manager import ContentManager
-from SourceIO.library.source2 import CompiledWorldResource, CompiledResource
+from SourceIO.library.source2 import (CompiledMaterialResource, CompiledModelResource, CompiledWorldResource,
+                                      CompiledResource)
 from SourceIO.library.source2.blocks.kv3_block import KVBlock
 from SourceIO.library.source2.keyvalues3.types import Object
 from SourceIO.library.source2.resource_types import CompiledManifestResource
 from SourceIO.library.source2.resource_types.compiled_world_resource import CompiledEntityLumpResource, \
     CompiledMapResource
 from SourceIO.library.utils.math_utilities import SOURCE2_HAMMER_UNIT_TO_METERS
+from SourceIO.library.utils.path_utilities import path_stem
 from SourceIO.library.utils.perf_sampler import timed
 from SourceIO.library.utils.tiny_path import TinyPath
 from SourceIO.logger import SourceLogMan
@@ -33,7 +43,8 @@ def get_entity_name(entity_data: dict[str, Any]):
     return f'{entity_data.get("targetname", entity_data.get("hammeruniqueid", "missing_hammer_id"))}'
 
 @timed
-def load_map(map_resource: CompiledMapResource, cm: ContentManager, scale: float = SOURCE2_HAMMER_UNIT_TO_METERS):
+def load_map(map_resource: CompiledMapResource, cm: ContentManager, scale: float = SOURCE2_HAMMER_UNIT_TO_METERS,
+             static_prop_mode: str = 'PLACEHOLDERS'):
     manifest_resource_path = next(filter(lambda a: a.endswith(".vrman"), map_resource.get_child_resources()), None)
     if manifest_resource_path is not None:
         manifest_resource = map_resource.get_child_resource(manifest_resource_path, cm, CompiledManifestResource)
@@ -42,12 +53,12 @@ def load_map(map_resource: CompiledMapResource, cm: ContentManager, scale: float
             None)
         if world_resource_path is not None:
             world_resource = manifest_resource.get_child_resource(world_resource_path, cm, CompiledWorldResource)
-            return import_world(world_resource, map_resource, cm, scale)
+            return import_world(world_resource, map_resource, cm, scale, static_prop_mode)
 
     world_resource_path = next(filter(lambda a: a.endswith(".vwrld"), map_resource.get_child_resources()), None)
     if world_resource_path is not None:
         world_resource = map_resource.get_child_resource(world_resource_path, cm)
-        return import_world(world_resource, map_resource, cm, scale)
+        return import_world(world_resource, map_resource, cm, scale, static_prop_mode)
 
 
 def cheap_path_check(resource_id: str | int, content_manager: ContentManager, resource: CompiledResource):
@@ -59,7 +70,8 @@ def cheap_path_check(resource_id: str | int, content_manager: ContentManager, re
 
 
 def import_world(world_resource: CompiledWorldResource, map_resource: CompiledMapResource,
-                 content_manager: ContentManager, scale=SOURCE2_HAMMER_UNIT_TO_METERS):
+                 content_manager: ContentManager, scale=SOURCE2_HAMMER_UNIT_TO_METERS,
+                 static_prop_mode: str = 'PLACEHOLDERS'):
     map_name = map_resource.name
     master_collection = get_or_create_collection(map_name, bpy.context.scene.collection)
     data_block = world_resource.get_block(KVBlock, block_name="DATA")
@@ -72,15 +84,23 @@ def import_world(world_resource: CompiledWorldResource, map_resource: CompiledMa
     if uv_scale is None:
         uv_scale: list[float] = [1., 1.]
 
+    model_collections: dict[str, Optional[bpy.types.Collection]] = {}
     with pause_view_layer_update():
         for node_prefix in world_resource.get_worldnode_prefixes():
             node_resource = map_resource.get_worldnode(node_prefix, content_manager)
             if node_resource is None:
                 raise RequiredFileNotFound("Failed to find WorldNode resource")
             collection = get_or_create_collection(f"static_props_{TinyPath(node_prefix).name}", master_collection)
+            # (model path, skin) -> scene objects and their transforms
+            instanced_props: dict[tuple[TinyPath, str], list[tuple[Object, Any]]] = defaultdict(list)
             for scene_object in node_resource.get_scene_objects():
                 renderable_model = scene_object["m_renderableModel"]
                 proper_path = cheap_path_check(renderable_model, content_manager, node_resource)
+                if static_prop_mode != 'PLACEHOLDERS' and proper_path:
+                    skin = scene_object.get('skin', 'default') or 'default'
+                    instanced_props[(proper_path, str(skin))].append(
+                        (scene_object, scene_object.get('m_vTransform', None)))
+                    continue
                 if (transform := scene_object.get('m_vTransform', None)) is not None:
                     matrix = Matrix(transform).to_4x4()
                 else:
@@ -111,9 +131,96 @@ def import_world(world_resource: CompiledWorldResource, map_resource: CompiledMa
                     create_aggregate_prop_placeholder(scene_object, proper_path, fragments, collection, scale, uv_scale)
                 else:
                     create_static_prop_placeholder(scene_object, proper_path, None, collection, scale, uv_scale)
+            if instanced_props:
+                import_static_prop_instances(content_manager, instanced_props, model_collections, collection,
+                                             scale, uv_scale, static_prop_mode)
         load_entities(world_resource, master_collection, scale, content_manager)
 
 
+def load_static_prop_model(content_manager: ContentManager, model_path: TinyPath,
+                           scale: float) -> Optional[bpy.types.Collection]:
+    model_file = content_manager.find_file(model_path)
+    if model_file is None:
+        logger.warn(f"Failed to find {model_path.as_posix()!r} static prop model")
+        return None
+    model_resource = CompiledModelResource.from_buffer(model_file, model_path)
+    import_context = ImportContext(
+        scale=scale,
+        lod_mask=1,
+        import_physics=False,
+        import_attachments=False,
+        import_materials=bpy.context.scene.import_materials,
+        draw_call_index=None,
+        lm_uv_scale=(1, 1)
+    )
+    container = load_model(content_manager, model_resource, import_context)
+    model_collection = get_new_unique_collection(model_resource.name, get_master_instance_collection())
+    put_into_collections(container, model_resource.name, model_collection, bodygroup_grouping=False)
+    return model_collection
+
+
+def load_skin_materials(content_manager: ContentManager, collection: bpy.types.Collection, skin: str):
+    """Make sure materials of given skin exist before skin variant of the model is created."""
+    for obj in collection.all_objects:
+        skin_groups = obj.get('skin_groups', None)
+        if not skin_groups or skin not in skin_groups:
+            continue
+        material_path = TinyPath(skin_groups[skin])
+        if path_stem(material_path) in bpy.data.materials or not bpy.context.scene.import_materials:
+            continue
+        material_file = content_manager.find_file(TinyPath(material_path.as_posix() + "_c"))
+        if material_file is None:
+            logger.warn(f"Failed to find {material_path.as_posix()!r} skin material")
+            continue
+        material_resource = CompiledMaterialResource.from_buffer(material_file, material_path)
+        load_material(content_manager, material_resource, material_path)
+
+
+@timed
+def import_static_prop_instances(content_manager: ContentManager,
+                                 instanced_props: dict[tuple[TinyPath, str], list[tuple[Object, Any]]],
+                                 model_collections: dict[str, Optional[bpy.types.Collection]],
+                                 collection: bpy.types.Collection, scale: float, uv_scale: list[float],
+                                 static_prop_mode: str):
+    """Load every unique model once and place scene objects sharing model and skin as its instances."""
+    logger.info(f"Placing {sum(map(len, instanced_props.values()))} static props "
+                f"using {len(instanced_props)} unique models")
+    master_instance_collection = get_master_instance_collection()
+    for (model_path, skin), scene_objects in instanced_props.items():
+        model_key = model_path.as_posix().lower()
+        if model_key not in model_collections:
+            model_collections[model_key] = load_static_prop_model(content_manager, model_path, scale)
+        instance_collection = model_collections[model_key]
+        if instance_collection is None:
+            for scene_object, transform in scene_objects:
+                matrix = Matrix(transform).to_4x4() if transform is not None else None
+                create_static_prop_placeholder(scene_object, model_path, matrix, collection, scale, uv_scale)
+            continue
+        if skin != 'default':
+            skin_key = f"{model_key}#{skin}"
+            if skin_key not in model_collections:
+                load_skin_materials(content_manager, instance_collection, skin)
+                model_collections[skin_key] = create_skin_variant(instance_collection, skin,
+                                                                  master_instance_collection)
+            instance_collection = model_collections[skin_key]
+
+        transforms = np.zeros((len(scene_objects), 3, 4), np.float32)
+        transforms[:, :3, :3] = np.eye(3)
+        for i, (_, transform) in enumerate(scene_objects):
+            if transform is not None:
+                transforms[i] = np.asarray(transform, np.float32).reshape(3, 4)
+        transforms[:, :, 3] *= scale
+
+        name = f"{model_path.stem}_{skin}"
+        if static_prop_mode == 'POINT_CLOUD':
+            create_instance_point_cloud(name, instance_collection, *decompose_matrices(transforms), collection)
+        else:
+            matrices = np.zeros((len(transforms), 4, 4), np.float32)
+            matrices[:, :3] = transforms
+            matrices[:, 3, 3] = 1
+            create_collection_instances(name, instance_collection, matrices, collection)
+
+
 def create_static_prop_placeholder(scene_object: Object, proper_path: TinyPath | None, matrix: Matrix | None,
                                    collection: bpy.types.Collection, scale: float, uv_scale: list[float]):
     if not proper_path:
@@ -2,6 +2,7 @@ import contextlib
 import random
 
 import bpy
+import numpy as np
 
 from SourceIO.library.utils.perf_sampler import timed
 from SourceIO.library.utils.tiny_path import TinyPath
@@ -73,6 +74,50 @@ def get_or_create_material(name: str, full_path: str):
     return mat
 
 
+def group_vertex_weights(bone_indices: np.ndarray, weights: np.ndarray):
+    """Group per vertex bone slots into (bone_index, weight, vertex_indices) buckets.
+
+    Slots with zero weight are skipped. When a vertex references same bone in several slots the last one wins,
+    matching what per vertex 'REPLACE' adds produced.
+    """
+    slot_count = bone_indices.shape[1]
+    vertex_ids = np.repeat(np.arange(bone_indices.shape[0], dtype=np.int64), slot_count)
+    bones = bone_indices.reshape(-1).astype(np.int64)
+    weights = weights.reshape(-1)
+    mask = weights > 0
+    vertex_ids, bones, weights = vertex_ids[mask], bones[mask], weights[mask]
+
+    if slot_count > 1 and vertex_ids.size:
+        # Keep last occurrence of every (vertex, bone) pair
+        pair_keys = vertex_ids * (bones.max() + 1) + bones
+        _, last = np.unique(pair_keys[::-1], return_index=True)
+        keep = np.sort(vertex_ids.size - 1 - last)
+        vertex_ids, bones, weights = vertex_ids[keep], bones[keep], weights[keep]
+
+    order = np.lexsort((vertex_ids, weights, bones))
+    vertex_ids, bones, weights = vertex_ids[order], bones[order], weights[order]
+    splits = np.flatnonzero((bones[1:] != bones[:-1]) | (weights[1:] != weights[:-1])) + 1
+    starts = np.concatenate(([0], splits))
+    ends = np.concatenate((splits, [bones.size]))
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        if start == end:
+            continue
+        yield int(bones[start]), float(weights[start]), vertex_ids[start:end].tolist()
+
+
+@timed
+def add_vertex_weights(mesh_obj: bpy.types.Object, bone_names: list[str], bone_indices: np.ndarray,
+                       weights: np.ndarray):
+    """Create vertex group for every bone and assign (vertex_count, slot_count) bone indices and weights.
+
+    Vertices sharing same bone and weight are added with one call instead of one call per vertex slot.
+    """
+    weight_groups = {bone_name: mesh_obj.vertex_groups.new(name=bone_name) for bone_name in bone_names}
+    for bone_index, weight, vertex_ids in group_vertex_weights(bone_indices, weights):
+        weight_groups[bone_names[bone_index]].add(vertex_ids, weight, 'REPLACE')
+    return weight_groups
+
+
 KNOWN_COLLECTIONS_CACHE = {}
 
 
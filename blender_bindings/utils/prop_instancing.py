@@ -0,0 +1,196 @@
+from typing import Optional
+
+import bpy
+import numpy as np
+from mathutils import Matrix
+
+from SourceIO.blender_bindings.utils.bpy_utils import find_layer_collection, get_or_create_collection
+from SourceIO.library.utils.path_utilities import path_stem
+from SourceIO.library.utils.perf_sampler import timed
+
+MASTER_INSTANCES_COLLECTION = "MASTER_INSTANCES_DO_NOT_EDIT"
+_INSTANCING_NODE_GROUP = "SourceIO_PropInstancing"
+
+
+def get_master_instance_collection() -> bpy.types.Collection:
+    """Collection holding models used as instance sources, excluded from view layer."""
+    collection = get_or_create_collection(MASTER_INSTANCES_COLLECTION, bpy.context.scene.collection)
+    layer_collection = find_layer_collection(bpy.context.view_layer.layer_collection, collection.name)
+    if layer_collection is not None:
+        layer_collection.exclude = True
+    return collection
+
+
+def euler_to_matrices(angles: np.ndarray) -> np.ndarray:
+    """Convert (N, 3) array of XYZ euler angles in radians into (N, 3, 3) rotation matrices, same as Blender does."""
+    sx, sy, sz = np.sin(angles).T
+    cx, cy, cz = np.cos(angles).T
+    matrices = np.empty((len(angles), 3, 3), np.float32)
+    matrices[:, 0, 0] = cy * cz
+    matrices[:, 0, 1] = sx * sy * cz - cx * sz
+    matrices[:, 0, 2] = cx * sy * cz + sx * sz
+    matrices[:, 1, 0] = cy * sz
+    matrices[:, 1, 1] = sx * sy * sz + cx * cz
+    matrices[:, 1, 2] = cx * sy * sz - sx * cz
+    matrices[:, 2, 0] = -sy
+    matrices[:, 2, 1] = sx * cy
+    matrices[:, 2, 2] = cx * cy
+    return matrices
+
+
+def compose_matrices(origins: np.ndarray, angles: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    """Build (N, 4, 4) world matrices from locations, XYZ euler angles in radians and per axis scales."""
+    matrices = np.zeros((len(origins), 4, 4), np.float32)
+    matrices[:, :3, :3] = euler_to_matrices(angles) * scales[:, None, :]
+    matrices[:, :3, 3] = origins
+    matrices[:, 3, 3] = 1
+    return matrices
+
+
+def decompose_matrices(matrices: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Split (N, 3, 4) or (N, 4, 4) affine matrices into locations, XYZ euler angles in radians and scales.
+
+    Mirrored matrices get their reflection as negative X scale.
+    """
+    origins = matrices[:, :3, 3].astype(np.float32)
+    linear = matrices[:, :3, :3].astype(np.float64)
+    scales = np.linalg.norm(linear, axis=1)
+    scales[np.linalg.det(linear) < 0, 0] *= -1
+    rotations = linear / np.where(scales == 0, 1, scales)[:, None, :]
+    cos_y = np.hypot(rotations[:, 0, 0], rotations[:, 1, 0])
+    gimbal_lock = cos_y < 1e-6
+    angles = np.empty((len(matrices), 3), np.float32)
+    angles[:, 0] = np.where(gimbal_lock, np.arctan2(-rotations[:, 1, 2], rotations[:, 1, 1]),
+                            np.arctan2(rotations[:, 2, 1], rotations[:, 2, 2]))
+    angles[:, 1] = np.arctan2(-rotations[:, 2, 0], cos_y)
+    angles[:, 2] = np.where(gimbal_lock, 0, np.arctan2(rotations[:, 1, 0], rotations[:, 0, 0]))
+    return origins, angles, scales.astype(np.float32)
+
+
+def _skin_material_remap(obj: bpy.types.Object, skin: str) -> Optional[dict[str, str]]:
+    skin_groups = obj.get("skin_groups", None)
+    active_skin = obj.get("active_skin", None)
+    if not skin_groups or skin not in skin_groups or active_skin not in skin_groups:
+        return None
+    new_materials = skin_groups[skin]
+    old_materials = skin_groups[active_skin]
+    if isinstance(new_materials, str):
+        # Source2 meshes store single material per skin
+        return {path_stem(old_materials): path_stem(new_materials)}
+    return dict(zip(old_materials, new_materials))
+
+
+@timed
+def create_skin_variant(collection: bpy.types.Collection, skin: str,
+                        parent_collection: bpy.types.Collection) -> bpy.types.Collection:
+    """Copy objects of already imported model into new collection with another skin applied.
+
+    Copies share mesh data with the originals, skin materials are assigned to object linked material slots.
+    """
+    variant = bpy.data.collections.new(f"{collection.name}_skin_{skin}")
+    parent_collection.children.link(variant)
+    copies = {}
+    for obj in collection.all_objects:
+        copies[obj] = obj.copy()
+        variant.objects.link(copies[obj])
+    for obj, copy in copies.items():
+        if obj.parent in copies:
+            copy.parent = copies[obj.parent]
+        for modifier in copy.modifiers:
+            if modifier.type == 'ARMATURE' and modifier.object in copies:
+                modifier.object = copies[modifier.object]
+        remap = _skin_material_remap(obj, skin)
+        if not remap:
+            continue
+        for slot in copy.material_slots:
+            if slot.material is None:
+                continue
+            material = bpy.data.materials.get(remap.get(slot.material.name, slot.material.name), None)
+            if material is not None and material != slot.material:
+                slot.link = 'OBJECT'
+                slot.material = material
+        copy["active_skin"] = skin
+    return variant
+
+
+@timed
+def create_collection_instances(name: str, instance_collection: bpy.types.Collection, matrices: np.ndarray,
+                                parent_collection: bpy.types.Collection) -> list[bpy.types.Object]:
+    """Place an empty instancing given collection at every one of (N, 4, 4) world matrices."""
+    objects = []
+    for matrix in matrices:
+        obj = bpy.data.objects.new(name, None)
+        obj.instance_type = 'COLLECTION'
+        obj.instance_collection = instance_collection
+        obj.matrix_world = Matrix(matrix.tolist())
+        parent_collection.objects.link(obj)
+        objects.append(obj)
+    return objects
+
+
+def _get_instancing_node_group() -> bpy.types.NodeTree:
+    node_group = bpy.data.node_groups.get(_INSTANCING_NODE_GROUP, None)
+    if node_group is not None:
+        return node_group
+    node_group = bpy.data.node_groups.new(_INSTANCING_NODE_GROUP, 'GeometryNodeTree')
+    interface = node_group.interface
+    interface.new_socket("Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+    interface.new_socket("Collection", in_out='INPUT', socket_type='NodeSocketCollection')
+    interface.new_socket("Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+
+    nodes = node_group.nodes
+    links = node_group.links
+    group_input = nodes.new('NodeGroupInput')
+    group_output = nodes.new('NodeGroupOutput')
+    collection_info = nodes.new('GeometryNodeCollectionInfo')
+    collection_info.transform_space = 'ORIGINAL'
+    instance_on_points = nodes.new('GeometryNodeInstanceOnPoints')
+    rotation = nodes.new('GeometryNodeInputNamedAttribute')
+    rotation.data_type = 'FLOAT_VECTOR'
+    rotation.inputs['Name'].default_value = "rotation"
+    scale = nodes.new('GeometryNodeInputNamedAttribute')
+    scale.data_type = 'FLOAT_VECTOR'
+    scale.inputs['Name'].default_value = "scale"
+
+    group_input.location = (-600, 0)
+    collection_info.location = (-300, -150)
+    rotation.location = (-300, -350)
+    scale.location = (-300, -500)
+    instance_on_points.location = (0, 0)
+    group_output.location = (300, 0)
+
+    links.new(group_input.outputs['Collection'], collection_info.inputs['Collection'])
+    links.new(group_input.outputs['Geometry'], instance_on_points.inputs['Points'])
+    links.new(collection_info.outputs['Instances'], instance_on_points.inputs['Instance'])
+    links.new(rotation.outputs['Attribute'], instance_on_points.inputs['Rotation'])
+    links.new(scale.outputs['Attribute'], instance_on_points.inputs['Scale'])
+    links.new(instance_on_points.outputs['Instances'], group_output.inputs['Geometry'])
+    return node_group
+
+
+@timed
+def create_instance_point_cloud(name: str, instance_collection: bpy.types.Collection,
+                                origins: np.ndarray, angles: np.ndarray, scales: np.ndarray,
+                                parent_collection: bpy.types.Collection) -> bpy.types.Object:
+    """Create single object instancing given collection on every point with geometry nodes.
+
+    Points carry "rotation" (XYZ euler, radians) and "scale" attributes used by instancing node group.
+    """
+    mesh = bpy.data.meshes.new(f"{name}_points")
+    mesh.vertices.add(len(origins))
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(origins, np.float32).ravel())
+    mesh.attributes.new("rotation", 'FLOAT_VECTOR', 'POINT').data.foreach_set(
+        "vector", np.ascontiguousarray(angles, np.float32).ravel())
+    mesh.attributes.new("scale", 'FLOAT_VECTOR', 'POINT').data.foreach_set(
+        "vector", np.ascontiguousarray(scales, np.float32).ravel())
+    mesh.update()
+
+    obj = bpy.data.objects.new(name, mesh)
+    modifier = obj.modifiers.new(name="Instancing", type='NODES')
+    node_group = _get_instancing_node_group()
+    modifier.node_group = node_group
+    collection_socket = next(item for item in node_group.interface.items_tree
+                             if item.item_type == 'SOCKET' and item.in_out == 'INPUT' and item.name == "Collection")
+    modifier[collection_socket.identifier] = instance_collection
+    parent_collection.objects.link(obj)
+    return obj
@@ -22,3 +22,10 @@ def deserialize_mounted_content(cm: ContentManager):
         item = {"path": resource.path, "name": resource.name}
         data[resource.hash] = item
     cm.deserialize(data)
+
+
+def sync_content_manager_settings(cm: ContentManager):
+    """Apply content mounting options from scene settings, call before scanning for content."""
+    scene = bpy.context.scene
+    cm.enable_mount_manifest(scene.UseMountManifest)
+    cm.enable_path_index(scene.UsePathIndex)
@@ -0,0 +1,163 @@
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Optional
+
+import numpy as np
+
+from SourceIO.blender_bindings.utils.texture_utils import check_texture_cache, sync_decoded_texture_cache
+from SourceIO.library.shared.content_manager import ContentManager
+from SourceIO.library.source1.vmt import VMT
+from SourceIO.library.source1.vtf import load_texture
+from SourceIO.library.source2.blocks.kv3_block import KVBlock
+from SourceIO.library.source2.blocks.texture_data import VTexFormat
+from SourceIO.library.source2.resource_types import CompiledMaterialResource, CompiledTextureResource
+from SourceIO.library.utils import Buffer, MemoryBuffer
+from SourceIO.library.utils.tiny_path import TinyPath
+from SourceIO.logger import SourceLogMan
+
+logger = SourceLogMan().get_logger("TexturePrefetch")
+
+# Decoded texture data: rgba_data, (width, height), is_hdr
+DecodedTexture = tuple[Optional[np.ndarray], tuple[int, int], bool]
+
+# Prefetchers of imports that are currently running, innermost last
+_active_prefetchers: list['TexturePrefetcher'] = []
+
+
+def _texture_key(texture_path: TinyPath) -> str:
+    return texture_path.as_posix().lower()
+
+
+def pop_prefetched_texture(texture_path: TinyPath) -> Optional[DecodedTexture]:
+    """Return texture decoded by one of active prefetchers, None if it was not prefetched."""
+    for prefetcher in reversed(_active_prefetchers):
+        decoded = prefetcher.pop(texture_path)
+        if decoded is not None:
+            return decoded
+    return None
+
+
+def _decode_source1_texture(texture_file: Buffer) -> DecodedTexture:
+    rgba_data, height, width = load_texture(texture_file)
+    return rgba_data, (width, height), False
+
+
+def _decode_source2_texture(texture_resource: CompiledTextureResource) -> DecodedTexture:
+    pixel_data, size = texture_resource.get_texture_data(0)
+    return pixel_data, size, texture_resource.get_texture_format() in (VTexFormat.RGBA16161616F, VTexFormat.BC6H)
+
+
+def _is_texture_candidate(value) -> bool:
+    if not isinstance(value, str) or not value:
+        return False
+    return value[0] not in "[{-.0123456789" and " " not in value.strip()
+
+
+class TexturePrefetcher:
+    """Textures of a single import, decoded in background threads ahead of material creation.
+
+    Use it as context manager around material creation. While it is active texture importers pick decoded textures
+    up through pop_prefetched_texture, on exit textures no material ended up using are dropped.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers
+        self._textures: dict[str, Future] = {}
+
+    def __enter__(self) -> 'TexturePrefetcher':
+        _active_prefetchers.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _active_prefetchers.remove(self)
+        self.clear()
+
+    def pop(self, texture_path: TinyPath) -> Optional[DecodedTexture]:
+        future = self._textures.pop(_texture_key(texture_path), None)
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception as ex:
+            logger.error(f"Failed to decode {texture_path.as_posix()!r} texture: {ex}")
+            return None, (0, 0), False
+
+    def clear(self):
+        """Drop decoded textures no material ended up using."""
+        for future in self._textures.values():
+            future.cancel()
+        self._textures.clear()
+
+    def _submit_jobs(self, jobs: list[tuple[str, Callable[[Any], DecodedTexture], Any]]):
+        if not jobs:
+            return
+        logger.info(f"Prefetching {len(jobs)} textures")
+        executor = ThreadPoolExecutor(max_workers=min(len(jobs), self.max_workers or os.cpu_count() or 1))
+        for key, decoder, source in jobs:
+            self._textures[key] = executor.submit(decoder, source)
+        executor.shutdown(wait=False)
+
+    def prefetch_source1(self, content_manager: ContentManager, materials: Iterable[VMT]):
+        """Resolve every texture referenced by given materials and start decoding them in background threads.
+
+        Files are looked up on the calling thread, only decoding runs in the pool.
+        """
+        sync_decoded_texture_cache()
+        jobs = []
+        seen = set()
+        for vmt in materials:
+            for _, value in vmt.data.items():
+                if not _is_texture_candidate(value):
+                    continue
+                texture = TinyPath(value)
+                texture_path = texture.parent / texture.stem
+                key = _texture_key(texture_path)
+                if key in seen or key in self._textures:
+                    continue
+                seen.add(key)
+                if check_texture_cache(texture_path) is not None:
+                    continue
+                texture_file = content_manager.find_file("materials" / texture.parent / (texture.stem + ".vtf"))
+                if texture_file is None:
+                    continue
+                # Content manager hands out its cached buffer, give the worker an independent view so main thread
+                # lookups of the same file do not move its read position
+                try:
+                    texture_file = texture_file.slice(0)
+                except NotImplementedError:
+                    texture_file = MemoryBuffer(texture_file.read())
+                jobs.append((key, _decode_source1_texture, texture_file))
+        self._submit_jobs(jobs)
+
+    def prefetch_source2(self, content_manager: ContentManager, materials: Iterable[CompiledMaterialResource]):
+        """Resolve every texture referenced by given materials and start decoding them in background threads.
+
+        Resources are opened on the calling thread, only decoding runs in the pool.
+        """
+        sync_decoded_texture_cache()
+        jobs = []
+        seen = set()
+        for material_resource in materials:
+            data = material_resource.get_block(KVBlock, block_name='DATA')
+            if not data:
+                continue
+            for texture_param in data['m_textureParams']:
+                name_or_id = texture_param['m_pValue']
+                if isinstance(name_or_id, int):
+                    texture_path = TinyPath(f"0x{name_or_id:08}")
+                elif isinstance(name_or_id, str) and name_or_id:
+                    texture_path = TinyPath(name_or_id)
+                else:
+                    continue
+                key = _texture_key(texture_path)
+                if key in seen or key in self._textures:
+                    continue
+                seen.add(key)
+                if check_texture_cache(texture_path) is not None:
+                    continue
+                texture_resource = material_resource.get_child_resource(name_or_id, content_manager,
+                                                                        CompiledTextureResource)
+                if texture_resource is None:
+                    continue
+                jobs.append((key, _decode_source2_texture, texture_resource))
+        self._submit_jobs(jobs)
@@ -4,42 +4,117 @@ from typing import Optional
 
 import bpy
 import numpy as np
+from bpy.app.handlers import persistent
 
 from SourceIO.library.utils.rustlib import save_exr, save_png, encode_exr, encode_png
+from SourceIO.library.utils.texture_cache import (DecodedTextureCache, get_decoded_texture_cache,
+                                                  set_decoded_texture_cache)
 from SourceIO.library.utils.tiny_path import TinyPath
 from SourceIO.logger import SourceLogMan
 
 logger = SourceLogMan().get_logger("TextureUtils")
 
 
-def _get_texture(texture_path: TinyPath, *other_args):
+class _TextureRegistry:
+    """Session index of imported images, replaces scanning bpy.data.images on every texture lookup.
+
+    Built once per scene from images carrying 'full_path' and the scene texture name map, then updated as
+    textures get created. Index is dropped on file load and undo, entries pointing to renamed or removed
+    images trigger a rebuild.
+    """
+    __slots__ = ("scene_name", "images", "short_names")
+
+    def __init__(self, scene: bpy.types.Scene):
+        self.scene_name = scene.name_full
+        self.images: dict[str, str] = {}
+        for image in bpy.data.images:
+            if (full_path := image.get('full_path')) is not None:
+                # First match wins, same as linear scan did
+                self.images.setdefault(full_path.lower(), image.name)
+        self.short_names: dict[str, str] = dict(scene.get("texture_name_to_texture", {}))
+
+
+_texture_registry: Optional[_TextureRegistry] = None
+
+
+@persistent
+def reset_texture_registry(*_):
+    global _texture_registry
+    _texture_registry = None
+
+
+def _get_texture_registry() -> _TextureRegistry:
+    global _texture_registry
+    scene = bpy.context.scene
+    if _texture_registry is None or _texture_registry.scene_name != scene.name_full:
+        _texture_registry = _TextureRegistry(scene)
+    return _texture_registry
+
+
+def _texture_key(texture_path: TinyPath, *other_args):
     md_ = md5(texture_path.as_posix().encode("ascii"))
     for key in other_args:
         if key:
             md_.update(key.encode("ascii"))
-    key = md_.hexdigest()
-    cache = bpy.context.scene.get("texture_name_to_texture", {})
-    if key in cache:
-        return cache[key]
+    return md_.hexdigest()
+
+
+def _get_texture(texture_path: TinyPath, *other_args):
+    return _get_texture_registry().short_names.get(_texture_key(texture_path, *other_args), None)
 
 
 def _add_texture(texture_path: TinyPath, real_name: str, *other_args):
-    md_ = md5(texture_path.as_posix().encode("ascii"))
-    for key in other_args:
-        if key:
-            md_.update(key.encode("ascii"))
-    key = md_.hexdigest()
-    cache = bpy.context.scene.get("texture_name_to_texture", {})
-    cache[key] = real_name
-    bpy.context.scene["texture_name_to_texture"] = cache
+    key = _texture_key(texture_path, *other_args)
+    _get_texture_registry().short_names[key] = real_name
+    scene = bpy.context.scene
+    if "texture_name_to_texture" not in scene:
+        scene["texture_name_to_texture"] = {}
+    # Update stored group in place instead of writing back a copy of whole map
+    scene["texture_name_to_texture"][key] = real_name
+
+
+def _register_image(image: bpy.types.Image):
+    full_path = image.get('full_path')
+    if full_path is not None:
+        _get_texture_registry().images.setdefault(full_path.lower(), image.name)
+
+
+def _find_registered_image(texture_path: TinyPath) -> Optional[bpy.types.Image]:
+    key = texture_path.as_posix().lower()
+    for _ in range(2):
+        registry = _get_texture_registry()
+        name = registry.images.get(key, None)
+        if name is None:
+            return None
+        image = bpy.data.images.get(name, None)
+        if image is not None and (full_path := image.get('full_path')) is not None and full_path.lower() == key:
+            return image
+        # Image was renamed or removed outside importer, index is stale
+        reset_texture_registry()
+    return None
+
+
+def sync_decoded_texture_cache():
+    """Point texture decoders to decoded texture cache configured in scene settings, disable it when unset."""
+    scene = bpy.context.scene
+    cache = get_decoded_texture_cache()
+    if scene.DecodedTextureCachePath == "":
+        if cache is not None:
+            set_decoded_texture_cache(None)
+        return
+    cache_dir = TinyPath(bpy.path.abspath(scene.DecodedTextureCachePath))
+    budget = scene.DecodedTextureCacheSize * 1024 * 1024
+    if cache is None or cache.cache_dir != cache_dir:
+        set_decoded_texture_cache(DecodedTextureCache(cache_dir, budget))
+    else:
+        cache.budget = budget
 
 
 def check_texture_cache(texture_path: TinyPath) -> Optional[bpy.types.Image]:
-    for image_existing in bpy.data.images:
-        if (fp := image_existing.get('full_path')) is None:
-            continue
-        if fp.lower() == texture_path.lower():
-            return image_existing
+    texture_path = TinyPath(texture_path)
+    image = _find_registered_image(texture_path)
+    if image is not None:
+        return image
 
     short_name = _get_texture(texture_path)
     if short_name is not None:
@@ -49,22 +124,20 @@ def check_texture_cache(texture_path: TinyPath) -> Optional[bpy.types.Image]:
             return bpy.data.images[f'{short_name}.hdr']
     if bpy.context.scene.TextureCachePath == "":
         return None
-    image = None
-    full_path = TinyPath(bpy.context.scene.TextureCachePath) / texture_path.with_suffix(".png")
-    if full_path.exists():
-        image = bpy.data.images.load(full_path.as_posix(), check_existing=True)
-    full_path = full_path.with_suffix(".hdr")
-    if full_path.exists():
-        image = bpy.data.images.load(full_path.as_posix(), check_existing=True)
-    full_path = full_path.with_suffix(".tga")
-    if full_path.exists():
-        image = bpy.data.images.load(full_path.as_posix(), check_existing=True)
-    if image is None:
-        return
+    base_path = TinyPath(bpy.context.scene.TextureCachePath) / texture_path
+    # Later formats used to take precedence when several were present, probe them first and stop at first hit
+    for suffix in (".tga", ".hdr", ".exr", ".png"):
+        full_path = base_path.with_suffix(suffix)
+        if os.path.isfile(full_path):
+            image = bpy.data.images.load(full_path.as_posix(), check_existing=True)
+            break
+    else:
+        return None
     logger.info(f"Loaded {texture_path!r} texture from disc")
     image.alpha_mode = "CHANNEL_PACKED"
     image.name = texture_path.stem
     image['full_path'] = texture_path.lower()
+    _register_image(image)
     return image
 
 
@@ -98,5 +171,6 @@ def create_and_cache_texture(texture_path: TinyPath, dimensions: tuple[int, int]
         image.alpha_mode = 'CHANNEL_PACKED'
         logger.info(f"Save {texture_path.as_posix()!r} texture to memory")
     image['full_path'] = texture_path.as_posix().lower()
+    _register_image(image)
 
     return image
@@ -1,3 +1,4 @@
 from .gma import GMA, check_gma
 from .hfsv1 import HFS
 from .hfsv2 import HFSv2
+from .vpk import VPKDirectory
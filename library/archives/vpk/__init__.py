@@ -0,0 +1,85 @@
+from SourceIO.library.utils import FileBuffer, MemoryBuffer
+from SourceIO.library.utils.exceptions import InvalidFileMagic
+from SourceIO.library.utils.tiny_path import TinyPath
+
+# archive index, offset, size, preload offset in directory file, preload size
+VPKEntry = tuple[int, int, int, int, int]
+
+
+class VPKDirectory:
+    """Reads only the directory tree of a *_dir.vpk, file data is read from archives on request."""
+    MAGIC = 0x55AA1234
+    EMBEDDED_ARCHIVE = 0x7FFF
+
+    def __init__(self, filepath: TinyPath):
+        self.filepath = filepath
+        self.version = 0
+        self.data_offset = 0
+        self.entries: dict[str, VPKEntry] = {}
+
+    @classmethod
+    def from_entries(cls, filepath: TinyPath, data_offset: int, entries: dict[str, VPKEntry]) -> 'VPKDirectory':
+        self = cls(filepath)
+        self.data_offset = data_offset
+        self.entries = entries
+        return self
+
+    @property
+    def files(self) -> list[str]:
+        return list(self.entries)
+
+    def read(self):
+        with FileBuffer(self.filepath) as buffer:
+            magic, self.version, tree_size = buffer.read_fmt("3I")
+            if magic != self.MAGIC:
+                raise InvalidFileMagic("Not a VPK file", self.MAGIC.to_bytes(4, "little"), magic.to_bytes(4, "little"))
+            if self.version == 2:
+                buffer.skip(16)
+            elif self.version != 1:
+                raise NotImplementedError(f"Unsupported VPK version {self.version}")
+            tree_offset = buffer.tell()
+            tree = buffer.read(tree_size)
+        self.data_offset = tree_offset + tree_size
+        self.entries = self._read_tree(MemoryBuffer(tree), tree_offset)
+        return self
+
+    @staticmethod
+    def _read_tree(buffer: MemoryBuffer, tree_offset: int) -> dict[str, VPKEntry]:
+        entries = {}
+        while ext := buffer.read_nt_string():
+            ext = "" if ext == " " else "." + ext
+            while path := buffer.read_nt_string():
+                path = "" if path == " " else path.strip("/") + "/"
+                while name := buffer.read_nt_string():
+                    # crc, preload size, archive index, offset, size, terminator
+                    _, preload_size, archive_index, offset, size, _ = buffer.read_fmt("IHHIIH")
+                    entries[(path + name + ext).lower()] = (archive_index, offset, size,
+                                                            tree_offset + buffer.tell(), preload_size)
+                    buffer.skip(preload_size)
+        return entries
+
+    def _archive_path(self, archive_index: int) -> TinyPath:
+        if archive_index == self.EMBEDDED_ARCHIVE:
+            return self.filepath
+        stem = self.filepath.stem
+        if stem.endswith("_dir"):
+            stem = stem[:-4]
+        return self.filepath.with_name(f"{stem}_{archive_index:03}.vpk")
+
+    def read_file(self, filepath: TinyPath | str) -> bytes | None:
+        entry = self.entries.get(TinyPath(filepath).as_posix().lower(), None)
+        if entry is None:
+            return None
+        archive_index, offset, size, preload_offset, preload_size = entry
+        data = b""
+        if preload_size:
+            with FileBuffer(self.filepath) as buffer:
+                buffer.seek(preload_offset)
+                data = buffer.read(preload_size)
+        if size:
+            if archive_index == self.EMBEDDED_ARCHIVE:
+                offset += self.data_offset
+            with FileBuffer(self._archive_path(archive_index)) as buffer:
+                buffer.seek(offset)
+                data += buffer.read(size)
+        return data
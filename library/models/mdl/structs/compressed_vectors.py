@@ -1,8 +1,15 @@
 import math
 
+import numpy as np
+import numpy.typing as npt
+
 from SourceIO.library.utils import Buffer
 
 
+def _restore_w(x: npt.NDArray, y: npt.NDArray, z: npt.NDArray) -> npt.NDArray:
+    return np.sqrt(np.maximum(1.0 - x * x - y * y - z * z, 0.0))
+
+
 class Quat:
     @staticmethod
     def read(buffer: Buffer):
@@ -25,6 +32,17 @@ class Quat64(Quat):
         w = wn * math.sqrt(1.0 - x * x - y * y - z * z)
         return x, y, z, w
 
+    @staticmethod
+    def decode(raw: npt.NDArray[np.uint32]) -> npt.NDArray[np.float32]:
+        """Decode (..., 2) array of packed uint32 pairs into (..., 4) XYZW quaternions."""
+        b0 = raw[..., 0].astype(np.int64)
+        b1 = raw[..., 1].astype(np.int64)
+        x = ((b0 & 0x1FFFFF) - 1048576) * (1 / 1048576.5)
+        y = ((((b1 & 0x03FF) << 11) | (b0 >> 21)) - 1048576) * (1 / 1048576.5)
+        z = (((b1 >> 10) & 0x1FFFFF) - 1048576) * (1 / 1048576.5)
+        w = np.where(b1 & 0x80000000, -1.0, 1.0) * _restore_w(x, y, z)
+        return np.stack((x, y, z, w), axis=-1).astype(np.float32)
+
 
 class Quat48(Quat):
     @staticmethod
@@ -41,6 +59,16 @@ class Quat48(Quat):
             w = -w
         return x, y, z, w
 
+    @staticmethod
+    def decode(raw: npt.NDArray[np.uint16]) -> npt.NDArray[np.float32]:
+        """Decode (..., 3) array of packed uint16 triplets into (..., 4) XYZW quaternions."""
+        raw = raw.astype(np.int64)
+        x = (raw[..., 0] - 32768) * (1 / 32768)
+        y = (raw[..., 1] - 32768) * (1 / 32768)
+        z = ((raw[..., 2] & 0x7FFF) - 16384) * (1 / 16384)
+        w = np.where(raw[..., 2] & 0x8000, -1.0, 1.0) * _restore_w(x, y, z)
+        return np.stack((x, y, z, w), axis=-1).astype(np.float32)
+
 
 class Quat48S(Quat):
     SCALE48S = 23168.0
@@ -69,3 +97,17 @@ class Quat48S(Quat):
         if d_neg:
             quat[id] = -quat[id]
         return quat
+
+    @staticmethod
+    def decode(raw: npt.NDArray[np.uint16]) -> npt.NDArray[np.float32]:
+        """Decode (..., 3) array of packed uint16 triplets into (..., 4) quaternions."""
+        raw = raw.astype(np.int64)
+        a = ((raw[..., 0] & 0x7FFF) - Quat48S.SHIFT48S) * (1 / Quat48S.SCALE48S)
+        b = ((raw[..., 1] & 0x7FFF) - Quat48S.SHIFT48S) * (1 / Quat48S.SCALE48S)
+        c = ((raw[..., 2] & 0x7FFF) - Quat48S.SHIFT48S) * (1 / Quat48S.SCALE48S)
+        d = np.where(raw[..., 2] & 0x8000, -1.0, 1.0) * _restore_w(a, b, c)
+        # Components are stored rotated, first one goes to index given by high bits of first two values
+        first = ((raw[..., 1] >> 15) + (raw[..., 0] >> 15) * 2)[..., None]
+        quat = np.empty(raw.shape[:-1] + (4,), np.float64)
+        np.put_along_axis(quat, (first + np.arange(4)) % 4, np.stack((a, b, c, d), axis=-1), axis=-1)
+        return quat.astype(np.float32)
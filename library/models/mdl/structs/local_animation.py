@@ -79,6 +79,56 @@ def quat_mult(q1, q2):
     return np.vstack((w, x, y, z)).T
 
 
+def _decode_half3(raw: np.ndarray) -> np.ndarray:
+    return raw.view("<f2").astype(np.float32)
+
+
+def _decode_float3(raw: np.ndarray) -> np.ndarray:
+    return raw.view("<f4")
+
+
+# Values stored for every bone of frame animations, in storage order: flag, size, field, (raw dtype, decoder)
+_FRAME_ANIM_VALUES = (
+    (AniBoneFlags.ANIM_ROT2, 6, "rot", ("<u2", Quat48S.decode)),
+    (AniBoneFlags.ANIM_ROT, 6, "rot", ("<u2", Quat48.decode)),
+    (AniBoneFlags.ANIM_POS, 6, "pos", ("<u1", _decode_half3)),
+    (AniBoneFlags.FULL_ANIM_POS, 12, "pos", ("<u1", _decode_float3)),
+)
+_FRAME_ANIM_CONSTANTS = (
+    (AniBoneFlags.CONST_ROT2, 6, "rot", ("<u2", Quat48S.decode)),
+    (AniBoneFlags.RAW_ROT, 6, "rot", ("<u2", Quat48.decode)),
+    (AniBoneFlags.RAW_POS, 6, "pos", ("<u1", _decode_half3)),
+    (AniBoneFlags.CONST_POS2, 12, "pos", ("<u1", _decode_float3)),
+)
+
+
+def _read_bone_values(buffer: Buffer, bones: list[Bone], bone_flags: list[AniBoneFlags], frame_count: int,
+                      value_layout: tuple) -> np.ndarray:
+    """Read frame_count records of interleaved per bone values in one go and decode every value kind at once."""
+    bone_ids = [[] for _ in value_layout]
+    offsets = [[] for _ in value_layout]
+    stride = 0
+    for bone in bones:
+        flag = bone_flags[bone.bone_id]
+        for i, (value_flag, size, _, _) in enumerate(value_layout):
+            if flag & value_flag:
+                bone_ids[i].append(bone.bone_id)
+                offsets[i].append(stride)
+                stride += size
+
+    output = np.zeros((frame_count, len(bones)), ANIM_DTYPE)
+    if stride == 0:
+        return output
+    data = np.frombuffer(buffer.read(stride * frame_count), np.uint8).reshape((frame_count, stride))
+    for (_, size, field, (raw_dtype, decoder)), value_bone_ids, value_offsets in zip(value_layout, bone_ids, offsets):
+        if not value_bone_ids:
+            continue
+        columns = np.asarray(value_offsets)[:, None] + np.arange(size)
+        raw = np.ascontiguousarray(data[:, columns]).view(raw_dtype)
+        output[field][:, value_bone_ids] = decoder(raw)
+    return output
+
+
 @dataclass(slots=True)
 class StudioAnimDesc:
     _entry_offset: int
@@ -177,40 +227,15 @@ class StudioAnimDesc:
         entry_offset = buffer.tell()
         frame_anim = StudioFrameAnim.from_buffer(buffer)
         bone_flags = [AniBoneFlags(buffer.read_uint8()) for _ in bones]
-        constant_info = np.zeros((1, len(bones),), ANIM_DTYPE)
         if frame_anim.constant_offset > 0:
             assert frame_anim.frame_length == 0
             buffer.seek(entry_offset + frame_anim.constant_offset)
-            for bone in bones:
-                flag = bone_flags[bone.bone_id]
-                if flag & AniBoneFlags.CONST_ROT2:
-                    constant_info[0, bone.bone_id]["rot"] = Quat48S.read(buffer)
-                if flag & AniBoneFlags.RAW_ROT:
-                    constant_info[0, bone.bone_id]["rot"] = Quat48.read(buffer)
-                if flag & AniBoneFlags.RAW_POS:
-                    constant_info[0, bone.bone_id]["pos"] = buffer.read_fmt("3e")
-                if flag & AniBoneFlags.CONST_POS2:
-                    constant_info[0, bone.bone_id]["pos"] = buffer.read_fmt("3f")
-            return constant_info
+            return _read_bone_values(buffer, bones, bone_flags, 1, _FRAME_ANIM_CONSTANTS)
 
         elif frame_anim.frame_offset != 0 and frame_anim.frame_length > 0:
-            section_frame_buffer = np.zeros((section_frame_count, len(bones)), ANIM_DTYPE)
-
             assert frame_anim.constant_offset == 0
             buffer.seek(entry_offset + frame_anim.frame_offset)
-            for frame_id in range(section_frame_count):
-                for bone in bones:
-                    bone_flag = bone_flags[bone.bone_id]
-
-                    if bone_flag & AniBoneFlags.ANIM_ROT2:
-                        section_frame_buffer[frame_id, bone.bone_id]["rot"] = Quat48S.read(buffer)
-                    if bone_flag & AniBoneFlags.ANIM_ROT:
-                        section_frame_buffer[frame_id, bone.bone_id]["rot"] = Quat48.read(buffer)
-                    if bone_flag & AniBoneFlags.ANIM_POS:
-                        section_frame_buffer[frame_id, bone.bone_id]["pos"] = buffer.read_fmt("3e")
-                    if bone_flag & AniBoneFlags.FULL_ANIM_POS:
-                        section_frame_buffer[frame_id, bone.bone_id]["pos"] = buffer.read_fmt("3f")
-            return section_frame_buffer
+            return _read_bone_values(buffer, bones, bone_flags, section_frame_count, _FRAME_ANIM_VALUES)
 
     def _read_anim_rot_value(self, buffer: Buffer, flags: AnimBoneFlags, frame_count: int, base_quat: Vector4,
                              base_rot: Vector3, rot_scale: Vector3) -> list[Vector4]:
@@ -281,9 +306,9 @@ class StudioAnimDesc:
 
         section_frame_buffer = np.zeros((section_frame_count, len(bones)), ANIM_DTYPE)
 
-        for bone in bones:
-            section_frame_buffer[:, bone.bone_id]["rot"] = bone.quat
-            section_frame_buffer[:, bone.bone_id]["pos"] = bone.position
+        bone_ids = [bone.bone_id for bone in bones]
+        section_frame_buffer["rot"][:, bone_ids] = [bone.quat for bone in bones]
+        section_frame_buffer["pos"][:, bone_ids] = [bone.position for bone in bones]
 
         for _ in bones:
             bone_entry = buffer.tell()
@@ -319,19 +344,27 @@ class StudioAnimDesc:
         return section_frame_buffer
 
     def _read_rle_compressed_data(self, buffer: Buffer, frame_count: int):
-        valid, total = buffer.read_fmt("2B")
+        # Every run covers at least as many frames as it stores values, last run may store up to 255 extra
+        data = bytes(buffer.read_view(min(4 * frame_count + 512, buffer.remaining())))
+        chunks = []
+        # Leading zero is what runs without stored values repeat when they come first
+        counts = [0]
+        pos = 0
         frame_offset = 0
-        all_shorts = np.zeros(frame_count + 1, np.int16)
         while frame_offset < frame_count:
+            valid, total = data[pos], data[pos + 1]
+            pos += 2
             if valid > 0:
-                all_shorts[frame_offset:frame_offset + valid] = buffer.read_fmt(f"{valid}h")
+                chunks.append(data[pos:pos + valid * 2])
+                counts.extend([1] * valid)
+                pos += valid * 2
                 frame_offset += valid
             if total - valid > 0:
-                repeat_frames = total - valid
-                all_shorts[frame_offset:frame_offset + repeat_frames] = all_shorts[frame_offset - 1]
-                frame_offset += repeat_frames
-            valid, total = buffer.read_fmt("2B")
-        return all_shorts[:-1]
+                counts[-1] += total - valid
+                frame_offset += total - valid
+        values = np.frombuffer(b"".join(chunks), "<i2")
+        values = np.concatenate((np.zeros(1, np.int16), values))
+        return np.repeat(values, counts)[:frame_count]
 
     def _read_mdl_anim_values(self, buffer: Buffer, frame_count: int, scale: float):
         values = self._read_rle_compressed_data(buffer, frame_count)
@@ -5,7 +5,6 @@ import numpy as np
 import numpy.typing as npt
 
 from SourceIO.library.utils import Buffer
-from .fixup import Fixup
 from .header import Header
 
 
@@ -33,6 +32,58 @@ class ExtraVertexAttribute:
     item_size: int
 
 
+class VvdLodData:
+    """Per LOD vertex arrays of VVD, built from base vertices only when a LOD is requested.
+
+    Each LOD is a gather of fixup ranges that are active for it. Without fixups, or when they form a single
+    contiguous range, LOD is a view of base vertex array instead of a copy.
+    """
+    __slots__ = ("vertices", "fixups", "lod_count", "_cache")
+
+    def __init__(self, vertices: npt.NDArray, fixups: npt.NDArray, lod_count: int):
+        self.vertices = vertices
+        self.fixups = fixups
+        self.lod_count = lod_count
+        self._cache: dict[int, npt.NDArray] = {}
+
+    def get_index(self, lod_id: int) -> npt.NDArray[np.uint32] | slice:
+        """Indices of base vertices that make up LOD, slice when they are contiguous."""
+        if not 0 <= lod_id < self.lod_count:
+            raise IndexError(f"LOD {lod_id} out of range, model has {self.lod_count} LODs")
+        if self.fixups.size == 0:
+            return slice(0, self.vertices.size)
+        fixups = self.fixups[self.fixups["lod_index"] >= lod_id]
+        starts = fixups["vertex_index"].astype(np.int64)
+        counts = fixups["vertex_count"].astype(np.int64)
+        ends = starts + counts
+        if ends.size and ends.max() > self.vertices.size:
+            raise ValueError(f"Fixup range {ends.max()} is out of {self.vertices.size} vertices")
+        if starts.size == 0:
+            return slice(0, 0)
+        if np.all(starts[1:] == ends[:-1]):
+            return slice(int(starts[0]), int(ends[-1]))
+        # Concatenation of ranges: running index shifted by start of range each element belongs to
+        offsets = np.cumsum(counts) - counts
+        return (np.repeat(starts - offsets, counts) + np.arange(counts.sum())).astype(np.uint32)
+
+    def __getitem__(self, lod_id: int) -> npt.NDArray:
+        if lod_id < 0:
+            lod_id += self.lod_count
+        lod_data = self._cache.get(lod_id)
+        if lod_data is None:
+            index = self.get_index(lod_id)
+            lod_data = self.vertices[index] if isinstance(index, slice) else self.vertices.take(index)
+            self._cache[lod_id] = lod_data
+        return lod_data
+
+    def __len__(self):
+        return self.lod_count
+
+    def __iter__(self):
+        for lod_id in range(self.lod_count):
+            yield self[lod_id]
+
+
 @dataclass(slots=True)
 class Vvd:
     vertex_t = np.dtype([('weight', np.float32, 3),
@@ -42,11 +93,19 @@ class Vvd:
                          ("normal", np.float32, 3),
                          ("uv", np.float32, 2),
                          ])
+    fixup_t = np.dtype([("lod_index", np.uint32),
+                        ("vertex_index", np.uint32),
+                        ("vertex_count", np.uint32),
+                        ])
 
     header: Header
-    lod_data: list[npt.NDArray[vertex_t]]
+    lod_data: VvdLodData
     extra_data: dict[ExtraAttributeTypes, npt.NDArray]
 
+    @property
+    def vertices(self) -> npt.NDArray[vertex_t]:
+        return self.lod_data.vertices
+
     @classmethod
     def from_buffer(cls, buffer: Buffer) -> 'Vvd':
         assert buffer.size() > 0
@@ -57,30 +116,9 @@ class Vvd:
         vertices = np.frombuffer(buffer.read(cls.vertex_t.itemsize * header.lod_vertex_count[0]),
                                  dtype=cls.vertex_t)
 
-        lod_datas = []
-        for count in header.lod_vertex_count[:header.lod_count]:
-            lod_datas.append(np.zeros((count,), dtype=cls.vertex_t))
-
         buffer.seek(header.fixup_table_offset)
-        fixups = [Fixup.from_buffer(buffer) for _ in range(header.fixup_count)]
-
-        if header.fixup_count:
-            lod_offsets = np.zeros(len(lod_datas), dtype=np.uint32)
-            for lod_id in range(header.lod_count):
-                for fixup in fixups:
-                    if fixup.lod_index >= lod_id:
-                        lod_data = lod_datas[lod_id]
-                        assert fixup.vertex_index + fixup.vertex_count <= vertices.size, \
-                            f"{fixup.vertex_index + fixup.vertex_count}>{vertices.size}"
-                        lod_offset = lod_offsets[lod_id]
-                        vertex_index = fixup.vertex_index
-                        vertex_count = fixup.vertex_count
-                        lod_data[lod_offset:lod_offset + vertex_count] = vertices[
-                                                                         vertex_index:vertex_index + vertex_count]
-                        lod_offsets[lod_id] += fixup.vertex_count
-
-        else:
-            lod_datas[0][:] = vertices[:]
+        fixups = np.frombuffer(buffer.read(cls.fixup_t.itemsize * header.fixup_count), dtype=cls.fixup_t)
+        lod_data = VvdLodData(vertices, fixups, header.lod_count)
 
         if header.tangent_data_offset > 0:
             buffer.seek(header.tangent_data_offset)
@@ -99,4 +137,4 @@ class Vvd:
                     buffer.read(extra_attribute.item_size * header.lod_vertex_count[0]), np.float32)
         # assert not buffer
 
-        return cls(header, lod_datas, extra_data)
+        return cls(header, lod_data, extra_data)
@@ -0,0 +1,155 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from SourceIO.library.utils import Buffer, TinyPath
+
+DEFAULT_CACHE_BUDGET = 256 * 1024 * 1024
+# Most entries are open file handles rather than memory, cap their number so small files can not exhaust descriptors
+DEFAULT_CACHE_MAX_ENTRIES = 256
+
+# Materials are tiny compared to textures, giving them their own pool keeps them from being pushed out by VTF/vtex data
+DEFAULT_TYPE_BUDGETS = {
+    ".vmt": 16 * 1024 * 1024,
+    ".vmat_c": 16 * 1024 * 1024,
+}
+
+
+def normalize_cache_key(filepath: TinyPath | str) -> str:
+    return TinyPath(filepath).as_posix().lower()
+
+
+@dataclass(slots=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+
+class _CachePool:
+    __slots__ = ("budget", "max_entries", "used", "entries")
+
+    def __init__(self, budget: int, max_entries: int):
+        self.budget = budget
+        self.max_entries = max_entries
+        self.used = 0
+        self.entries: OrderedDict[str, tuple[Buffer, int]] = OrderedDict()
+
+
+class LRUBufferCache:
+    """Least recently used cache of file buffers with a byte budget and a limit on number of entries.
+
+    Entries are keyed by normalized lowercase path. File types listed in ``type_budgets`` (by suffix)
+    get a separate pool with its own budget, everything else shares the default pool.
+    Every pool holds at most ``max_entries`` buffers.
+    """
+
+    def __init__(self, budget: int = DEFAULT_CACHE_BUDGET, type_budgets: Optional[dict[str, int]] = None,
+                 max_entries: int = DEFAULT_CACHE_MAX_ENTRIES):
+        self.stats = CacheStats()
+        self.max_entries = max_entries
+        self._default_pool = _CachePool(budget, max_entries)
+        self._type_pools: dict[str, _CachePool] = {}
+        for suffix, type_budget in (DEFAULT_TYPE_BUDGETS if type_budgets is None else type_budgets).items():
+            self.set_type_budget(suffix, type_budget)
+
+    @property
+    def budget(self) -> int:
+        return self._default_pool.budget + sum(pool.budget for pool in self._type_pools.values())
+
+    @property
+    def used(self) -> int:
+        return self._default_pool.used + sum(pool.used for pool in self._type_pools.values())
+
+    def set_type_budget(self, suffix: str, budget: int):
+        suffix = suffix.lower()
+        pool = self._type_pools.get(suffix)
+        if pool is None:
+            self._type_pools[suffix] = _CachePool(budget, self.max_entries)
+            return
+        pool.budget = budget
+        self._shrink(pool)
+
+    def _get_pool(self, key: str) -> _CachePool:
+        return self._type_pools.get(TinyPath(key).suffix, self._default_pool)
+
+    def get(self, filepath: TinyPath | str) -> Optional[Buffer]:
+        key = normalize_cache_key(filepath)
+        pool = self._get_pool(key)
+        entry = pool.entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        buffer, size = entry
+        if buffer.closed:
+            del pool.entries[key]
+            pool.used -= size
+            self.stats.misses += 1
+            return None
+        pool.entries.move_to_end(key)
+        self.stats.hits += 1
+        buffer.seek(0)
+        return buffer
+
+    def put(self, filepath: TinyPath | str, buffer: Buffer):
+        key = normalize_cache_key(filepath)
+        pool = self._get_pool(key)
+        size = buffer.size()
+        if size > pool.budget:
+            return
+        if (old_entry := pool.entries.pop(key, None)) is not None:
+            pool.used -= old_entry[1]
+        pool.entries[key] = buffer, size
+        pool.used += size
+        self._shrink(pool)
+
+    def _shrink(self, pool: _CachePool):
+        while (pool.used > pool.budget or len(pool.entries) > pool.max_entries) and pool.entries:
+            _, (_, size) = pool.entries.popitem(last=False)
+            pool.used -= size
+            self.stats.evictions += 1
+
+    def __contains__(self, filepath: TinyPath | str):
+        key = normalize_cache_key(filepath)
+        return key in self._get_pool(key).entries
+
+    def __len__(self):
+        return len(self._default_pool.entries) + sum(len(pool.entries) for pool in self._type_pools.values())
+
+    def clear(self):
+        for pool in (self._default_pool, *self._type_pools.values()):
+            pool.entries.clear()
+            pool.used = 0
+
+
+class NegativeLookupCache:
+    """Set of normalized paths that no mounted provider could resolve.
+
+    Must be cleared whenever the set of mounted providers changes.
+    """
+
+    def __init__(self):
+        self._missing: set[str] = set()
+        self.saved_lookups = 0
+
+    def is_missing(self, filepath: TinyPath | str) -> bool:
+        if normalize_cache_key(filepath) in self._missing:
+            self.saved_lookups += 1
+            return True
+        return False
+
+    def add(self, filepath: TinyPath | str):
+        self._missing.add(normalize_cache_key(filepath))
+
+    def __len__(self):
+        return len(self._missing)
+
+    def clear(self):
+        self._missing.clear()
@@ -2,7 +2,11 @@ from collections import Counter
 from hashlib import md5
 from typing import Optional, TypeVar, Union
 
+from SourceIO.library.shared.content_manager.cache import DEFAULT_CACHE_MAX_ENTRIES, LRUBufferCache, CacheStats, \
+    NegativeLookupCache, normalize_cache_key
 from SourceIO.library.shared.content_manager.detectors import detect_game
+from SourceIO.library.shared.content_manager.manifest import count_known_listings, get_manifest_path, \
+    load_mount_manifest, save_mount_manifest
 from SourceIO.library.shared.content_manager.provider import ContentProvider
 from SourceIO.library.shared.content_manager.providers import register_provider
 from SourceIO.library.shared.content_manager.providers.hfs_provider import HFS1ContentProvider, HFS2ContentProvider
@@ -23,8 +27,6 @@ logger = log_manager.get_logger('ContentManager')
 AnyContentDetector = TypeVar('AnyContentDetector', bound='ContentDetector')
 AnyContentProvider = TypeVar('AnyContentProvider', bound='ContentProvider')
 
-MAX_CACHE_SIZE = 16
-
 
 def get_loose_file_fs_root(path: TinyPath):
     return get_mod_path(path)
@@ -43,17 +45,26 @@ class ContentManager(ContentProvider, metaclass=SingletonMeta):
     def check(self, filepath: TinyPath) -> bool:
         if filepath.is_absolute():
             return filepath.exists()
-        for child in self.children:
+        if self._missing.is_missing(filepath):
+            return False
+        indexed, children = self._get_lookup_order(filepath)
+        if indexed is not None:
+            return True
+        for child in children:
             if child.check(filepath):
                 return True
+        self._missing.add(filepath)
         return False
 
     def get_provider_from_path(self, filepath):
         if filepath.is_absolute():
             filepath = self.get_relative_path(filepath)
-        for child in self.children:
+        indexed, children = self._get_lookup_order(filepath)
+        for child in children:
             if provider := child.get_provider_from_path(filepath):
                 return provider
+        if indexed is not None:
+            return indexed[0]
 
     def get_steamid_from_asset(self, asset_path: TinyPath) -> ContentProvider | None:
         if asset_path.is_absolute():
@@ -68,7 +79,94 @@ class ContentManager(ContentProvider, metaclass=SingletonMeta):
         super().__init__(TinyPath("."))
         self.children: list[ContentProvider] = []
         self._steam_id = -1
-        self._cache: dict[TinyPath, Buffer] = {}
+        self._cache = LRUBufferCache()
+        self._missing = NegativeLookupCache()
+        self.use_path_index = False
+        self._path_index: Optional[dict[str, tuple[int, ContentProvider, ContentProvider]]] = None
+        self._index_fallback: list[tuple[int, ContentProvider]] = []
+        self.use_mount_manifest = False
+        # Manifest path -> providers stored in it and number of their directory listings it holds
+        self._manifests: dict[TinyPath, tuple[list[ContentProvider], int]] = {}
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        return self._cache.stats
+
+    @property
+    def saved_lookups(self) -> int:
+        """Number of lookups answered by the negative cache without querying providers since last log_stats."""
+        return self._missing.saved_lookups
+
+    def log_stats(self):
+        """Log file and negative lookup cache counters collected since previous call and reset them."""
+        stats = self._cache.stats
+        if stats.hits or stats.misses:
+            logger.info(f"File cache: {stats.hits} hits, {stats.misses} misses ({stats.hit_rate:.1%} hit rate), "
+                        f"{stats.evictions} evictions, {len(self._cache)} buffers cached")
+        self._cache.stats = CacheStats()
+        if self._missing.saved_lookups:
+            logger.info(f"Negative lookup cache: {self._missing.saved_lookups} provider lookups skipped, "
+                        f"{len(self._missing)} missing paths known")
+        self._missing.saved_lookups = 0
+
+    def set_cache_budget(self, budget: int, type_budgets: Optional[dict[str, int]] = None,
+                         max_entries: int = DEFAULT_CACHE_MAX_ENTRIES):
+        self._cache = LRUBufferCache(budget, type_budgets, max_entries)
+
+    def enable_path_index(self, enabled: bool = True):
+        """Resolve files through a merged index of all mounted providers instead of querying each of them.
+
+        Index is built on first lookup after mounts change. Providers that can not enumerate their content,
+        or can resolve paths not present in their listing, are still queried when the index has no entry
+        or when they come before the indexed provider in search order.
+        """
+        if self.use_path_index != enabled:
+            self.use_path_index = enabled
+            self._path_index = None
+
+    def _rebuild_path_index(self):
+        index: dict[str, tuple[int, ContentProvider, ContentProvider]] = {}
+        fallback = []
+        for rank, child in enumerate(self.children):
+            child_index = child.build_path_index()
+            if child_index is None:
+                fallback.append((rank, child))
+                continue
+            if not child.path_index_complete:
+                fallback.append((rank, child))
+            for path, provider in child_index.items():
+                # Children are visited in search order, first one to list the path wins
+                if path not in index:
+                    index[path] = rank, child, provider
+        logger.info(f"Indexed {len(index)} files from {len(self.children)} providers")
+        self._path_index = index
+        self._index_fallback = fallback
+        # Store directory listings that became known, so next session can skip scanning them
+        for manifest_path, (providers, known_listings) in self._manifests.items():
+            listing_count = count_known_listings(providers)
+            if listing_count != known_listings and save_mount_manifest(manifest_path, providers, self._steam_id):
+                self._manifests[manifest_path] = providers, listing_count
+
+    def _get_lookup_order(self, filepath: TinyPath) -> tuple[Optional[tuple[ContentProvider, ContentProvider]],
+                                                              list[ContentProvider]]:
+        """Returns indexed (child, provider) pair for filepath if any and list of children to query before it.
+
+        Children that could not be fully indexed still take priority over the indexed one if they come earlier
+        in search order, without an index entry all of them are returned.
+        """
+        if not self.use_path_index:
+            return None, self.children
+        if self._path_index is None:
+            self._rebuild_path_index()
+        entry = self._path_index.get(normalize_cache_key(filepath))
+        if entry is None:
+            return None, [child for _, child in self._index_fallback]
+        indexed_rank, child, provider = entry
+        return (child, provider), [child for rank, child in self._index_fallback if rank < indexed_rank]
+
+    def _on_mounts_changed(self):
+        self._missing.clear()
+        self._path_index = None
 
     def _find_steam_appid(self, path: TinyPath):
         if self._steam_id != -1:
@@ -93,12 +191,48 @@ class ContentManager(ContentProvider, metaclass=SingletonMeta):
                 return rel_path
         return None
 
+    def enable_mount_manifest(self, enabled: bool = True):
+        """Store mounted providers in a manifest next to the game root and reuse them on next scan of the same root.
+
+        Manifest is validated against size and mtime of every gameinfo and archive it was built from,
+        and mtime of every directory scanned to find them.
+        """
+        self.use_mount_manifest = enabled
+
+    @staticmethod
+    def _get_manifest_root(scan_path: TinyPath) -> TinyPath:
+        root_path = get_loose_file_fs_root(scan_path)
+        if not root_path.is_dir():
+            root_path = root_path.parent
+        return root_path
+
     def scan_for_content(self, scan_path: TinyPath):
+        if not self.use_mount_manifest:
+            self._scan_for_content(scan_path)
+            return
+        manifest_path = get_manifest_path(self._get_manifest_root(scan_path))
+        if (manifest := load_mount_manifest(manifest_path)) is not None:
+            providers, steam_id = manifest
+            for provider in providers:
+                logger.info(f"Mounted from manifest: {provider}")
+                self.add_child(provider)
+            if self._steam_id == -1:
+                self._steam_id = steam_id
+            self._manifests[manifest_path] = providers, count_known_listings(providers)
+            return
+        children_count = len(self.children)
+        self._scan_for_content(scan_path)
+        providers = self.children[children_count:]
+        if providers and save_mount_manifest(manifest_path, providers, self._steam_id):
+            self._manifests[manifest_path] = providers, count_known_listings(providers)
+
+    def _scan_for_content(self, scan_path: TinyPath):
         providers = detect_game(scan_path)
         if providers:
             for provider in providers:
                 logger.info(f"Mounted: {provider}")
             self.children.extend(providers)
+            self._on_mounts_changed()
             return
         self._find_steam_appid(scan_path)
         if scan_path.suffix == '.vpk':
@@ -137,6 +271,7 @@ class ContentManager(ContentProvider, metaclass=SingletonMeta):
     def add_child(self, child: ContentProvider):
         if child not in self.children:
             self.children.append(child)
+            self._on_mounts_changed()
 
     def glob(self, pattern: str):
         for child in self.children:
@@ -148,21 +283,23 @@ class ContentManager(ContentProvider, metaclass=SingletonMeta):
             if filepath.exists():
                 return FileBuffer(filepath)
             return None
-        if (buffer := self._cache.get(filepath, None)) is not None:
-            if not buffer.closed:
-                buffer.seek(0)
-                return buffer
+        if (buffer := self._cache.get(filepath)) is not None:
+            return buffer
+        if self._missing.is_missing(filepath):
+            return None
         logger.debug(f'Requesting {filepath} file')
-        for child in self.children:
+        indexed, children = self._get_lookup_order(filepath)
+        if indexed is not None:
+            children = [*children, indexed[1]]
+        for child in children:
             if (file := child.find_file(filepath)) is not None:
                 logger.debug(f'Found in {child}!')
                 if do_not_cache:
                     return file
 
-                self._cache[filepath] = file
-                if len(self._cache) > MAX_CACHE_SIZE:
-                    self._cache.pop(next(iter(self._cache.keys())))
+                self._cache.put(filepath, file)
                 return file
+        self._missing.add(filepath)
         return None
 
     # TODO: MAYBE DEPRECATED
@@ -225,9 +362,14 @@ class ContentManager(ContentProvider, metaclass=SingletonMeta):
                 provider = LooseFilesContentProvider(t_path)
                 if provider not in self.children:
                     self.children.append(register_provider(provider))
+        self._on_mounts_changed()
 
     def clean(self):
+        self.log_stats()
         self.children.clear()
+        self._cache.clear()
+        self._manifests.clear()
+        self._on_mounts_changed()
         self._steam_id = -1
 
     @property
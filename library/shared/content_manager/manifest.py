@@ -0,0 +1,219 @@
+import json
+import os
+from stat import S_ISDIR as stat_is_dir
+from typing import Any, Optional
+
+from SourceIO.library.archives import VPKDirectory
+from SourceIO.library.shared.app_id import SteamAppId
+from SourceIO.library.shared.content_manager.provider import ContentProvider
+from SourceIO.library.shared.content_manager.providers import register_provider
+from SourceIO.library.shared.content_manager.providers.gma_provider import GMAContentProvider
+from SourceIO.library.shared.content_manager.providers.goldsrc_content_provider import GoldSrcContentProvider
+from SourceIO.library.shared.content_manager.providers.hfs_provider import HFS1ContentProvider, HFS2ContentProvider
+from SourceIO.library.shared.content_manager.providers.loose_files import LooseFilesContentProvider
+from SourceIO.library.shared.content_manager.providers.sbox_content_provider import SBoxAddonProvider, \
+    SBoxDownloadsProvider
+from SourceIO.library.shared.content_manager.providers.source1_gameinfo_provider import Source1GameInfoProvider
+from SourceIO.library.shared.content_manager.providers.source2_gameinfo_provider import Source2GameInfoProvider
+from SourceIO.library.shared.content_manager.providers.vpk_provider import VPKContentProvider
+from SourceIO.library.shared.content_manager.providers.zip_content_provider import ZIPContentProvider
+from SourceIO.library.utils import TinyPath
+from SourceIO.logger import SourceLogMan
+
+log_manager = SourceLogMan()
+logger = log_manager.get_logger('MountManifest')
+
+MANIFEST_VERSION = 3
+MANIFEST_NAME = "sourceio_mounts.json"
+
+_LOOSE_PROVIDERS = {cls.__name__: cls for cls in (LooseFilesContentProvider, GoldSrcContentProvider,
+                                                   SBoxAddonProvider, SBoxDownloadsProvider)}
+_ARCHIVE_PROVIDERS = {cls.__name__: cls for cls in (ZIPContentProvider, GMAContentProvider)}
+_HFS_PROVIDERS = {cls.__name__: cls for cls in (HFS1ContentProvider, HFS2ContentProvider)}
+
+
+def get_manifest_path(game_root: TinyPath) -> TinyPath:
+    return game_root / MANIFEST_NAME
+
+
+def _file_stamp(path: TinyPath) -> Optional[list[int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    if stat_is_dir(stat.st_mode):
+        # Directory contents are validated through the listing, only existence matters here
+        return [0, 0]
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _is_listing_valid(root: TinyPath, listing: dict[str, list]) -> bool:
+    for rel_dir, (mtime, _) in listing.items():
+        try:
+            if os.stat(root / rel_dir if rel_dir else root).st_mtime_ns != mtime:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _collect_scanned_dirs(providers: list[ContentProvider], dirs: set[str]):
+    """Collect directories that were listed while mounting providers, entries added to them change their mtime."""
+    for provider in providers:
+        filepath = provider.filepath
+        dirs.add(str(filepath.parent))
+        if os.path.isdir(filepath):
+            dirs.add(str(filepath))
+        if isinstance(provider, (Source1GameInfoProvider, Source2GameInfoProvider)):
+            # Search paths are resolved relative to the folder holding all mods
+            dirs.add(str(provider.root.parent))
+            _collect_scanned_dirs(provider.mount, dirs)
+
+
+def _dir_stamps(dirs: set[str]) -> dict[str, Optional[int]]:
+    stamps = {}
+    for path in sorted(dirs):
+        try:
+            stamps[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            stamps[path] = None
+    return stamps
+
+
+def _are_dirs_unchanged(stamps: dict[str, Optional[int]]) -> bool:
+    for path, mtime in stamps.items():
+        try:
+            if os.stat(path).st_mtime_ns != mtime:
+                return False
+        except OSError:
+            if mtime is not None:
+                return False
+    return True
+
+
+def count_known_listings(providers: list[ContentProvider]) -> int:
+    """Number of providers with directory listing known, manifest only needs rewriting when it grows."""
+    count = 0
+    for provider in providers:
+        if isinstance(provider, (Source1GameInfoProvider, Source2GameInfoProvider)):
+            count += count_known_listings(provider.mount)
+        elif isinstance(provider, VPKContentProvider):
+            count += provider.directory is not None
+        elif isinstance(provider, LooseFilesContentProvider):
+            count += provider.directory_listing is not None
+    return count
+
+
+def _serialize_provider(provider: ContentProvider) -> Optional[dict[str, Any]]:
+    class_name = provider.class_name()
+    data = {"type": class_name, "path": str(provider.filepath), "stamp": _file_stamp(provider.filepath)}
+    if isinstance(provider, (Source1GameInfoProvider, Source2GameInfoProvider)):
+        mount = [_serialize_provider(mount) for mount in provider.mount]
+        if None in mount:
+            return None
+        data["mount"] = mount
+        data["steam_id"] = int(provider.steam_id)
+        if isinstance(provider, Source1GameInfoProvider):
+            data["filesystem"] = provider.filesystem
+        else:
+            data["gameinfo"] = provider.data
+    elif class_name == VPKContentProvider.__name__:
+        data["steam_id"] = int(provider.steam_id)
+        directory = provider.directory
+        data["directory"] = None if directory is None else [directory.data_offset, directory.entries]
+    elif class_name in _LOOSE_PROVIDERS:
+        data["steam_id"] = int(provider.steam_id)
+        data["listing"] = provider.directory_listing
+    elif class_name in _ARCHIVE_PROVIDERS:
+        data["steam_id"] = int(provider.steam_id)
+    elif class_name not in _HFS_PROVIDERS:
+        return None
+    return data
+
+
+def _deserialize_provider(data: dict[str, Any]) -> Optional[ContentProvider]:
+    """Recreate provider from manifest entry, returns None if any of the files it was built from changed."""
+    filepath = TinyPath(data["path"])
+    if data["stamp"] is None or _file_stamp(filepath) != data["stamp"]:
+        return None
+    class_name = data["type"]
+    if class_name in (Source1GameInfoProvider.__name__, Source2GameInfoProvider.__name__):
+        mount = []
+        for mount_data in data["mount"]:
+            mount_provider = _deserialize_provider(mount_data)
+            if mount_provider is None:
+                return None
+            mount.append(mount_provider)
+        if class_name == Source1GameInfoProvider.__name__:
+            provider = Source1GameInfoProvider.from_mounts(filepath, data["filesystem"], mount)
+        else:
+            provider = Source2GameInfoProvider.from_mounts(filepath, data["gameinfo"], SteamAppId(data["steam_id"]),
+                                                           mount)
+    elif class_name == VPKContentProvider.__name__:
+        provider = VPKContentProvider(filepath, SteamAppId(data["steam_id"]))
+        if data["directory"] is not None:
+            data_offset, entries = data["directory"]
+            provider.directory = VPKDirectory.from_entries(filepath, data_offset, entries)
+    elif class_name in _LOOSE_PROVIDERS:
+        provider = _LOOSE_PROVIDERS[class_name](filepath, SteamAppId(data["steam_id"]))
+        listing = data["listing"]
+        if listing is not None and _is_listing_valid(provider.root, listing):
+            provider.directory_listing = listing
+    elif class_name in _ARCHIVE_PROVIDERS:
+        provider = _ARCHIVE_PROVIDERS[class_name](filepath, SteamAppId(data["steam_id"]))
+    elif class_name in _HFS_PROVIDERS:
+        provider = _HFS_PROVIDERS[class_name](filepath)
+    else:
+        return None
+    return register_provider(provider)
+
+
+def save_mount_manifest(manifest_path: TinyPath, providers: list[ContentProvider], steam_id: int) -> bool:
+    serialized = []
+    for provider in providers:
+        data = _serialize_provider(provider)
+        if data is None:
+            logger.debug(f"Can not store {provider} in mount manifest")
+            return False
+        serialized.append(data)
+    dirs = {str(manifest_path.parent)}
+    _collect_scanned_dirs(providers, dirs)
+    try:
+        with open(manifest_path, "w", encoding="utf8") as f:
+            # Stamp directories only after manifest file was created, creating it changes mtime of its folder
+            manifest = {"version": MANIFEST_VERSION, "steam_id": steam_id, "dirs": _dir_stamps(dirs),
+                        "providers": serialized}
+            json.dump(manifest, f, separators=(",", ":"))
+    except OSError as e:
+        logger.warn(f"Failed to write mount manifest {manifest_path!r}: {e}")
+        return False
+    return True
+
+
+def load_mount_manifest(manifest_path: TinyPath) -> Optional[tuple[list[ContentProvider], int]]:
+    """Load providers stored in manifest, returns None if manifest is missing or outdated.
+
+    Manifest is outdated when any file it was built from or any directory scanned to build it changed.
+    """
+    try:
+        with open(manifest_path, "r", encoding="utf8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version", None) != MANIFEST_VERSION:
+        return None
+    if not _are_dirs_unchanged(manifest["dirs"]):
+        logger.info(f"Mount manifest {manifest_path!r} is outdated, content was added or removed")
+        return None
+    providers = []
+    for data in manifest["providers"]:
+        try:
+            provider = _deserialize_provider(data)
+        except Exception as e:
+            logger.warn(f"Failed to restore {data['path']!r} from mount manifest: {e}")
+            return None
+        if provider is None:
+            logger.info(f"Mount manifest {manifest_path!r} is outdated")
+            return None
+        providers.append(provider)
+    return providers, manifest["steam_id"]
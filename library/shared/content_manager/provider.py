@@ -30,6 +30,24 @@ def glob_generic(root: TinyPath, pattern: str) -> Iterator[tuple[TinyPath, Buffe
         yield (filename.relative_to(root)).as_posix(), FileBuffer(filename)
 
 
+def merge_path_indices(providers: list['ContentProvider']) -> tuple[dict[str, 'ContentProvider'], bool]:
+    """Merge path indices of providers in priority order, first provider serving a path wins.
+
+    Returns merged index and whether it covers everything providers can resolve.
+    """
+    index: dict[str, ContentProvider] = {}
+    complete = True
+    for provider in providers:
+        provider_index = provider.build_path_index()
+        if provider_index is None:
+            complete = False
+            continue
+        complete = complete and provider.path_index_complete
+        for path, leaf_provider in provider_index.items():
+            index.setdefault(path, leaf_provider)
+    return index, complete
+
+
 # backport
 def is_relative_to(path: TinyPath, *other):
     """Return True if the path is relative to another path or False.
@@ -76,6 +94,18 @@ class ContentProvider:
     def get_steamid_from_asset(self, asset_path: TinyPath) -> SteamAppId | None:
         ...
 
+    def build_path_index(self) -> Optional[dict[str, 'ContentProvider']]:
+        """Map every lowercase asset path this provider serves to the provider that serves it.
+
+        Returns None if content can not be enumerated up front.
+        """
+        return None
+
+    @property
+    def path_index_complete(self) -> bool:
+        """Whether build_path_index covers every path find_file can resolve."""
+        return True
+
     @property
     @abstractmethod
     def root(self) -> TinyPath:
@@ -51,6 +51,10 @@ class GMAContentProvider(ContentProvider):
                 files.append((file_name, self.gma_archive.find_file(file_name, )))
         return iter(files)
 
+    def build_path_index(self) -> Optional[dict[str, ContentProvider]]:
+        self._init()
+        return {str(file_name): self for file_name in self.gma_archive.file_entries.keys()}
+
     def find_file(self, filepath: TinyPath) -> Optional[Buffer]:
         self._init()
         entry = self.gma_archive.find_file(filepath)
@@ -36,6 +36,9 @@ class HFS2ContentProvider(ContentProvider):
     def name(self) -> str:
         return self.filepath.stem
 
+    def build_path_index(self) -> Optional[dict[str, ContentProvider]]:
+        return dict.fromkeys(self.hfs_archive.files.keys(), self)
+
     def find_file(self, filepath: Union[str, TinyPath]) -> Optional[Buffer]:
         file = self.hfs_archive.get_file(filepath)
         if file:
@@ -76,6 +79,9 @@ class HFS1ContentProvider(ContentProvider):
     def name(self) -> str:
         return self.filepath.stem
 
+    def build_path_index(self) -> Optional[dict[str, ContentProvider]]:
+        return dict.fromkeys(self.hfs_archive.entries.keys(), self)
+
     def find_file(self, filepath: TinyPath):
         file = self.hfs_archive.get_file(filepath)
         if file:
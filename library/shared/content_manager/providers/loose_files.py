@@ -1,3 +1,4 @@
+import os
 from typing import Iterator, Optional, Union
 
 from SourceIO.library.shared.content_manager.provider import ContentProvider, glob_generic
@@ -40,8 +41,35 @@ class LooseFilesContentProvider(ContentProvider):
 
     def __init__(self, filepath: TinyPath, override_steamid=SteamAppId.UNKNOWN):
         self._override_steamid = override_steamid
+        self.directory_listing: Optional[dict[str, tuple[int, list[str]]]] = None
         super().__init__(filepath)
 
+    def scan_directory_listing(self) -> dict[str, tuple[int, list[str]]]:
+        """Returns relative directory -> (directory mtime, lowercase file names)."""
+        listing = {}
+        root = str(self.root)
+        for dir_path, _, file_names in os.walk(root):
+            rel_dir = os.path.relpath(dir_path, root).replace(os.sep, "/")
+            if rel_dir == ".":
+                rel_dir = ""
+            listing[rel_dir] = os.stat(dir_path).st_mtime_ns, [file_name.lower() for file_name in file_names]
+        return listing
+
+    def build_path_index(self) -> Optional[dict[str, ContentProvider]]:
+        if self.directory_listing is None:
+            self.directory_listing = self.scan_directory_listing()
+        index = {}
+        for rel_dir, (_, file_names) in self.directory_listing.items():
+            prefix = rel_dir.lower() + "/" if rel_dir else ""
+            for file_name in file_names:
+                index[prefix + file_name] = self
+        return index
+
+    @property
+    def path_index_complete(self) -> bool:
+        # find_file falls back to backwalk_file_resolver, which can resolve paths outside the root
+        return False
+
     def find_file(self, filepath: Union[str, TinyPath]) -> Optional[Buffer]:
         file = backwalk_file_resolver(self.filepath, filepath)
         if file and file.is_file():
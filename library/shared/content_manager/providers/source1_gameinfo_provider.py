@@ -1,7 +1,7 @@
 from typing import Iterator, Optional, Any
 
 from SourceIO.library.shared.app_id import SteamAppId
-from SourceIO.library.shared.content_manager.provider import ContentProvider, is_relative_to
+from SourceIO.library.shared.content_manager.provider import ContentProvider, is_relative_to, merge_path_indices
 from SourceIO.library.shared.content_manager.providers import register_provider
 from SourceIO.library.shared.content_manager.providers.loose_files import LooseFilesContentProvider
 from SourceIO.library.shared.content_manager.providers.vpk_provider import VPKContentProvider
@@ -23,6 +23,7 @@ class Source1GameInfoProvider(ContentProvider):
         self.filesystem: dict[str, Any] = gameinfo_data["filesystem"]
         self._steamapp_id = SteamAppId(int(self.filesystem.get("steamappid", 0)))
         self.mount: list[ContentProvider] = []
+        self._path_index_complete = False
 
         mods_folder = self.root.parent
         for search_path_type, search_paths in self.filesystem.get("searchpaths", {}).items():
@@ -62,6 +63,18 @@ class Source1GameInfoProvider(ContentProvider):
                             vpk_provider = register_provider(VPKContentProvider(vpk, self._steamapp_id))
                             self._add_mount(vpk_provider)
 
+    @classmethod
+    def from_mounts(cls, filepath: TinyPath, filesystem: dict[str, Any],
+                    mount: list[ContentProvider]) -> 'Source1GameInfoProvider':
+        """Create provider from already resolved mounts without parsing gameinfo."""
+        self = cls.__new__(cls)
+        ContentProvider.__init__(self, filepath)
+        self.filesystem = filesystem
+        self._steamapp_id = SteamAppId(int(self.filesystem.get("steamappid", 0)))
+        self.mount = list(mount)
+        self._path_index_complete = False
+        return self
+
     def _add_mount(self, mod_provider):
         if mod_provider not in self.mount:
             logger.info(f"Mounted: {mod_provider}")
@@ -98,6 +111,14 @@ class Source1GameInfoProvider(ContentProvider):
                 return file
         return None
 
+    def build_path_index(self) -> Optional[dict[str, ContentProvider]]:
+        index, self._path_index_complete = merge_path_indices(self.mount)
+        return index
+
+    @property
+    def path_index_complete(self) -> bool:
+        return self._path_index_complete
+
     def glob(self, pattern: str) -> Iterator[tuple[TinyPath, Buffer]]:
         for mount in self.mount:
             yield from mount.glob(pattern)
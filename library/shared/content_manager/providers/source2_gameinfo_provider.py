@@ -1,7 +1,7 @@
 from typing import Iterator, Optional, Any
 
 from SourceIO.library.shared.app_id import SteamAppId
-from SourceIO.library.shared.content_manager.provider import ContentProvider, is_relative_to
+from SourceIO.library.shared.content_manager.provider import ContentProvider, is_relative_to, merge_path_indices
 from SourceIO.library.shared.content_manager.providers import register_provider
 from SourceIO.library.shared.content_manager.providers.loose_files import LooseFilesContentProvider
 from SourceIO.library.shared.content_manager.providers.vpk_provider import VPKContentProvider
@@ -25,6 +25,7 @@ class Source2GameInfoProvider(ContentProvider):
         self.filesystem: dict[str, Any] = gameinfo_data["filesystem"]
         self._steamapp_id = steamapp_id
         self.mount: list[ContentProvider] = []
+        self._path_index_complete = False
 
         mods_folder = self.root.parent
         for search_path_type, search_paths in self.filesystem.get("searchpaths", {}).items():
@@ -59,6 +60,19 @@ class Source2GameInfoProvider(ContentProvider):
                                     logger.info(f"Mounted: {mod_provider}")
                                     self.mount.append(mod_provider)
 
+    @classmethod
+    def from_mounts(cls, filepath: TinyPath, gameinfo_data: dict[str, Any], steamapp_id: SteamAppId,
+                    mount: list[ContentProvider]) -> 'Source2GameInfoProvider':
+        """Create provider from already resolved mounts without parsing gameinfo."""
+        self = cls.__new__(cls)
+        ContentProvider.__init__(self, filepath)
+        self.data = gameinfo_data
+        self.filesystem = gameinfo_data["filesystem"]
+        self._steamapp_id = steamapp_id
+        self.mount = list(mount)
+        self._path_index_complete = False
+        return self
+
     def check(self, filepath: TinyPath) -> bool:
         for mount in self.mount:
             if mount.check(filepath):
@@ -90,6 +104,14 @@ class Source2GameInfoProvider(ContentProvider):
                 return file
         return None
 
+    def build_path_index(self) -> Optional[dict[str, ContentProvider]]:
+        index, self._path_index_complete = merge_path_indices(self.mount)
+        return index
+
+    @property
+    def path_index_complete(self) -> bool:
+        return self._path_index_complete
+
     def glob(self, pattern: str) -> Iterator[tuple[TinyPath, Buffer]]:
         for mount in self.mount:
             yield from mount.glob(pattern)
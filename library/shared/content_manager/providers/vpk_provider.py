@@ -1,6 +1,8 @@
 from typing import Iterator, Optional
 
+from SourceIO.library.archives import VPKDirectory
 from SourceIO.library.shared.app_id import SteamAppId
+from SourceIO.library.shared.content_manager.cache import normalize_cache_key
 from SourceIO.library.shared.content_manager.provider import ContentProvider
 from SourceIO.library.utils import Buffer, MemoryBuffer, TinyPath
 from SourceIO.library.utils.rustlib import Vpk
@@ -16,8 +18,12 @@ class VPKContentProvider(ContentProvider):
         self._override_steamid = override_steamid
         self._initialized = False
         self.vpk_archive: Vpk | None = None
+        # Directory read by path index or restored from mount manifest, lookups then skip loading the archive
+        self.directory: VPKDirectory | None = None
 
     def check(self, filepath: TinyPath) -> bool:
+        if self.directory is not None:
+            return normalize_cache_key(filepath) in self.directory.entries
         self._init()
         return self.vpk_archive.find_file(filepath) is not None
 
@@ -45,7 +51,21 @@ class VPKContentProvider(ContentProvider):
         for key, data in self.vpk_archive.glob(pattern):
             yield key, MemoryBuffer(data)
 
+    def build_path_index(self) -> Optional[dict[str, ContentProvider]]:
+        if self.directory is None:
+            try:
+                self.directory = VPKDirectory(self.filepath).read()
+            except Exception as e:
+                logger.warn(f"Failed to read directory of {self.filepath!r}: {e}")
+                return None
+        return dict.fromkeys(self.directory.entries, self)
+
     def find_file(self, filepath: TinyPath) -> Optional[Buffer]:
+        if self.directory is not None:
+            data = self.directory.read_file(filepath)
+            if data is not None:
+                return MemoryBuffer(data)
+            return None
         self._init()
         file = self.vpk_archive.find_file(filepath)
         if file:
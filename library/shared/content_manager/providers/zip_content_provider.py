@@ -28,6 +28,9 @@ class ZIPContentProvider(ContentProvider):
         if self.check(asset_path):
             return self.steam_id
 
+    def build_path_index(self) -> Optional[dict[str, ContentProvider]]:
+        return dict.fromkeys(self._cache.keys(), self)
+
     def find_file(self, filepath: TinyPath) -> Optional[Buffer]:
         if filepath.as_posix().lower() in self._cache:
             return MemoryBuffer(self._zip_file.read(self._cache[filepath.as_posix().lower()]))
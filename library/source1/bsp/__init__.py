@@ -1 +1 @@
-from SourceIO.library.source1.bsp.lump import Lump, LumpInfo, LumpTag, lump_tag
\ No newline at end of file
+from SourceIO.library.source1.bsp.lump import Lump, LumpInfo, LumpTag, lump_tag, LazyRecordList, read_records
\ No newline at end of file
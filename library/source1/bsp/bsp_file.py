@@ -1,4 +1,6 @@
-from typing import Optional, Type
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable, Optional, Type
 
 from SourceIO.library.shared.app_id import SteamAppId
 from SourceIO.library.shared.content_manager import ContentManager
@@ -37,6 +39,8 @@ class BSPFile:
         self.revision = 0
         self.content_manager = content_manager
         self.steam_app_id = content_manager.get_steamid_from_asset(filepath) or SteamAppId.UNKNOWN
+        self._prefetched_lumps: dict[int, Future[Buffer]] = {}
+        self._prefetched_game_lumps: dict[str, Future[Buffer]] = {}
 
     @classmethod
     def from_buffer(cls, filepath: TinyPath, buffer: Buffer, content_manager: ContentManager,
@@ -58,46 +62,127 @@ class BSPFile:
         self.steam_app_id = override_steamappid or self.steam_app_id
         return self
 
+    def _find_lump_class(self, lump_name: str) -> Optional[tuple[Type[Lump], LumpTag]]:
+        matches: list[tuple[Type[Lump], LumpTag]] = []
+        for sub in Lump.all_subclasses():
+            sub: Type[Lump]
+            for dep in sub.tags:
+                if dep.lump_name == lump_name:
+                    if dep.bsp_version is not None and dep.bsp_version > self.version:
+                        continue
+                    if dep.steam_id is not None and dep.steam_id != self.steam_app_id:
+                        continue
+                    if dep.lump_version is not None and dep.lump_version != self.lumps_info[dep.lump_id].version:
+                        continue
+                    matches.append((sub, dep))
+        best_matches = []
+        for match_sub, match_dep in matches:
+            if match_dep.lump_id >= len(self.lumps_info):
+                continue
+            lump = self.lumps_info[match_dep.lump_id]
+            rank = 0
+            if match_dep.bsp_version is not None and match_dep.bsp_version == self.version:
+                rank += 2
+            elif match_dep.bsp_version is not None and match_dep.bsp_version > self.version:
+                rank += 1
+            if match_dep.steam_id is not None and match_dep.steam_id == self.steam_app_id:
+                rank += 1
+            if match_dep.lump_version is not None and match_dep.lump_version == lump.version:
+                rank += 1
+            best_matches.append((rank, match_sub, match_dep))
+        if not best_matches:
+            return None
+        best_matches = list(sorted(best_matches, key=lambda a: a[0]))
+        _, sub, dep = best_matches[-1]
+        return sub, dep
+
     def get_lump(self, lump_name):
         if lump_name in self.lumps:
             return self.lumps[lump_name]
         else:
-            matches: list[tuple[Type[Lump], LumpTag]] = []
-            for sub in Lump.all_subclasses():
-                sub: Type[Lump]
-                for dep in sub.tags:
-                    if dep.lump_name == lump_name:
-                        if dep.bsp_version is not None and dep.bsp_version > self.version:
-                            continue
-                        if dep.steam_id is not None and dep.steam_id != self.steam_app_id:
-                            continue
-                        if dep.lump_version is not None and dep.lump_version != self.lumps_info[dep.lump_id].version:
-                            continue
-                        matches.append((sub, dep))
-            best_matches = []
-            for match_sub, match_dep in matches:
-                if match_dep.lump_id >= len(self.lumps_info):
-                    continue
-                lump = self.lumps_info[match_dep.lump_id]
-                rank = 0
-                if match_dep.bsp_version is not None and match_dep.bsp_version == self.version:
-                    rank += 2
-                elif match_dep.bsp_version is not None and match_dep.bsp_version > self.version:
-                    rank += 1
-                if match_dep.steam_id is not None and match_dep.steam_id == self.steam_app_id:
-                    rank += 1
-                if match_dep.lump_version is not None and match_dep.lump_version == lump.version:
-                    rank += 1
-                best_matches.append((rank, match_sub, match_dep))
-            if not best_matches:
+            match = self._find_lump_class(lump_name)
+            if match is None:
                 return
-            best_matches = list(sorted(best_matches, key=lambda a: a[0]))
-            _, sub, dep = best_matches[-1]
+            sub, dep = match
 
             parsed_lump = self.parse_lump(sub, dep.lump_id, dep.lump_name)
             self.lumps[lump_name] = parsed_lump
             return parsed_lump
 
+    def prefetch_lumps(self, lump_names: Optional[Iterable[str]] = None, max_workers: Optional[int] = None):
+        """Decompress LZMA compressed lumps in a thread pool ahead of parsing.
+
+        lzma releases the GIL while decompressing, so lumps are decompressed in parallel. Results are kept
+        as MemoryBuffers until the lump is parsed. Compressed static/detail prop game lumps are included when
+        LUMP_GAME_LUMP is requested. By default every compressed lump is prefetched.
+        """
+        if lump_names is None:
+            lump_ids = {lump_info.id for lump_info in self.lumps_info if lump_info is not None}
+            game_lump_class = self._find_lump_class('LUMP_GAME_LUMP')
+        else:
+            lump_ids = set()
+            game_lump_class = None
+            for lump_name in lump_names:
+                match = self._find_lump_class(lump_name)
+                if match is None:
+                    continue
+                lump_ids.add(match[1].lump_id)
+                if lump_name == 'LUMP_GAME_LUMP':
+                    game_lump_class = match
+
+        jobs: list[tuple[dict, int | str, Buffer]] = []
+        for lump_id in sorted(lump_ids):
+            lump_info = self.lumps_info[lump_id]
+            if (lump_id in self._prefetched_lumps or not lump_info.compressed or lump_info.size == 0
+                    or self._get_external_lump_path(lump_id) is not None):
+                continue
+            jobs.append((self._prefetched_lumps, lump_id, self.buffer.slice(lump_info.offset, lump_info.size)))
+
+        if game_lump_class is not None:
+            lump_class, dep = game_lump_class
+            lump_info = self.lumps_info[dep.lump_id]
+            # Game lump offsets point into the map file, only usable when the game lump is stored there as is
+            if (hasattr(lump_class, 'compressed_lumps') and lump_info.size != 0 and not lump_info.compressed
+                    and self._get_external_lump_path(dep.lump_id) is None):
+                game_lump = lump_class(lump_info)
+                game_lump.read_headers(self.buffer.slice(lump_info.offset, lump_info.size), self)
+                for game_lump_info, offset, size in game_lump.compressed_lumps():
+                    if game_lump_info.id in self._prefetched_game_lumps:
+                        continue
+                    jobs.append((self._prefetched_game_lumps, game_lump_info.id,
+                                 self.buffer.slice(lump_info.offset + offset, size)))
+        if not jobs:
+            return
+
+        logger.info(f"Prefetching {len(jobs)} compressed lumps")
+        executor = ThreadPoolExecutor(max_workers=min(len(jobs), max_workers or os.cpu_count() or 1))
+        for cache, key, compressed_buffer in jobs:
+            cache[key] = executor.submit(Lump.decompress_lump, compressed_buffer)
+        # Workers finish queued jobs on their own, parsing of already available lumps can go on meanwhile
+        executor.shutdown(wait=False)
+
+    def close(self):
+        """Drop parsed lumps and pending prefetches, so nothing references map buffer anymore."""
+        for future in (*self._prefetched_lumps.values(), *self._prefetched_game_lumps.values()):
+            future.cancel()
+        self._prefetched_lumps.clear()
+        self._prefetched_game_lumps.clear()
+        self.lumps.clear()
+
+    def get_game_lump_buffer(self, game_lump_id: str, compressed_buffer: Buffer) -> Buffer:
+        if (future := self._prefetched_game_lumps.pop(game_lump_id, None)) is not None:
+            return future.result()
+        return Lump.decompress_lump(compressed_buffer)
+
+    def _get_external_lump_path(self, lump_id: int) -> Optional[TinyPath]:
+        lump_path = self.filepath.parent / f'{self.filepath.name}.{lump_id:04x}.bsp_lump'
+        if lump_path.exists():
+            return lump_path
+        lump_path = self.filepath.parent / f'{self.filepath.stem}_l_{lump_id}.lmp'
+        if lump_path.exists():
+            return lump_path
+        return None
+
     def _get_lump_buffer(self, lump_id: int, lump_info: LumpInfo) -> Buffer:
         base_path = self.filepath.parent
         lump_path = base_path / f'{self.filepath.name}.{lump_id:04x}.bsp_lump'
@@ -107,10 +192,12 @@ class BSPFile:
 
         if not lump_info.compressed:
             return self.buffer.slice(lump_info.offset, lump_info.size)
+        if (future := self._prefetched_lumps.pop(lump_id, None)) is not None:
+            buffer = future.result()
         else:
             buffer = Lump.decompress_lump(self.buffer.slice(lump_info.offset, lump_info.size))
-            assert buffer.size() == lump_info.decompressed_size
-            return buffer
+        assert buffer.size() == lump_info.decompressed_size
+        return buffer
 
     def parse_lump(self, lump_class: Type[Lump], lump_id, lump_name):
         base_path = self.filepath.parent
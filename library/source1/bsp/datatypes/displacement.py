@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+import numpy as np
+
 from SourceIO.library.shared.types import Vector3
 from SourceIO.library.utils.file_utils import Buffer
 from SourceIO.library.source1.bsp.bsp_file import BSPFile
@@ -8,6 +10,66 @@ from SourceIO.library.source1.bsp.lumps.face_lump import FaceLump
 DISP_INFO_FLAG_HAS_MULTIBLEND = 0x40000000
 DISP_INFO_FLAG_MAGIC = 0x80000000
 
+DISP_INFO_DTYPE = np.dtype([
+    ("start_position", np.float32, (3,)),
+    ("disp_vert_start", np.uint32),
+    ("disp_tri_start", np.uint32),
+    ("power", np.uint32),
+    ("min_tess", np.uint32),
+    ("smoothing_angle", np.float32),
+    ("contents", np.uint32),
+    ("map_face", np.uint16),
+    ("lightmap_alpha_start", np.uint32),
+    ("lightmap_sample_position_start", np.uint32),
+    ("neighbors", np.uint8, (90,)),
+    ("allowed_verts", np.int32, (10,)),
+])
+
+DISP_INFO_DTYPE_V1 = np.dtype([
+    ("start_position", np.float32, (3,)),
+    ("disp_vert_start", np.uint32),
+    ("disp_tri_start", np.uint32),
+    ("power", np.uint32),
+    ("min_tess", np.uint32),
+    ("smoothing_angle", np.float32),
+    ("contents", np.int32),
+    ("map_face", np.uint32),
+    ("lightmap_alpha_start", np.uint32),
+    ("lightmap_sample_position_start", np.uint32),
+    ("neighbors", np.uint8, (90,)),
+    ("allowed_verts", np.int32, (10,)),
+])
+
+VDISP_INFO_DTYPE = np.dtype([
+    ("start_position", np.float32, (3,)),
+    ("disp_vert_start", np.uint32),
+    ("disp_tri_start", np.uint32),
+    ("power", np.uint32),
+    ("smoothing_angle", np.float32),
+    ("unknown", np.uint32),
+    ("contents", np.uint32),
+    ("map_face", np.uint16),
+    ("lightmap_alpha_start", np.uint32),
+    ("lightmap_sample_position_start", np.uint32),
+    ("neighbors", np.uint8, (146,)),
+    ("allowed_verts", np.int32, (10,)),
+])
+
+STRATA_DISP_INFO_DTYPE = np.dtype([
+    ("start_position", np.float32, (3,)),
+    ("disp_vert_start", np.uint32),
+    ("disp_tri_start", np.uint32),
+    ("power", np.uint32),
+    ("smoothing_angle", np.float32),
+    ("min_tess", np.int32),
+    ("contents", np.int32),
+    ("map_face", np.uint32),
+    ("lightmap_alpha_start", np.int32),
+    ("lightmap_sample_position_start", np.int32),
+    ("neighbors", np.uint8, (144,)),
+    ("allowed_verts", np.int32, (10,)),
+])
+
 
 @dataclass(slots=True)
 class DispInfo:
@@ -55,6 +117,17 @@ class DispInfo:
         return cls(start_position, disp_vert_start, disp_tri_start, power, min_tess, smoothing_angle, contents,
                    map_face, lightmap_alpha_start, lightmap_sample_position_start, allowed_verts)
 
+    @staticmethod
+    def get_dtype(version: int) -> np.dtype:
+        return DISP_INFO_DTYPE_V1 if version == 1 else DISP_INFO_DTYPE
+
+    @classmethod
+    def from_record(cls, record: np.void):
+        (start_position, disp_vert_start, disp_tri_start, power, min_tess, smoothing_angle, contents, map_face,
+         lightmap_alpha_start, lightmap_sample_position_start, _, allowed_verts) = record.item()
+        return cls(tuple(start_position.tolist()), disp_vert_start, disp_tri_start, power, min_tess, smoothing_angle,
+                   contents, map_face, lightmap_alpha_start, lightmap_sample_position_start, allowed_verts.tolist())
+
     def get_source_face(self, bsp: BSPFile):
         lump: FaceLump = bsp.get_lump('LUMP_FACES')
         if lump:
@@ -82,6 +155,17 @@ class VDispInfo(DispInfo):
         return cls(start_position, disp_vert_start, disp_tri_start, power, 0, smoothing_angle, contents, map_face,
                    lightmap_alpha_start, lightmap_sample_position_start, allowed_verts)
 
+    @staticmethod
+    def get_dtype(version: int) -> np.dtype:
+        return VDISP_INFO_DTYPE
+
+    @classmethod
+    def from_record(cls, record: np.void):
+        (start_position, disp_vert_start, disp_tri_start, power, smoothing_angle, _, contents, map_face,
+         lightmap_alpha_start, lightmap_sample_position_start, _, allowed_verts) = record.item()
+        return cls(tuple(start_position.tolist()), disp_vert_start, disp_tri_start, power, 0, smoothing_angle,
+                   contents, map_face, lightmap_alpha_start, lightmap_sample_position_start, allowed_verts.tolist())
+
 @dataclass(slots=True)
 class StrataDispInfo(DispInfo):
     @classmethod
@@ -100,3 +184,14 @@ class StrataDispInfo(DispInfo):
         allowed_verts = [buffer.read_int32() for _ in range(10)]
         return cls(start_position, disp_vert_start, disp_tri_start, power, 0, smoothing_angle, contents, map_face,
                    lightmap_alpha_start, lightmap_sample_position_start, allowed_verts)
+
+    @staticmethod
+    def get_dtype(version: int) -> np.dtype:
+        return STRATA_DISP_INFO_DTYPE
+
+    @classmethod
+    def from_record(cls, record: np.void):
+        (start_position, disp_vert_start, disp_tri_start, power, smoothing_angle, _, contents, map_face,
+         lightmap_alpha_start, lightmap_sample_position_start, _, allowed_verts) = record.item()
+        return cls(tuple(start_position.tolist()), disp_vert_start, disp_tri_start, power, 0, smoothing_angle,
+                   contents, map_face, lightmap_alpha_start, lightmap_sample_position_start, allowed_verts.tolist())
@@ -1,11 +1,97 @@
 from dataclasses import dataclass
 from enum import IntEnum
 
+import numpy as np
+
 from SourceIO.library.shared.types import Vector2, Vector3
 from SourceIO.library.source1.bsp.bsp_file import BSPFile
 from SourceIO.library.utils.file_utils import Buffer
 
 
+FACE_DTYPE = np.dtype([
+    ("plane_index", np.uint16),
+    ("side", np.uint8),
+    ("on_node", np.uint8),
+    ("first_edge", np.uint32),
+    ("edge_count", np.int16),
+    ("tex_info_id", np.int16),
+    ("disp_info_id", np.int16),
+    ("surface_fog_volume_id", np.int16),
+    ("styles", np.int8, (4,)),
+    ("light_offset", np.int32),
+    ("area", np.float32),
+    ("lightmap_texture_mins_in_luxels", np.int32, (2,)),
+    ("lightmap_texture_size_in_luxels", np.int32, (2,)),
+    ("orig_face", np.int32),
+    ("prim_count", np.uint16),
+    ("first_prim_id", np.uint16),
+    ("smoothing_groups", np.int32),
+])
+
+FACE_DTYPE_V2 = np.dtype([
+    ("plane_index", np.uint32),
+    ("side", np.uint16),
+    ("on_node", np.uint16),
+    ("first_edge", np.uint32),
+    ("edge_count", np.uint32),
+    ("tex_info_id", np.uint32),
+    ("disp_info_id", np.int32),
+    ("surface_fog_volume_id", np.uint32),
+    ("styles", np.uint8, (4,)),
+    ("light_offset", np.int32),
+    ("area", np.float32),
+    ("lightmap_texture_mins_in_luxels", np.int32, (2,)),
+    ("lightmap_texture_size_in_luxels", np.int32, (2,)),
+    ("orig_face", np.int32),
+    ("prim_count", np.uint32),  # packed, real prim count is (value >> 1) & 0x7FFFFFFF
+    ("first_prim_id", np.uint32),
+    ("smoothing_groups", np.uint32),
+])
+
+VFACE1_DTYPE = np.dtype([
+    ("plane_index", np.uint32),
+    ("side", np.uint8),
+    ("on_node", np.uint8),
+    ("unk", np.uint16),
+    ("first_edge", np.uint32),
+    ("edge_count", np.uint32),
+    ("tex_info_id", np.uint32),
+    ("disp_info_id", np.uint32),
+    ("surface_fog_volume_id", np.uint32),
+    ("styles", np.int8, (4,)),
+    ("light_offset", np.int32),
+    ("area", np.float32),
+    ("lightmap_texture_mins_in_luxels", np.int32, (2,)),
+    ("lightmap_texture_size_in_luxels", np.int32, (2,)),
+    ("orig_face", np.uint32),
+    ("prim_count", np.uint32),
+    ("first_prim_id", np.uint32),
+    ("smoothing_groups", np.uint32),
+])
+
+VFACE2_DTYPE = np.dtype([
+    ("plane_index", np.uint32),
+    ("side", np.uint8),
+    ("on_node", np.uint8),
+    ("unk", np.uint16),
+    ("first_edge", np.uint32),
+    ("edge_count", np.uint32),
+    ("tex_info_id", np.uint32),
+    ("disp_info_id", np.uint32),
+    ("surface_fog_volume_id", np.uint32),
+    ("styles", np.int8, (4,)),
+    ("unk1", np.int32),
+    ("light_offset", np.int32),
+    ("area", np.float32),
+    ("lightmap_texture_mins_in_luxels", np.int32, (2,)),
+    ("lightmap_texture_size_in_luxels", np.int32, (2,)),
+    ("orig_face", np.uint32),
+    ("prim_count", np.uint32),
+    ("first_prim_id", np.uint32),
+    ("smoothing_groups", np.uint32),
+])
+
+
 @dataclass(slots=True)
 class Face:
     plane_index: int
@@ -55,6 +141,22 @@ class Face:
                    lightmap_texture_mins_in_luxels, lightmap_texture_size_in_luxels,
                    orig_face, prim_count, first_prim_id, smoothing_groups)
 
+    @staticmethod
+    def get_dtype(version: int) -> np.dtype:
+        return FACE_DTYPE_V2 if version == 2 else FACE_DTYPE
+
+    @classmethod
+    def from_record(cls, record: np.void):
+        (plane_index, side, on_node, first_edge, edge_count, tex_info_id, disp_info_id, surface_fog_volume_id,
+         styles, light_offset, area, lightmap_texture_mins_in_luxels, lightmap_texture_size_in_luxels,
+         orig_face, prim_count, first_prim_id, smoothing_groups) = record.item()
+        if record.dtype == FACE_DTYPE_V2:
+            prim_count = (prim_count >> 1) & 0x7FFFFFFF
+        return cls(plane_index, side, on_node, first_edge, edge_count, tex_info_id, disp_info_id,
+                   surface_fog_volume_id, tuple(styles.tolist()), light_offset, area,
+                   tuple(lightmap_texture_mins_in_luxels.tolist()), tuple(lightmap_texture_size_in_luxels.tolist()),
+                   orig_face, prim_count, first_prim_id, smoothing_groups)
+
     # def get_tex_info(self, bsp: BSPFile):
     #     tex_info_lump: TextureInfoLump = bsp.get_lump('LUMP_TEXINFO')
     #     if tex_info_lump:
@@ -82,6 +184,20 @@ class VFace1(Face):
                    lightmap_texture_mins_in_luxels, lightmap_texture_size_in_luxels,
                    orig_face, prim_count, first_prim_id, smoothing_groups)
 
+    @staticmethod
+    def get_dtype(version: int) -> np.dtype:
+        return VFACE1_DTYPE
+
+    @classmethod
+    def from_record(cls, record: np.void):
+        (plane_index, side, on_node, _, first_edge, edge_count, tex_info_id, disp_info_id, surface_fog_volume_id,
+         styles, light_offset, area, lightmap_texture_mins_in_luxels, lightmap_texture_size_in_luxels,
+         orig_face, prim_count, first_prim_id, smoothing_groups) = record.item()
+        return cls(plane_index, side, on_node, first_edge, edge_count, tex_info_id, disp_info_id,
+                   surface_fog_volume_id, tuple(styles.tolist()), light_offset, area,
+                   tuple(lightmap_texture_mins_in_luxels.tolist()), tuple(lightmap_texture_size_in_luxels.tolist()),
+                   orig_face, prim_count, first_prim_id, smoothing_groups)
+
 
 class VFace2(VFace1):
     @classmethod
@@ -98,6 +214,20 @@ class VFace2(VFace1):
                    lightmap_texture_mins_in_luxels, lightmap_texture_size_in_luxels,
                    orig_face, prim_count, first_prim_id, smoothing_groups)
 
+    @staticmethod
+    def get_dtype(version: int) -> np.dtype:
+        return VFACE2_DTYPE
+
+    @classmethod
+    def from_record(cls, record: np.void):
+        (plane_index, side, on_node, _, first_edge, edge_count, tex_info_id, disp_info_id, surface_fog_volume_id,
+         styles, unk1, light_offset, area, lightmap_texture_mins_in_luxels, lightmap_texture_size_in_luxels,
+         orig_face, prim_count, first_prim_id, smoothing_groups) = record.item()
+        return cls(plane_index, side, on_node, first_edge, edge_count, tex_info_id, disp_info_id,
+                   surface_fog_volume_id, (*styles.tolist(), unk1), light_offset, area,
+                   tuple(lightmap_texture_mins_in_luxels.tolist()), tuple(lightmap_texture_size_in_luxels.tolist()),
+                   orig_face, prim_count, first_prim_id, smoothing_groups)
+
 
 class SurfaceType(IntEnum):
     MST_BAD = 0
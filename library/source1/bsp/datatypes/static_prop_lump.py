@@ -1,4 +1,7 @@
 from enum import IntFlag
+from typing import Optional
+
+import numpy as np
 
 from SourceIO.library.shared.app_id import SteamAppId
 from SourceIO.library.source1.bsp.bsp_file import BSPFile
@@ -23,268 +26,238 @@ class StaticPropFlag(IntFlag):
     NO_PER_TEXEL_LIGHTING = 0x100
 
 
-class StaticProp:
-
-    def __init__(self):
-        self.origin = []
-        self.rotation = []
-        self.prop_type = 0
-        self.first_leaf = 0
-        self.leaf_count = 0
-        self.solid = 0
-        self.flags = StaticPropFlag.NONE
-        self.skin = 0
-        self.fade_min_dist = 0.0
-        self.fade_max_dist = 0.0
-        self.lighting_origin = []
-
-        self.forced_fade_scale = 0.0
-
-        self.min_dx_level = 0
-        self.max_dx_level = 0
-
-        self.lightmap_resolution = []
-
-        self.min_cpu_level = 0
-        self.max_cpu_level = 0
-        self.min_gpu_level = 0
-        self.max_gpu_level = 0
-
-        self.diffuse_modulation = []
-        self.disable_x360 = 0
-        self.flags_ex = 0
-        self.uniform_scale = 0.0
-        self.uniform_scale_yz = 0.0, 0.0
-
-        self.unk_vector = []
-
-        # Vindictus specific
-        self.scaling = [1.0, 1.0, 1.0]
-
-    def __repr__(self):
-        return f'<StaticProp origin: {self.origin}, rotation: {self.rotation}, prop_type: {self.prop_type}, ' \
-               f'first_leaf: {self.first_leaf}, leaf_count: {self.leaf_count}, solid: {self.solid}, flags: {self.flags}, ' \
-               f'skin: {self.skin}, fade_min_dist: {self.fade_min_dist}, fade_max_dist: {self.fade_max_dist}, ' \
-               f'lighting_origin: {self.lighting_origin}, forced_fade_scale: {self.forced_fade_scale}, ' \
-               f'min_dx_level: {self.min_dx_level}, max_dx_level: {self.max_dx_level}, lightmap_resolution: {self.lightmap_resolution}, ' \
-               f'min_cpu_level: {self.min_cpu_level}, max_cpu_level: {self.max_cpu_level}, min_gpu_level: {self.min_gpu_level}, ' \
-               f'max_gpu_level: {self.max_gpu_level}, diffuse_modulation: {self.diffuse_modulation}, disable_x360: {self.disable_x360}, ' \
-               f'flags_ex: {self.flags_ex}, uniform_scale: {self.uniform_scale}, uniform_scale_yz: {self.uniform_scale_yz}, ' \
-               f'unk_vector: {self.unk_vector}, scaling: {self.scaling}>'
-
-    def parse(self, reader: Buffer, version: int, bsp_version: tuple[int, int], size: int, app_id: int):
-        if bsp_version == (20, 4):
-            self._parse_v6(reader)
-            reader.skip(72)
-            return
-
-        if app_id == SteamAppId.LEFT_4_DEAD and version == 7 and size == 68:
-            # Old Left 4 Dead maps use v7 and incompatible with newer v7 from Source 2013
-            self._parse_v7_l4d(reader)
-            return
-
-        if app_id == SteamAppId.TEAM_FORTRESS_2 and version == 7 and size == 72:
-            # Old Team Fortress 2 maps use v7 which became v10 in Source 2013
-            self._parse_v10(reader)
-            return
-
-        if app_id == SteamAppId.COUNTER_STRIKE_GO and version in (10, 11):
-            # Some Counter-Strike: GO use v10 which is not compatible with Source 2013, now use v11
-            if version == 10:
-                self._parse_v10_csgo(reader)
-            else:
-                self._parse_v11_csgo(reader)
-            return
-
-        if app_id == SteamAppId.BLACK_MESA and version in (10, 11):
-            # Black Mesa uses different structures
-            if version == 10 and size == 72:
-                self._parse_v10(reader)
-                return
-            elif version == 11:
-                if size == 76:
-                    self._parse_v11_lite(reader)
-                    return
-                elif size == 80:
-                    self._parse_v11(reader)
-                    return
-
-        if version == 4:
-            self._parse_v4(reader)
-            return
-
-        if version == 5:
-            self._parse_v5(reader)
-            return
+_PROP_V4_FIELDS = [
+    ("origin", np.float32, (3,)),
+    ("rotation", np.float32, (3,)),
+    ("prop_type", np.uint16),
+    ("first_leaf", np.uint16),
+    ("leaf_count", np.uint16),
+    ("solid", np.uint8),
+    ("flags", np.uint8),
+    ("skin", np.int32),
+    ("fade_min_dist", np.float32),
+    ("fade_max_dist", np.float32),
+    ("lighting_origin", np.float32, (3,)),
+]
+_PROP_V5_FIELDS = _PROP_V4_FIELDS + [
+    ("forced_fade_scale", np.float32),
+]
+_PROP_V6_FIELDS = _PROP_V5_FIELDS + [
+    ("min_dx_level", np.uint16),
+    ("max_dx_level", np.uint16),
+]
+_PROP_V8_FIELDS = _PROP_V5_FIELDS + [
+    ("min_cpu_level", np.uint8),
+    ("max_cpu_level", np.uint8),
+    ("min_gpu_level", np.uint8),
+    ("max_gpu_level", np.uint8),
+    ("diffuse_modulation", np.uint8, (4,)),
+]
+_PROP_V9_FIELDS = _PROP_V8_FIELDS + [
+    ("disable_x360", np.uint32),
+]
+# Starting with v10 flags are stored as uint32 after dx levels, old byte flags are left unused
+_PROP_V10_FIELDS = [("legacy_flags",) + field[1:] if field[0] == "flags" else field for field in _PROP_V6_FIELDS] + [
+    ("flags", np.uint32),
+    ("lightmap_resolution", np.uint16, (2,)),
+]
+_PROP_V10_CSGO_FIELDS = _PROP_V9_FIELDS + [
+    ("_unk", np.void, 4),
+]
+_PROP_V11_LITE_FIELDS = _PROP_V10_FIELDS + [
+    ("diffuse_modulation", np.uint8, (4,)),
+]
+_PROP_V11_CSGO_FIELDS = _PROP_V10_CSGO_FIELDS + [
+    ("uniform_scale", np.float32),
+]
+
+STATIC_PROP_V4_DTYPE = np.dtype(_PROP_V4_FIELDS)
+STATIC_PROP_V5_DTYPE = np.dtype(_PROP_V5_FIELDS)
+STATIC_PROP_V6_DTYPE = np.dtype(_PROP_V6_FIELDS)
+STATIC_PROP_V7_L4D_DTYPE = np.dtype(_PROP_V6_FIELDS + [("diffuse_modulation", np.uint8, (4,))])
+STATIC_PROP_V8_DTYPE = np.dtype(_PROP_V8_FIELDS)
+STATIC_PROP_V9_DTYPE = np.dtype(_PROP_V9_FIELDS)
+STATIC_PROP_V10_DTYPE = np.dtype(_PROP_V10_FIELDS)
+STATIC_PROP_V10_CSGO_DTYPE = np.dtype(_PROP_V10_CSGO_FIELDS)
+STATIC_PROP_V11_LITE_DTYPE = np.dtype(_PROP_V11_LITE_FIELDS)
+STATIC_PROP_V11_DTYPE = np.dtype(_PROP_V11_LITE_FIELDS + [("flags_ex", np.int32)])
+STATIC_PROP_V11_CSGO_DTYPE = np.dtype(_PROP_V11_CSGO_FIELDS)
+STATIC_PROP_V12_DTYPE = np.dtype([
+    ("origin", np.float32, (3,)),
+    ("rotation", np.float32, (3,)),
+    ("prop_type", np.int16),
+    ("_unk0", np.void, 6),
+    ("skin", np.int32),
+    ("_unk1", np.void, 48),
+])
+STATIC_PROP_V13_STRATA_DTYPE = np.dtype(_PROP_V11_CSGO_FIELDS + [("uniform_scale_yz", np.float32, (2,))])
+# Dark Messiah
+STATIC_PROP_DM_DTYPE = np.dtype(_PROP_V6_FIELDS + [("_unk", np.void, 72)])
+
+# Common layout every static prop version is converted into, fields missing in the source version stay zeroed
+STATIC_PROP_DTYPE = np.dtype([
+    ("origin", np.float32, (3,)),
+    ("rotation", np.float32, (3,)),
+    ("prop_type", np.int32),
+    ("first_leaf", np.uint16),
+    ("leaf_count", np.uint16),
+    ("solid", np.uint8),
+    ("flags", np.uint32),
+    ("skin", np.int32),
+    ("fade_min_dist", np.float32),
+    ("fade_max_dist", np.float32),
+    ("lighting_origin", np.float32, (3,)),
+    ("forced_fade_scale", np.float32),
+    ("min_dx_level", np.uint16),
+    ("max_dx_level", np.uint16),
+    ("lightmap_resolution", np.uint16, (2,)),
+    ("min_cpu_level", np.uint8),
+    ("max_cpu_level", np.uint8),
+    ("min_gpu_level", np.uint8),
+    ("max_gpu_level", np.uint8),
+    ("diffuse_modulation", np.uint8, (4,)),
+    ("disable_x360", np.uint32),
+    ("flags_ex", np.int32),
+    ("uniform_scale", np.float32),
+    ("uniform_scale_yz", np.float32, (2,)),
+    # Vindictus specific
+    ("scaling", np.float32, (3,)),
+])
+
+VINDICTUS_PROP_SCALING_DTYPE = np.dtype([
+    ("prop_id", np.int32),
+    ("scale", np.float32, (3,)),
+])
+
+
+def get_static_prop_dtype(version: int, bsp_version: tuple[int, int], size: int, app_id: int) -> Optional[np.dtype]:
+    """Select on disk static prop layout by game lump version, BSP version, prop size and game."""
+    if bsp_version == (20, 4):
+        return STATIC_PROP_DM_DTYPE
+
+    if app_id == SteamAppId.LEFT_4_DEAD and version == 7 and size == 68:
+        # Old Left 4 Dead maps use v7 and incompatible with newer v7 from Source 2013
+        return STATIC_PROP_V7_L4D_DTYPE
+
+    if app_id == SteamAppId.TEAM_FORTRESS_2 and version == 7 and size == 72:
+        # Old Team Fortress 2 maps use v7 which became v10 in Source 2013
+        return STATIC_PROP_V10_DTYPE
+
+    if app_id == SteamAppId.COUNTER_STRIKE_GO and version in (10, 11):
+        # Some Counter-Strike: GO use v10 which is not compatible with Source 2013, now use v11
+        return STATIC_PROP_V10_CSGO_DTYPE if version == 10 else STATIC_PROP_V11_CSGO_DTYPE
+
+    if app_id == SteamAppId.BLACK_MESA and version in (10, 11):
+        # Black Mesa uses different structures
+        if version == 10 and size == 72:
+            return STATIC_PROP_V10_DTYPE
+        elif version == 11:
+            if size == 76:
+                return STATIC_PROP_V11_LITE_DTYPE
+            elif size == 80:
+                return STATIC_PROP_V11_DTYPE
+
+    if version == 4:
+        return STATIC_PROP_V4_DTYPE
+    if version == 5:
+        return STATIC_PROP_V5_DTYPE
+    if version == 6:
+        if app_id == SteamAppId.VINDICTUS:
+            return STATIC_PROP_V5_DTYPE
+        return STATIC_PROP_V6_DTYPE
+    if version == 7 and app_id == SteamAppId.VINDICTUS:
+        return STATIC_PROP_V6_DTYPE
+    if version == 8:
+        return STATIC_PROP_V8_DTYPE
+    if version == 9:
+        return STATIC_PROP_V9_DTYPE
+    if version == 10:
+        return STATIC_PROP_V10_DTYPE
+    if version == 11:
+        return STATIC_PROP_V11_DTYPE
+    if version == 12:
+        return STATIC_PROP_V12_DTYPE
+    if version == 13:
+        return STATIC_PROP_V13_STRATA_DTYPE
+    return None
 
-        if version == 6:
-            if app_id == SteamAppId.VINDICTUS:
-                self._parse_v6_vin(reader)
-                return
-            else:
-                self._parse_v6(reader)
-                return
-
-        if version == 7:
-            if app_id == SteamAppId.VINDICTUS:
-                self._parse_v7_vin(reader)
-                return
-
-            if app_id == SteamAppId.LEFT_4_DEAD and size == 68:
-                # Old Left 4 Dead maps use v7 and incompatible with newer v7 from Source 2013
-                self._parse_v7_l4d(reader)
-                return
-
-            if app_id == SteamAppId.TEAM_FORTRESS_2 and size == 72:
-                # Old Team Fortress 2 maps use v7 which became v10 in Source 2013
-                self._parse_v10(reader)
-                return
-
-        if version == 8:
-            self._parse_v8(reader)
-            return
-
-        if version == 9:
-            self._parse_v9(reader)
-            return
 
-        if version == 10:
-            if app_id == SteamAppId.COUNTER_STRIKE_GO:
-                self._parse_v10_csgo(reader)
-                return
-
-            self._parse_v10(reader)
-            return
-
-        if version == 11:
-            if app_id == SteamAppId.COUNTER_STRIKE_GO:
-                self._parse_v11_csgo(reader)
-                return
-
-            if app_id == SteamAppId.BLACK_MESA:
-                if size == 76:
-                    self._parse_v11_lite(reader)
-                    return
-                elif size == 80:
-                    self._parse_v11(reader)
-                    return
-
-            self._parse_v11(reader)
-            return
-
-        if version == 12:
-            self._parse_v12(reader)
-            return
-        if version == 13:
-            self._parse_v13_strata(reader)
-            return
-
-        logger.error(f'Cannot find handler for static prop of version {version} (size: {size}, app_id: {app_id})')
-        reader.skip(size)
-
-    def _parse_v4(self, reader: Buffer):
-        self.origin = reader.read_fmt('3f')
-        self.rotation = reader.read_fmt('3f')
-        self.prop_type, self.first_leaf, self.leaf_count = reader.read_fmt('3H')
-        self.solid, self.flags = reader.read_fmt('2B')
-        self.skin = reader.read_int32()
-        self.fade_min_dist, self.fade_max_dist = reader.read_fmt('2f')
-        self.lighting_origin = reader.read_fmt('3f')
-
-    def _parse_v5(self, reader: Buffer):
-        self._parse_v4(reader)
-        self.forced_fade_scale = reader.read_float()
-
-    def _parse_v6_vin(self, reader: Buffer):
-        self._parse_v5(reader)
-
-    def _parse_v6(self, reader: Buffer):
-        self._parse_v5(reader)
-        self.min_dx_level, self.max_dx_level = reader.read_fmt('2H')
-
-    def _parse_v7_l4d(self, reader: Buffer):
-        self._parse_v6(reader)
-        self.diffuse_modulation = reader.read_fmt('4B')
-
-    def _parse_v7_vin(self, reader: Buffer):
-        self._parse_v6(reader)
-
-    def _parse_v8(self, reader: Buffer):
-        self._parse_v5(reader)
-        self.min_cpu_level, self.max_cpu_level, self.min_gpu_level, self.max_gpu_level = reader.read_fmt('4B')
-        self.diffuse_modulation = reader.read_fmt('4B')
-
-    def _parse_v9(self, reader: Buffer):
-        self._parse_v8(reader)
-        self.disable_x360 = reader.read_fmt('I')
-
-    def _parse_v10(self, reader: Buffer):
-        self._parse_v6(reader)
-        self.flags = StaticPropFlag(reader.read_uint32())
-        self.lightmap_resolution = reader.read_fmt('2H')
-
-    def _parse_v10_csgo(self, reader: Buffer):
-        self._parse_v9(reader)
-        reader.skip(4)
+class StaticPropLump:
+    def __init__(self, glump_info):
+        self._glump_info: GameLumpHeader = glump_info
+        self.model_names: list[str] = []
+        self.leafs: np.ndarray = np.empty(0, np.uint16)
+        self.static_props: np.ndarray = np.empty(0, STATIC_PROP_DTYPE)
 
-    def _parse_v11_lite(self, reader: Buffer):
-        self._parse_v10(reader)
-        self.diffuse_modulation = reader.read_fmt('4B')
+    @property
+    def prop_count(self) -> int:
+        return len(self.static_props)
 
-    def _parse_v11(self, reader: Buffer):
-        self._parse_v11_lite(reader)
-        self.flags_ex = reader.read_int32()
+    @property
+    def origins(self) -> np.ndarray:
+        return self.static_props["origin"]
 
-    def _parse_v11_csgo(self, reader: Buffer):
-        self._parse_v10_csgo(reader)
-        self.uniform_scale = reader.read_float()
+    @property
+    def angles(self) -> np.ndarray:
+        """Pitch, yaw, roll in degrees."""
+        return self.static_props["rotation"]
 
-    def _parse_v12(self, reader: Buffer):
-        self.origin = reader.read_fmt('3f')
-        self.rotation = reader.read_fmt('3f')
-        self.prop_type = reader.read_int16()
-        reader.skip(4 + 2)
-        self.skin = reader.read_int32()
-        reader.skip(12 * 4)
+    @property
+    def model_ids(self) -> np.ndarray:
+        return self.static_props["prop_type"]
 
-    def _parse_v13_strata(self, reader: Buffer):
-        self._parse_v11_csgo(reader)
-        self.uniform_scale_yz = reader.read_fmt("2f")
+    @property
+    def skins(self) -> np.ndarray:
+        return self.static_props["skin"]
 
+    @property
+    def fade_distances(self) -> np.ndarray:
+        return np.stack([self.static_props["fade_min_dist"], self.static_props["fade_max_dist"]], 1)
 
-class StaticPropLump:
-    def __init__(self, glump_info):
-        self._glump_info: GameLumpHeader = glump_info
-        self.model_names: list[str] = []
-        self.leafs: list[int] = []
-        self.static_props: list[StaticProp] = []
+    @property
+    def scales(self) -> np.ndarray:
+        """Per axis scale, combined from uniform scale fields and Vindictus scale overrides."""
+        return self.static_props["scaling"]
 
     def parse(self, reader: Buffer, bsp: BSPFile):
         for _ in range(reader.read_int32()):
             self.model_names.append(reader.read_ascii_string(128))
-        if self._glump_info.version < 13:
-            for _ in range(reader.read_int32()):
-                self.leafs.append(reader.read_uint16())
-        else:
-            for _ in range(reader.read_int32()):
-                self.leafs.append(reader.read_uint32())
+        leaf_type = np.uint16 if self._glump_info.version < 13 else np.uint32
+        leaf_count = reader.read_int32()
+        self.leafs = np.frombuffer(reader.read_view(leaf_count * np.dtype(leaf_type).itemsize), leaf_type)
         if self._glump_info.version == 12:
             unk1 = reader.read_int32()
             unk2 = reader.read_int32()
-        prop_scaling = {}
+        prop_scaling = None
         if bsp.steam_app_id == SteamAppId.VINDICTUS:
-            for _ in range(reader.read_uint32()):
-                prop_id = reader.read_int32()
-                prop_scaling[prop_id] = reader.read_fmt('3f')
+            scaling_count = reader.read_uint32()
+            prop_scaling = np.frombuffer(reader.read_view(scaling_count * VINDICTUS_PROP_SCALING_DTYPE.itemsize),
+                                         VINDICTUS_PROP_SCALING_DTYPE)
 
         prop_count = reader.read_int32()
         if prop_count == 0:
             return
         prop_size = reader.remaining() // prop_count
-        for i in range(prop_count):
-            prop = StaticProp()
-            prop.parse(reader, self._glump_info.version, bsp.version, prop_size, bsp.steam_app_id)
-            self.static_props.append(prop)
-        if prop_scaling:
-            for prop_id, scale in prop_scaling.items():
-                self.static_props[prop_id].scaling[:] = scale
+        version = self._glump_info.version
+        dtype = get_static_prop_dtype(version, bsp.version, prop_size, bsp.steam_app_id)
+        if dtype is None:
+            logger.error(f'Cannot find handler for static prop of version {version} '
+                         f'(size: {prop_size}, app_id: {bsp.steam_app_id})')
+            return
+        records = np.frombuffer(reader.read_view(prop_count * dtype.itemsize), dtype)
+
+        static_props = np.zeros(prop_count, STATIC_PROP_DTYPE)
+        for name in dtype.names:
+            if name in STATIC_PROP_DTYPE.names:
+                static_props[name] = records[name]
+        static_props["scaling"] = 1.0
+        # CS:GO v11 and Strata v13 store per prop scale, uniform one or X component followed by Y and Z
+        if "uniform_scale" in dtype.names:
+            uniform_scale = records["uniform_scale"]
+            static_props["scaling"] = np.where(uniform_scale != 0, uniform_scale, 1.0)[:, None]
+        if "uniform_scale_yz" in dtype.names:
+            scale_yz = records["uniform_scale_yz"]
+            static_props["scaling"][:, 1:] = np.where(scale_yz != 0, scale_yz, static_props["scaling"][:, 1:])
+        if prop_scaling is not None and len(prop_scaling):
+            static_props["scaling"][prop_scaling["prop_id"]] = prop_scaling["scale"]
+        self.static_props = static_props
@@ -1,10 +1,32 @@
 from dataclasses import dataclass
 
+import numpy as np
+
 from SourceIO.library.shared.types import Vector3
 from SourceIO.library.source1.bsp.bsp_file import BSPFile
 from SourceIO.library.utils.file_utils import Buffer
 
 
+TEXTURE_DATA_DTYPE = np.dtype([
+    ("reflectivity", np.float32, (3,)),
+    ("name_id", np.int32),
+    ("width", np.int32),
+    ("height", np.int32),
+    ("view_width", np.int32),
+    ("view_height", np.int32),
+])
+
+RESPAWN_TEXTURE_DATA_DTYPE = np.dtype([
+    ("reflectivity", np.float32, (3,)),
+    ("name_id", np.int32),
+    ("width", np.int32),
+    ("height", np.int32),
+    ("view_width", np.int32),
+    ("view_height", np.int32),
+    ("unk1", np.int32),
+])
+
+
 @dataclass(slots=True)
 class TextureData:
     reflectivity: Vector3[float]
@@ -24,6 +46,15 @@ class TextureData:
         view_height = buffer.read_int32()
         return cls(reflectivity, name_id, width, height, view_width, view_height)
 
+    @staticmethod
+    def get_dtype(version: int) -> np.dtype:
+        return TEXTURE_DATA_DTYPE
+
+    @classmethod
+    def from_record(cls, record: np.void):
+        reflectivity, *values = record.item()
+        return cls(tuple(reflectivity.tolist()), *values)
+
 
 @dataclass(slots=True)
 class RespawnTextureData(TextureData):
@@ -39,3 +70,7 @@ class RespawnTextureData(TextureData):
         view_height = buffer.read_int32()
         unk1 = buffer.read_int32()
         return cls(reflectivity, name_id, width, height, view_width, view_height, unk1)
+
+    @staticmethod
+    def get_dtype(version: int) -> np.dtype:
+        return RESPAWN_TEXTURE_DATA_DTYPE
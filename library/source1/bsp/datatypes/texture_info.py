@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from enum import IntFlag
 
+import numpy as np
+
 from SourceIO.library.shared.types import Vector4
 from SourceIO.library.source1.bsp.bsp_file import BSPFile
 from SourceIO.library.utils.file_utils import Buffer
@@ -22,6 +24,22 @@ class SurfaceInfo(IntFlag):
     SURF_HITBOX = 0x8000  # surface is part of a hitbox
 
 
+TEXTURE_INFO_DTYPE = np.dtype([
+    ("texture_vectors", np.float32, (2, 4)),
+    ("lightmap_vectors", np.float32, (2, 4)),
+    ("flags", np.uint32),
+    ("texture_data_id", np.int32),
+])
+
+DM_TEXTURE_INFO_DTYPE = np.dtype([
+    ("texture_vectors", np.float32, (2, 4)),
+    ("lightmap_vectors", np.float32, (2, 4)),
+    ("unk", np.uint8, (24,)),
+    ("flags", np.uint32),
+    ("texture_data_id", np.int32),
+])
+
+
 @dataclass(slots=True)
 class TextureInfo:
     texture_vectors: tuple[Vector4[float], Vector4[float]]
@@ -38,3 +56,15 @@ class TextureInfo:
         flags = SurfaceInfo(buffer.read_uint32())
         texture_data_id = buffer.read_int32()
         return cls(texture_vectors, lightmap_vectors, flags, texture_data_id)
+
+    @staticmethod
+    def get_dtype(bsp: BSPFile) -> np.dtype:
+        return DM_TEXTURE_INFO_DTYPE if bsp.version == (20, 4) else TEXTURE_INFO_DTYPE
+
+    @classmethod
+    def from_record(cls, record: np.void):
+        texture_vectors = record["texture_vectors"].tolist()
+        lightmap_vectors = record["lightmap_vectors"].tolist()
+        return cls((tuple(texture_vectors[0]), tuple(texture_vectors[1])),
+                   (tuple(lightmap_vectors[0]), tuple(lightmap_vectors[1])),
+                   SurfaceInfo(int(record["flags"])), int(record["texture_data_id"]))
@@ -0,0 +1,278 @@
+from collections.abc import Collection
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
+from SourceIO.library.source1.bsp.bsp_file import BSPFile
+from SourceIO.library.source1.bsp.datatypes.displacement import (DISP_INFO_DTYPE, DISP_INFO_DTYPE_V1,
+                                                                 DISP_INFO_FLAG_HAS_MULTIBLEND, DISP_INFO_FLAG_MAGIC)
+
+
+@dataclass(slots=True)
+class BrushModelGeometry:
+    vertices: np.ndarray
+    vertex_ids: np.ndarray
+    loop_vertex_indices: np.ndarray
+    face_loop_starts: np.ndarray
+    face_loop_counts: np.ndarray
+    uvs: np.ndarray
+    lightmap_uvs: np.ndarray
+    tex_info_ids: np.ndarray
+    material_indices: np.ndarray
+    material_names: list[str]
+
+    @property
+    def face_count(self):
+        return len(self.face_loop_starts)
+
+    @property
+    def loop_count(self):
+        return len(self.loop_vertex_indices)
+
+
+def _get_model_faces(bsp: BSPFile, model_id: int) -> np.ndarray:
+    model = bsp.get_lump("LUMP_MODELS").models[model_id]
+    faces = bsp.get_lump("LUMP_FACES").faces.records[model.first_face:model.first_face + model.face_count]
+    return faces[faces["disp_info_id"] == -1]
+
+
+def _get_name_ids(bsp: BSPFile, tex_info_ids: np.ndarray) -> np.ndarray:
+    texture_info = bsp.get_lump("LUMP_TEXINFO").texture_info.records
+    texture_data = bsp.get_lump("LUMP_TEXDATA").texture_data.records
+    return texture_data["name_id"][texture_info["texture_data_id"][tex_info_ids]]
+
+
+def _get_material_names(bsp: BSPFile, tex_info_ids: np.ndarray) -> tuple[np.ndarray, list[str]]:
+    """Return material name id for every texture info and names of all unique materials ordered by texture info id."""
+    strings: list[str] = bsp.get_lump("LUMP_TEXDATA_STRING_TABLE").strings
+    name_ids = _get_name_ids(bsp, tex_info_ids)
+    _, first_index = np.unique(tex_info_ids, return_index=True)
+    names = dict.fromkeys(strings[name_id] or "NO_NAME" for name_id in name_ids[first_index].tolist())
+    return name_ids, list(names)
+
+
+def get_brush_model_material_names(bsp: BSPFile, model_id: int) -> list[str]:
+    """Names of materials used by non-displacement faces of brush model, in the order materials should be added."""
+    faces = _get_model_faces(bsp, model_id)
+    _, names = _get_material_names(bsp, faces["tex_info_id"].astype(np.int64))
+    return names
+
+
+def extract_brush_model(bsp: BSPFile, model_id: int, skip_materials: Collection[str] = ()) -> BrushModelGeometry:
+    """Build flat mesh arrays of brush model from faces, surfedges and edges lumps.
+
+    Displacement faces and faces using any of ``skip_materials`` are left out. Loops of every face are stored
+    in reversed order (Source winding is clockwise), duplicate vertices of a face are dropped
+    and faces left with less than 3 vertices are skipped.
+    """
+    surf_edges: np.ndarray = bsp.get_lump("LUMP_SURFEDGES").surf_edges
+    edges: np.ndarray = bsp.get_lump("LUMP_EDGES").edges
+    bsp_vertices: np.ndarray = bsp.get_lump("LUMP_VERTICES").vertices
+    texture_info = bsp.get_lump("LUMP_TEXINFO").texture_info.records
+    texture_data = bsp.get_lump("LUMP_TEXDATA").texture_data.records
+
+    faces = _get_model_faces(bsp, model_id)
+    tex_info_ids = faces["tex_info_id"].astype(np.int64)
+    name_ids, material_names = _get_material_names(bsp, tex_info_ids)
+    if skip_materials:
+        strings: list[str] = bsp.get_lump("LUMP_TEXDATA_STRING_TABLE").strings
+        skipped_name_ids = [name_id for name_id in np.unique(name_ids).tolist()
+                            if (strings[name_id] or "NO_NAME") in skip_materials]
+        face_mask = ~np.isin(name_ids, skipped_name_ids)
+        faces, tex_info_ids, name_ids = faces[face_mask], tex_info_ids[face_mask], name_ids[face_mask]
+        material_names = [name for name in material_names if name not in skip_materials]
+
+    edge_counts = faces["edge_count"].astype(np.int64)
+    loop_face_ids = np.repeat(np.arange(len(faces)), edge_counts)
+    loop_positions = np.arange(len(loop_face_ids)) - np.repeat(np.cumsum(edge_counts) - edge_counts, edge_counts)
+    used_surf_edges = surf_edges[np.repeat(faces["first_edge"].astype(np.int64), edge_counts) + loop_positions]
+    used_edges = edges[np.abs(used_surf_edges)]
+    loop_vertex_ids = np.where(used_surf_edges > 0, used_edges[:, 0], used_edges[:, 1]).astype(np.int64)
+
+    # Keep only first occurrence of vertex within a face
+    order = np.lexsort((loop_positions, loop_vertex_ids, loop_face_ids))
+    keep = np.ones(len(order), dtype=bool)
+    keep[order[1:]] = ((loop_face_ids[order[1:]] != loop_face_ids[order[:-1]]) |
+                       (loop_vertex_ids[order[1:]] != loop_vertex_ids[order[:-1]]))
+    face_loop_counts = np.bincount(loop_face_ids[keep], minlength=len(faces))
+    keep &= face_loop_counts[loop_face_ids] >= 3
+    loop_face_ids, loop_positions, loop_vertex_ids = loop_face_ids[keep], loop_positions[keep], loop_vertex_ids[keep]
+
+    order = np.lexsort((-loop_positions, loop_face_ids))
+    loop_face_ids, loop_vertex_ids = loop_face_ids[order], loop_vertex_ids[order]
+
+    used_faces = face_loop_counts >= 3
+    face_loop_counts = face_loop_counts[used_faces]
+    face_remap = np.cumsum(used_faces) - 1
+    loop_face_ids = face_remap[loop_face_ids]
+    tex_info_ids, name_ids = tex_info_ids[used_faces], name_ids[used_faces]
+    face_loop_starts = np.cumsum(face_loop_counts) - face_loop_counts
+
+    vertex_ids, loop_vertex_indices = np.unique(loop_vertex_ids, return_inverse=True)
+
+    loop_tex_info_ids = tex_info_ids[loop_face_ids]
+    texture_data_ids = texture_info["texture_data_id"][loop_tex_info_ids]
+    widths = texture_data["width"][texture_data_ids].astype(np.float32)
+    heights = texture_data["height"][texture_data_ids].astype(np.float32)
+    widths[widths == 0] = 512
+    heights[heights == 0] = 512
+    loop_positions = bsp_vertices[loop_vertex_ids]
+
+    def _project(vectors: np.ndarray) -> np.ndarray:
+        u = (np.einsum("ij,ij->i", loop_positions, vectors[:, 0, :3]) + vectors[:, 0, 3]) / widths
+        v = 1 - ((np.einsum("ij,ij->i", loop_positions, vectors[:, 1, :3]) + vectors[:, 1, 3]) / heights)
+        return np.stack([u, v], axis=1).astype(np.float32)
+
+    uvs = _project(texture_info["texture_vectors"][loop_tex_info_ids])
+    lightmap_uvs = _project(texture_info["lightmap_vectors"][loop_tex_info_ids])
+
+    strings: list[str] = bsp.get_lump("LUMP_TEXDATA_STRING_TABLE").strings
+    material_lookup = {name: i for i, name in enumerate(material_names)}
+    unique_name_ids, name_id_indices = np.unique(name_ids, return_inverse=True)
+    material_indices = np.array([material_lookup[strings[name_id] or "NO_NAME"]
+                                 for name_id in unique_name_ids.tolist()], np.int32)[name_id_indices]
+
+    return BrushModelGeometry(bsp_vertices[vertex_ids], vertex_ids, loop_vertex_indices.astype(np.int32),
+                              face_loop_starts.astype(np.int32), face_loop_counts.astype(np.int32), uvs,
+                              lightmap_uvs, tex_info_ids, material_indices.reshape(-1), material_names)
+
+
+@dataclass(slots=True)
+class DisplacementMesh:
+    material_name: str
+    disp_ids: np.ndarray
+    vertices: np.ndarray
+    uvs: np.ndarray
+    alpha: np.ndarray
+    indices: np.ndarray
+    multiblend: Optional[np.ndarray] = None
+    alphablend: Optional[np.ndarray] = None
+    multiblend_colors: Optional[np.ndarray] = None
+
+
+@lru_cache(16)
+def _displacement_grid_weights(power: int) -> np.ndarray:
+    """Bilinear weights of the 4 rotated face corners for every vertex of displacement grid, row by row."""
+    edge_size = (1 << power) + 1
+    t, s = np.meshgrid(np.linspace(0, 1, edge_size), np.linspace(0, 1, edge_size), indexing="ij")
+    t, s = t.ravel(), s.ravel()
+    return np.stack([(1 - t) * (1 - s), t * (1 - s), t * s, (1 - t) * s], axis=1).astype(np.float32)
+
+
+@lru_cache(16)
+def _displacement_grid_triangles(power: int) -> np.ndarray:
+    edge_size = (1 << power) + 1
+    i, j = np.meshgrid(np.arange(edge_size - 1), np.arange(edge_size - 1), indexing="ij")
+    index = (i * edge_size + j).ravel().astype(np.uint32)
+    odd = (index & 1).astype(bool)[:, None]
+    first = np.where(odd,
+                     np.stack([index, index + 1, index + edge_size], axis=1),
+                     np.stack([index, index + edge_size + 1, index + edge_size], axis=1))
+    second = np.where(odd,
+                      np.stack([index + 1, index + edge_size + 1, index + edge_size], axis=1),
+                      np.stack([index, index + 1, index + edge_size + 1], axis=1))
+    return np.stack([first, second], axis=1).reshape(-1, 3)
+
+
+def _get_start_corners(corners: np.ndarray, start_positions: np.ndarray) -> np.ndarray:
+    matches = np.all(np.isclose(corners, start_positions[:, None, :], 0.5e-2), axis=2)
+    nearest = np.argmin(np.linalg.norm(corners - start_positions[:, None, :], axis=2), axis=1)
+    return np.where(np.any(matches, axis=1), np.argmax(matches, axis=1), nearest)
+
+
+def tessellate_displacements(bsp: BSPFile) -> list[DisplacementMesh]:
+    """Build displacement meshes merged per material.
+
+    Displacements are processed in groups of the same power, grid positions, UVs and triangles come from
+    precomputed per-power templates. Vertices are in map units with displacement offsets applied.
+    Multiblend layers are only present if at least one displacement of the material has them.
+    """
+    disp_info_lump = bsp.get_lump("LUMP_DISPINFO")
+    if not disp_info_lump or not len(disp_info_lump.infos):
+        return []
+    disp_multiblend = bsp.get_lump("LUMP_DISP_MULTIBLEND")
+    disp_verts_lump = bsp.get_lump("LUMP_DISP_VERTS")
+    strings: list[str] = bsp.get_lump("LUMP_TEXDATA_STRING_TABLE").strings
+    surf_edges: np.ndarray = bsp.get_lump("LUMP_SURFEDGES").surf_edges
+    edges: np.ndarray = bsp.get_lump("LUMP_EDGES").edges
+    bsp_vertices: np.ndarray = bsp.get_lump("LUMP_VERTICES").vertices
+    faces = bsp.get_lump("LUMP_FACES").faces.records
+    texture_info = bsp.get_lump("LUMP_TEXINFO").texture_info.records
+    texture_data = bsp.get_lump("LUMP_TEXDATA").texture_data.records
+
+    infos = disp_info_lump.infos.records
+    powers = infos["power"].astype(np.int64)
+    vertex_counts = ((1 << powers) + 1) ** 2
+    if infos.dtype in (DISP_INFO_DTYPE, DISP_INFO_DTYPE_V1):
+        min_tess = infos["min_tess"].astype(np.int64)
+    else:
+        min_tess = np.zeros(len(infos), np.int64)
+    has_multiblend = ((min_tess + DISP_INFO_FLAG_MAGIC) & DISP_INFO_FLAG_HAS_MULTIBLEND) != 0
+    if not disp_multiblend:
+        has_multiblend[:] = False
+    multiblend_counts = np.where(has_multiblend, vertex_counts, 0)
+    multiblend_starts = np.cumsum(multiblend_counts) - multiblend_counts
+
+    src_faces = faces[infos["map_face"].astype(np.int64)]
+    corner_surf_edges = surf_edges[src_faces["first_edge"].astype(np.int64)[:, None] + np.arange(4)]
+    corner_edges = edges[np.abs(corner_surf_edges)]
+    corner_ids = np.where(corner_surf_edges > 0, corner_edges[..., 0], corner_edges[..., 1])
+    corners = bsp_vertices[corner_ids]
+    start_corners = _get_start_corners(corners, infos["start_position"])
+    rotation = (start_corners[:, None] + np.arange(4)) & 3
+    corners = np.take_along_axis(corners, rotation[:, :, None], axis=1)
+
+    tex_info_ids = src_faces["tex_info_id"].astype(np.int64)
+    texture_vectors = texture_info["texture_vectors"][tex_info_ids]
+    texture_data_ids = texture_info["texture_data_id"][tex_info_ids]
+    view_sizes = np.stack([texture_data["view_width"][texture_data_ids],
+                           texture_data["view_height"][texture_data_ids]], axis=1).astype(np.float32)
+    name_ids = texture_data["name_id"][texture_data_ids]
+    material_names = [strings[name_id] or "NO_NAME" for name_id in name_ids.tolist()]
+
+    materials: dict[str, list[int]] = {}
+    for disp_id, material_name in enumerate(material_names):
+        materials.setdefault(material_name, []).append(disp_id)
+
+    disp_vertices = disp_verts_lump.vertices
+    offsets = disp_verts_lump.transformed_vertices
+    meshes = []
+    for material_name, disp_ids in materials.items():
+        disp_ids = np.asarray(disp_ids, np.int64)
+        with_multiblend = bool(np.any(has_multiblend[disp_ids]))
+        blocks = []
+        vertex_offset = 0
+        for power in np.unique(powers[disp_ids]).tolist():
+            group = disp_ids[powers[disp_ids] == power]
+            vertex_count = ((1 << power) + 1) ** 2
+            positions = np.einsum("vk,dkc->dvc", _displacement_grid_weights(power), corners[group])
+            u = np.einsum("dvc,dc->dv", positions, texture_vectors[group, 0, :3]) + texture_vectors[group, 0, 3:]
+            v = np.einsum("dvc,dc->dv", positions, texture_vectors[group, 1, :3]) + texture_vectors[group, 1, 3:]
+            uvs = np.stack([u / view_sizes[group, 0:1], 1 - v / view_sizes[group, 1:2]], axis=2)
+            vertex_ids = infos["disp_vert_start"][group].astype(np.int64)[:, None] + np.arange(vertex_count)
+            triangles = (_displacement_grid_triangles(power)[None, :, :] +
+                         (vertex_offset + np.arange(len(group), dtype=np.uint32) * vertex_count)[:, None, None])
+            block = [group, (positions + offsets[vertex_ids]).reshape(-1, 3), uvs.reshape(-1, 2),
+                     disp_vertices["alpha"][vertex_ids].reshape(-1), triangles.reshape(-1, 3)]
+            if with_multiblend:
+                blends = np.zeros((len(group), vertex_count), disp_multiblend.dtype)
+                group_has_multiblend = has_multiblend[group]
+                blend_ids = multiblend_starts[group][group_has_multiblend][:, None] + np.arange(vertex_count)
+                blends[group_has_multiblend] = disp_multiblend.blends[blend_ids]
+                block.append(blends.reshape(-1))
+            blocks.append(block)
+            vertex_offset += len(group) * vertex_count
+
+        group_ids, vertices, uvs, alpha, indices, *blends = [np.concatenate(items) for items in zip(*blocks)]
+        mesh = DisplacementMesh(material_name, group_ids, vertices.astype(np.float32), uvs.astype(np.float32),
+                                alpha.astype(np.float32), indices.astype(np.uint32))
+        if blends:
+            blends = blends[0]
+            # Blender shaders expect first and last multiblend weights swapped
+            mesh.multiblend = blends["multiblend"][:, [3, 1, 2, 0]]
+            mesh.alphablend = blends["alphablend"].copy()
+            mesh.multiblend_colors = blends["multiblend_colors"].copy()
+        meshes.append(mesh)
+    return meshes
@@ -1,11 +1,48 @@
 import lzma
+from collections.abc import Sequence
 from dataclasses import dataclass, field
-from typing import Optional, Type, Union
+from typing import Callable, Generic, Iterator, Optional, Type, TypeVar, Union
+
+import numpy as np
 
 from SourceIO.library.shared.app_id import SteamAppId
 from SourceIO.library.utils.file_utils import Buffer, MemoryBuffer
 from SourceIO.library.utils.math_utilities import sizeof_fmt
 
+T = TypeVar("T")
+
+
+def read_records(buffer: Buffer, dtype: np.dtype) -> np.ndarray:
+    """Read rest of the buffer as array of fixed size records, trailing partial record is ignored."""
+    data = buffer.read_view()
+    return np.frombuffer(data, dtype, data.nbytes // dtype.itemsize)
+
+
+class LazyRecordList(Sequence, Generic[T]):
+    """Read-only list over structured numpy records, python objects are built only for indexed records."""
+
+    def __init__(self, records: np.ndarray, factory: Callable[[np.void], T]):
+        self.records = records
+        self._factory = factory
+        self._items: list[Optional[T]] = [None] * len(records)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._items)))]
+        item = self._items[index]
+        if item is None:
+            item = self._items[index] = self._factory(self.records[index])
+        return item
+
+    def __iter__(self) -> Iterator[T]:
+        for i in range(len(self._items)):
+            yield self[i]
+
+    def __repr__(self):
+        return f"<LazyRecordList {self.records.dtype} x {len(self)}>"
 
 
 @dataclass(slots=True)
@@ -111,7 +148,7 @@ class Lump:
         compressed_size = buffer.read_uint32()
         filter_properties = lzma._decode_filter_properties(lzma.FILTER_LZMA1, buffer.read(5))
 
-        compressed_buffer = buffer.read(compressed_size)
+        compressed_buffer = buffer.read_view(compressed_size)
         chunks: list[bytes] = []
 
         while True:
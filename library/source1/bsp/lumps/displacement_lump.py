@@ -1,7 +1,9 @@
+from collections.abc import Sequence
+
 import numpy as np
 
 from SourceIO.library.shared.app_id import SteamAppId
-from SourceIO.library.source1.bsp import Lump, LumpInfo, lump_tag
+from SourceIO.library.source1.bsp import Lump, LumpInfo, lump_tag, LazyRecordList, read_records
 from SourceIO.library.source1.bsp.bsp_file import BSPFile
 from SourceIO.library.source1.bsp.datatypes.displacement import DispInfo, VDispInfo, StrataDispInfo
 from SourceIO.library.utils import Buffer
@@ -11,11 +13,10 @@ from SourceIO.library.utils import Buffer
 class DispInfoLump(Lump):
     def __init__(self, lump_info: LumpInfo):
         super().__init__(lump_info)
-        self.infos: list[DispInfo] = []
+        self.infos: Sequence[DispInfo] = []
 
     def parse(self, buffer: Buffer, bsp: BSPFile):
-        while buffer:
-            self.infos.append(DispInfo.from_buffer(buffer, self.version, bsp))
+        self.infos = LazyRecordList(read_records(buffer, DispInfo.get_dtype(self.version)), DispInfo.from_record)
         return self
 
 
@@ -23,11 +24,10 @@ class DispInfoLump(Lump):
 class DispInfoLumpV1(Lump):
     def __init__(self, lump_info: LumpInfo):
         super().__init__(lump_info)
-        self.infos: list[StrataDispInfo] = []
+        self.infos: Sequence[StrataDispInfo] = []
 
     def parse(self, buffer: Buffer, bsp: BSPFile):
-        while buffer:
-            self.infos.append(StrataDispInfo.from_buffer(buffer, self.version, bsp))
+        self.infos = LazyRecordList(read_records(buffer, StrataDispInfo.get_dtype(self.version)), StrataDispInfo.from_record)
         return self
 
 
@@ -35,11 +35,10 @@ class DispInfoLumpV1(Lump):
 class VDispInfoLump(Lump):
     def __init__(self, lump_info: LumpInfo):
         super().__init__(lump_info)
-        self.infos: list[DispInfo] = []
+        self.infos: Sequence[DispInfo] = []
 
     def parse(self, buffer: Buffer, bsp: BSPFile):
-        while buffer:
-            self.infos.append(VDispInfo.from_buffer(buffer, self.version, bsp))
+        self.infos = LazyRecordList(read_records(buffer, VDispInfo.get_dtype(self.version)), VDispInfo.from_record)
         return self
 
 
@@ -60,7 +59,7 @@ class DispVertLump(Lump):
         self.transformed_vertices = np.array((-1, 3))
 
     def parse(self, buffer: Buffer, bsp: BSPFile):
-        self.vertices = np.frombuffer(buffer.read(), self.dtype)
+        self.vertices = np.frombuffer(buffer.read_view(), self.dtype)
 
         self.transformed_vertices = self.vertices['position'] * self.vertices['dist']
 
@@ -84,5 +83,5 @@ class DispMultiblendLump(Lump):
 
     def parse(self, buffer: Buffer, bsp: BSPFile):
         assert self._info.size % self.dtype.itemsize == 0
-        self.blends = np.frombuffer(buffer.read(), self.dtype)
+        self.blends = np.frombuffer(buffer.read_view(), self.dtype)
         return self
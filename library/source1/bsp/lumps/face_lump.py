@@ -1,5 +1,7 @@
+from collections.abc import Sequence
+
 from SourceIO.library.shared.app_id import SteamAppId
-from SourceIO.library.source1.bsp import Lump, LumpInfo, lump_tag
+from SourceIO.library.source1.bsp import Lump, LumpInfo, lump_tag, LazyRecordList, read_records
 from SourceIO.library.source1.bsp.bsp_file import BSPFile
 from SourceIO.library.source1.bsp.datatypes.face import Face, VFace1, VFace2, RavenFace
 from SourceIO.library.utils import Buffer
@@ -8,11 +10,10 @@ from SourceIO.library.utils import Buffer
 class FaceLump(Lump):
     def __init__(self, lump_info: LumpInfo):
         super().__init__(lump_info)
-        self.faces: list[Face] = []
+        self.faces: Sequence[Face] = []
 
     def parse(self, buffer: Buffer, bsp: BSPFile):
-        while buffer:
-            self.faces.append(Face.from_buffer(buffer, self.version, bsp))
+        self.faces = LazyRecordList(read_records(buffer, Face.get_dtype(self.version)), Face.from_record)
         return self
 
 
@@ -20,11 +21,10 @@ class FaceLump(Lump):
 class OriginalFaceLump(Lump):
     def __init__(self, lump_info: LumpInfo):
         super().__init__(lump_info)
-        self.faces: list[Face] = []
+        self.faces: Sequence[Face] = []
 
     def parse(self, buffer: Buffer, bsp: BSPFile):
-        while buffer:
-            self.faces.append(Face.from_buffer(buffer, self.version, bsp))
+        self.faces = LazyRecordList(read_records(buffer, Face.get_dtype(self.version)), Face.from_record)
         return self
 
 
@@ -32,11 +32,10 @@ class OriginalFaceLump(Lump):
 class VFaceLump1(Lump):
     def __init__(self, lump_info: LumpInfo):
         super().__init__(lump_info)
-        self.faces: list[Face] = []
+        self.faces: Sequence[Face] = []
 
     def parse(self, buffer: Buffer, bsp: BSPFile):
-        while buffer:
-            self.faces.append(VFace1.from_buffer(buffer, self.version, bsp))
+        self.faces = LazyRecordList(read_records(buffer, VFace1.get_dtype(self.version)), VFace1.from_record)
         return self
 
 
@@ -44,11 +43,10 @@ class VFaceLump1(Lump):
 class VFaceLump2(Lump):
     def __init__(self, lump_info: LumpInfo):
         super().__init__(lump_info)
-        self.faces: list[Face] = []
+        self.faces: Sequence[Face] = []
 
     def parse(self, buffer: Buffer, bsp: BSPFile):
-        while buffer:
-            self.faces.append(VFace2.from_buffer(buffer, self.version, bsp))
+        self.faces = LazyRecordList(read_records(buffer, VFace2.get_dtype(self.version)), VFace2.from_record)
         return self
 
 
@@ -56,11 +54,10 @@ class VFaceLump2(Lump):
 class VOriginalFaceLump(Lump):
     def __init__(self, lump_info: LumpInfo):
         super().__init__(lump_info)
-        self.faces: list[Face] = []
+        self.faces: Sequence[Face] = []
 
     def parse(self, buffer: Buffer, bsp: BSPFile):
-        while buffer:
-            self.faces.append(VFace1.from_buffer(buffer, self.version, bsp))
+        self.faces = LazyRecordList(read_records(buffer, VFace1.get_dtype(self.version)), VFace1.from_record)
         return self
 
 
@@ -68,11 +65,10 @@ class VOriginalFaceLump(Lump):
 class VOriginalFaceLump(Lump):
     def __init__(self, lump_info: LumpInfo):
         super().__init__(lump_info)
-        self.faces: list[Face] = []
+        self.faces: Sequence[Face] = []
 
     def parse(self, buffer: Buffer, bsp: BSPFile):
-        while buffer:
-            self.faces.append(VFace2.from_buffer(buffer, self.version, bsp))
+        self.faces = LazyRecordList(read_records(buffer, VFace2.get_dtype(self.version)), VFace2.from_record)
         return self
 
 
@@ -1,3 +1,5 @@
+from typing import Iterator, Type
+
 from SourceIO.library.shared.app_id import SteamAppId
 from SourceIO.library.source1.bsp import Lump, LumpInfo, lump_tag
 from SourceIO.library.source1.bsp.bsp_file import BSPFile
@@ -10,36 +12,46 @@ from SourceIO.library.utils import Buffer
 
 @lump_tag(35, 'LUMP_GAME_LUMP')
 class GameLump(Lump):
+    header_class: Type[GameLumpHeader] = GameLumpHeader
+
     def __init__(self, lump_info: LumpInfo):
         super().__init__(lump_info)
         self.lump_count = 0
         self.game_lumps_info: list[GameLumpHeader] = []
         self.game_lumps = {}
 
-    def parse(self, buffer: Buffer, bsp: BSPFile):
+    def read_headers(self, buffer: Buffer, bsp: BSPFile):
         self.lump_count = buffer.read_uint32()
         for _ in range(self.lump_count):
-            lump = GameLumpHeader.from_buffer(buffer, bsp)
+            lump = self.header_class.from_buffer(buffer, bsp)
             if not lump.id:
                 continue
             self.game_lumps_info.append(lump)
+
+    def compressed_lumps(self) -> Iterator[tuple[GameLumpHeader, int, int]]:
+        """Yield header, offset relative to this lump and size of every compressed game lump."""
+        for curr_index, lump in enumerate(self.game_lumps_info):
+            if lump.flags != 1:
+                continue
+            relative_offset = lump.offset - self._info.offset
+            if curr_index + 1 != len(self.game_lumps_info):
+                next_offset = self.game_lumps_info[curr_index + 1].offset - self._info.offset
+            else:
+                next_offset = self._info.size
+            yield lump, relative_offset, next_offset - relative_offset
+
+    def parse(self, buffer: Buffer, bsp: BSPFile):
+        self.read_headers(buffer, bsp)
+        compressed = {lump.id: (offset, size) for lump, offset, size in self.compressed_lumps()}
         for lump in self.game_lumps_info:
             relative_offset = lump.offset - self._info.offset
             print(f'GLump "{lump.id}" offset: {relative_offset} size: {lump.size} ')
-            with buffer.save_current_offset():
-                buffer.seek(relative_offset)
-                if lump.flags == 1:
-                    curr_index = self.game_lumps_info.index(lump)
-                    if curr_index + 1 != len(self.game_lumps_info):
-                        next_offset = self.game_lumps_info[curr_index + 1].offset - self._info.offset
-                    else:
-                        next_offset = self._info.size
-                    compressed_size = next_offset - relative_offset
-                    game_lump_buffer = Lump.decompress_lump(buffer.slice(size=compressed_size))
-                else:
-                    game_lump_buffer = buffer.slice(size=lump.size)
+            if lump.id in compressed:
+                offset, compressed_size = compressed[lump.id]
+                game_lump_buffer = bsp.get_game_lump_buffer(lump.id, buffer.slice(offset, compressed_size))
+            else:
+                game_lump_buffer = buffer.slice(relative_offset, lump.size)
 
-                pass  # TODO
             if lump.id == 'sprp':
                 game_lump = StaticPropLump(lump)
                 game_lump.parse(game_lump_buffer, bsp)
@@ -58,88 +70,10 @@ class GameLump21(GameLump):
 
 
 @lump_tag(35, 'LUMP_GAME_LUMP', bsp_version=(20, 4))
-class GameLump204(Lump):
-    def __init__(self, lump_info: LumpInfo):
-        super().__init__(lump_info)
-        self.lump_count = 0
-        self.game_lumps_info: list[GameLumpHeader] = []
-        self.game_lumps = {}
-
-    def parse(self, buffer: Buffer, bsp: BSPFile):
-        self.lump_count = buffer.read_uint32()
-        for _ in range(self.lump_count):
-            lump = DMGameLumpHeader.from_buffer(buffer, bsp)
-            if not lump.id:
-                continue
-            self.game_lumps_info.append(lump)
-        for lump in self.game_lumps_info:
-            relative_offset = lump.offset - self._info.offset
-            print(f'GLump "{lump.id}" offset: {relative_offset} size: {lump.size} ')
-            with buffer.save_current_offset():
-                buffer.seek(relative_offset)
-                if lump.flags == 1:
-                    curr_index = self.game_lumps_info.index(lump)
-                    if curr_index + 1 != len(self.game_lumps_info):
-                        next_offset = self.game_lumps_info[curr_index + 1].offset - self._info.offset
-                    else:
-                        next_offset = self._info.size
-                    compressed_size = next_offset - relative_offset
-                    game_lump_buffer = Lump.decompress_lump(buffer.slice(size=compressed_size))
-                else:
-                    game_lump_buffer = buffer.slice(size=lump.size)
-
-                pass  # TODO
-            if lump.id == 'sprp':
-                game_lump = StaticPropLump(lump)
-                game_lump.parse(game_lump_buffer, bsp)
-                self.game_lumps[lump.id] = game_lump
-            elif lump.id == 'dprp':
-                detail_lump = DetailPropLump(lump)
-                detail_lump.parse(game_lump_buffer, bsp)
-                self.game_lumps[lump.id] = detail_lump
-
-        return self
+class GameLump204(GameLump):
+    header_class = DMGameLumpHeader
 
 
 @lump_tag(35, 'LUMP_GAME_LUMP', steam_id=SteamAppId.VINDICTUS)
-class VGameLump(Lump):
-    def __init__(self, lump_info: LumpInfo):
-        super().__init__(lump_info)
-        self.lump_count = 0
-        self.game_lumps_info: list[GameLumpHeader] = []
-        self.game_lumps = {}
-
-    def parse(self, buffer: Buffer, bsp: BSPFile):
-        self.lump_count = buffer.read_uint32()
-        for _ in range(self.lump_count):
-            lump = VindictusGameLumpHeader.from_buffer(buffer, bsp)
-            if not lump.id:
-                continue
-            self.game_lumps_info.append(lump)
-        for lump in self.game_lumps_info:
-            relative_offset = lump.offset - self._info.offset
-            print(f'GLump "{lump.id}" offset: {relative_offset} size: {lump.size} ')
-            with buffer.save_current_offset():
-                buffer.seek(relative_offset)
-                if lump.flags == 1:
-                    curr_index = self.game_lumps_info.index(lump)
-                    if curr_index + 1 != len(self.game_lumps_info):
-                        next_offset = self.game_lumps_info[curr_index + 1].offset - self._info.offset
-                    else:
-                        next_offset = self._info.size
-                    compressed_size = next_offset - relative_offset
-                    game_lump_buffer = Lump.decompress_lump(buffer.slice(size=compressed_size))
-                else:
-                    game_lump_buffer = buffer.slice(size=lump.size)
-
-                pass  # TODO
-            if lump.id == 'sprp':
-                game_lump = StaticPropLump(lump)
-                game_lump.parse(game_lump_buffer, bsp)
-                self.game_lumps[lump.id] = game_lump
-            elif lump.id == 'dprp':
-                detail_lump = DetailPropLump(lump)
-                detail_lump.parse(game_lump_buffer, bsp)
-                self.game_lumps[lump.id] = detail_lump
-
-        return self
+class VGameLump(GameLump):
+    header_class = VindictusGameLumpHeader
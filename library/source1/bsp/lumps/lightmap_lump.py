@@ -13,7 +13,7 @@ class LightmapDataSkyLump(Lump):
         self.lightmap_data = np.array([])
 
     def parse(self, buffer: Buffer, bsp: BSPFile):
-        self.lightmap_data = np.frombuffer(buffer.read(), np.uint8).reshape((-1, 4))
+        self.lightmap_data = np.frombuffer(buffer.read_view(), np.uint8).reshape((-1, 4))
         return self
 
 
@@ -33,7 +33,7 @@ class LightmapDataLump(Lump):
         self.lightmap_data = np.array([])
 
     def parse(self, buffer: Buffer, bsp: BSPFile):
-        self.lightmap_data = np.frombuffer(buffer.read(), lightmap_dtype)
+        self.lightmap_data = np.frombuffer(buffer.read_view(), lightmap_dtype)
         return self
 
 
@@ -45,7 +45,7 @@ class LightmapDataHDRLump(Lump):
         self.lightmap_data = np.array([])
 
     def parse(self, buffer: Buffer, bsp: BSPFile):
-        self.lightmap_data = np.frombuffer(buffer.read(), lightmap_dtype)
+        self.lightmap_data = np.frombuffer(buffer.read_view(), lightmap_dtype)
         return self
 
 
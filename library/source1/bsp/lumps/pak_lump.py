@@ -22,6 +22,7 @@ class PakLump(Lump, ZIPContentProvider):
     def parse(self, buffer: Buffer, bsp: BSPFile):
         self.filepath = bsp.filepath
         if self._zip_file is None:
+            # Copied out of the map file, provider stays mounted after import and must not keep the map mapped
             zip_data = BytesIO(buffer.read())
             self._zip_file = zipfile.ZipFile(zip_data)
             self._cache = {TinyPath(a.lower()).as_posix(): a for a in self._zip_file.NameToInfo}
@@ -16,7 +16,7 @@ class StringOffsetLump(Lump):
         self.string_ids = np.array([])
 
     def parse(self, buffer: Buffer, bsp: BSPFile):
-        self.string_ids = np.frombuffer(buffer.read(), np.int32)
+        self.string_ids = np.frombuffer(buffer.read_view(), np.int32)
         return self
 
 
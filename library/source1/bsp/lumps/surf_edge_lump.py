@@ -12,7 +12,7 @@ class SurfEdgeLump(Lump):
         self.surf_edges = np.array([])
 
     def parse(self, buffer: Buffer, bsp: BSPFile):
-        self.surf_edges = np.frombuffer(buffer.read(), np.int32)
+        self.surf_edges = np.frombuffer(buffer.read_view(), np.int32)
         return self
 
 
@@ -23,5 +23,5 @@ class RavenIndicesLump(Lump):
         self.indices = np.array([])
 
     def parse(self, buffer: Buffer, bsp: BSPFile):
-        self.indices = np.frombuffer(buffer.read(), np.int32)
+        self.indices = np.frombuffer(buffer.read_view(), np.int32)
         return self
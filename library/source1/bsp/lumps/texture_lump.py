@@ -1,4 +1,6 @@
-from SourceIO.library.source1.bsp import Lump, LumpInfo, lump_tag
+from collections.abc import Sequence
+
+from SourceIO.library.source1.bsp import Lump, LumpInfo, lump_tag, LazyRecordList, read_records
 from SourceIO.library.source1.bsp.bsp_file import BSPFile
 from SourceIO.library.source1.bsp.datatypes.texture_data import RespawnTextureData, TextureData
 from SourceIO.library.source1.bsp.datatypes.texture_info import TextureInfo
@@ -10,11 +12,10 @@ class TextureInfoLump(Lump):
 
     def __init__(self, lump_info: LumpInfo):
         super().__init__(lump_info)
-        self.texture_info: list[TextureInfo] = []
+        self.texture_info: Sequence[TextureInfo] = []
 
     def parse(self, buffer: Buffer, bsp: BSPFile):
-        while buffer:
-            self.texture_info.append(TextureInfo.from_buffer(buffer, self.version, bsp))
+        self.texture_info = LazyRecordList(read_records(buffer, TextureInfo.get_dtype(bsp)), TextureInfo.from_record)
         return self
 
 
@@ -23,10 +24,10 @@ class TextureDataLump(Lump):
 
     def __init__(self, lump_info: LumpInfo):
         super().__init__(lump_info)
-        self.texture_data: list[TextureData] = []
+        self.texture_data: Sequence[TextureData] = []
 
     def parse(self, buffer: Buffer, bsp: BSPFile):
         texture_data_class = RespawnTextureData if bsp.version == (29, 0) else TextureData
-        while buffer:
-            self.texture_data.append(texture_data_class.from_buffer(buffer, self.version, bsp))
+        self.texture_data = LazyRecordList(read_records(buffer, texture_data_class.get_dtype(self.version)),
+                                           texture_data_class.from_record)
         return self
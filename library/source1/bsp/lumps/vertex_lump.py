@@ -13,7 +13,7 @@ class VertexLump(Lump):
         self.vertices = np.array([])
 
     def parse(self, buffer: Buffer, bsp: BSPFile):
-        self.vertices = np.frombuffer(buffer.read(), np.float32)
+        self.vertices = np.frombuffer(buffer.read_view(), np.float32)
         self.vertices = self.vertices.reshape((-1, 3))
         return self
 
@@ -33,7 +33,7 @@ class RavenVertexLump(Lump):
         self.vertices = np.array([])
 
     def parse(self, buffer: Buffer, bsp: BSPFile):
-        self.vertices = np.frombuffer(buffer.read(), self.dtype)
+        self.vertices = np.frombuffer(buffer.read_view(), self.dtype)
         return self
 
 
@@ -53,7 +53,7 @@ class UnLitVertexLump(Lump):
         self.vertex_info = np.array([])
 
     def parse(self, buffer: Buffer, bsp: BSPFile):
-        self.vertex_info = np.frombuffer(buffer.read(), self._dtype)
+        self.vertex_info = np.frombuffer(buffer.read_view(), self._dtype)
         return self
 
 
@@ -73,7 +73,7 @@ class LitVertexFlatLump(Lump):
         self.vertex_info = np.array([])
 
     def parse(self, buffer: Buffer, bsp: BSPFile):
-        self.vertex_info = np.frombuffer(buffer.read(), self._dtype)
+        self.vertex_info = np.frombuffer(buffer.read_view(), self._dtype)
         return self
 
 
@@ -96,7 +96,7 @@ class BumpLitVertexLump(Lump):
         self.vertex_info = np.array([])
 
     def parse(self, buffer: Buffer, bsp: BSPFile):
-        self.vertex_info = np.frombuffer(buffer.read(), self._dtype)
+        self.vertex_info = np.frombuffer(buffer.read_view(), self._dtype)
         return self
 
 
@@ -115,7 +115,7 @@ class UnlitTSVertexLump(Lump):
         self.vertex_info = np.array([])
 
     def parse(self, buffer: Buffer, bsp: BSPFile):
-        self.vertex_info = np.frombuffer(buffer.read(), self._dtype)
+        self.vertex_info = np.frombuffer(buffer.read_view(), self._dtype)
         return self
 
 
@@ -134,7 +134,7 @@ class BlinnPhongVertexLump(Lump):
         self.vertex_info = np.array([])
 
     def parse(self, buffer: Buffer, bsp: BSPFile):
-        self.vertex_info = np.frombuffer(buffer.read(), self._dtype)
+        self.vertex_info = np.frombuffer(buffer.read_view(), self._dtype)
         return self
 
 
@@ -155,7 +155,7 @@ class R5VertexLump(Lump):
         self.vertex_info = np.array([])
 
     def parse(self, buffer: Buffer, bsp: BSPFile):
-        self.vertex_info = np.frombuffer(buffer.read(), self._dtype)
+        self.vertex_info = np.frombuffer(buffer.read_view(), self._dtype)
         return self
 
 
@@ -175,5 +175,5 @@ class R7VertexLump(Lump):
         self.vertex_info = np.array([])
 
     def parse(self, buffer: Buffer, bsp: BSPFile):
-        self.vertex_info = np.frombuffer(buffer.read(), self._dtype)
+        self.vertex_info = np.frombuffer(buffer.read_view(), self._dtype)
         return self
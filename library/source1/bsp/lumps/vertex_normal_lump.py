@@ -12,7 +12,7 @@ class VertexNormalLump(Lump):
         self.normals = np.array([])
 
     def parse(self, buffer: Buffer, bsp: BSPFile):
-        self.normals = np.frombuffer(buffer.read(), np.float32)
+        self.normals = np.frombuffer(buffer.read_view(), np.float32)
         self.normals = self.normals.reshape((-1, 3))
         return self
 
@@ -24,5 +24,5 @@ class VertexNormalIndicesLump(Lump):
         self.indices = np.array([])
 
     def parse(self, buffer: Buffer, bsp: BSPFile):
-        self.indices = np.frombuffer(buffer.read(), np.int16)
+        self.indices = np.frombuffer(buffer.read_view(), np.int16)
         return self
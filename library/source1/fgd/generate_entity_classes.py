@@ -1,6 +1,7 @@
 import os
 from valvefgd import Fgd, FgdEntity, FgdParse
 
+from SourceIO.library.utils.entity_class_registry import write_entity_class_table
 from SourceIO.library.utils.tiny_path import TinyPath
 
 os.environ['NO_BPY'] = '1'
@@ -172,8 +173,10 @@ class Base:
     buffer += '\n}'
     # print(StandaloneContentManager().get_content_provider_from_path(fgd_path))
     output_name = TinyPath(fgd_path).stem
-    with open(f'../../../blender_bindings/source1/bsp/entities/{output_name}_entity_classes.py', 'w') as f:
+    output_path = TinyPath(f'../../../blender_bindings/source1/bsp/entities/{output_name}_entity_classes.py')
+    with open(output_path, 'w') as f:
         f.write(buffer)
+    write_entity_class_table(output_path)
 
 
 if __name__ == '__main__':
@@ -4,6 +4,7 @@ from SourceIO.library.shared.content_manager import ContentManager
 from SourceIO.library.source1.vmt import VMT
 from SourceIO.library.utils import TinyPath
 from SourceIO.library.utils.rustlib import load_vtf_texture
+from SourceIO.library.utils.texture_cache import get_decoded_texture_cache
 from SourceIO.logger import SourceLogMan
 from SourceIO.library.utils.thirdparty.equilib.cube2equi_numpy import run as convert_to_eq
 
@@ -11,14 +12,30 @@ log_manager = SourceLogMan()
 logger = log_manager.get_logger('Source1::VTF')
 
 
+def _decode_vtf(data: bytes) -> np.ndarray:
+    pixel_data, width, height, bpp = load_vtf_texture(data)
+    if bpp == 32:
+        return np.frombuffer(pixel_data, dtype=np.float32).reshape(height, width, 4)
+    return np.frombuffer(pixel_data, dtype=np.uint8).reshape(height, width, 4)
+
+
 def load_texture(file_object):
     data = file_object.read()
     try:
-        pixel_data, width, height, bpp = load_vtf_texture(data)
-        if bpp == 32:
-            rgba_data = np.frombuffer(pixel_data, dtype=np.float32).reshape(height, width, 4)
+        cache = get_decoded_texture_cache()
+        if cache is not None:
+            key = cache.make_key(data, "vtf")
+            pixels = cache.get(key)
+            if pixels is None:
+                pixels = _decode_vtf(data)
+                cache.put(key, pixels)
+        else:
+            pixels = _decode_vtf(data)
+        height, width = pixels.shape[:2]
+        if pixels.dtype == np.uint8:
+            rgba_data = pixels.astype(np.float32) / 255
         else:
-            rgba_data = np.frombuffer(pixel_data, dtype=np.uint8).reshape(height, width, 4).astype(np.float32) / 255
+            rgba_data = pixels
         return rgba_data, height, width
     except Exception as ex:
         logger.error('Caught exception "{}" '.format(ex))
@@ -1,5 +1,6 @@
 from SourceIO.library.source2.keyvalues3.binary_keyvalues import read_valve_keyvalue3
 from SourceIO.library.source2.keyvalues3.enums import KV3Signatures
+from SourceIO.library.source2.keyvalues3.lazy import LazyMembers
 from SourceIO.library.source2.keyvalues3.types import AnyKVType, Object, Array
 from SourceIO.library.source2.utils.ntro_reader import NTROBuffer
 from .base import BaseBlock
@@ -35,13 +36,17 @@ class KVBlock(dict[str, AnyKVType], BaseBlock):
     def _struct_name():
         return "MaterialResourceData_t"
 
+    @staticmethod
+    def _read_kv3(buffer: NTROBuffer):
+        return read_valve_keyvalue3(buffer)
+
     @classmethod
     def from_buffer(cls, buffer: NTROBuffer) -> 'KVBlock':
         if buffer.size() > 0:
             magic = buffer.read(4)
             buffer.seek(-4, 1)
             if KV3Signatures.is_valid(magic):
-                kv3 = read_valve_keyvalue3(buffer)
+                kv3 = cls._read_kv3(buffer)
             elif buffer.has_ntro:
                 kv3 = buffer.slice().read_struct(cls._struct_name())
             else:
@@ -51,3 +56,11 @@ class KVBlock(dict[str, AnyKVType], BaseBlock):
             return cls(kv3)
         else:
             raise NotImplementedError('Unknown data block format')
+
+
+class LazyKVBlock(LazyMembers, KVBlock):
+    """KV3 block that decodes nested objects and arrays only when they are accessed."""
+
+    @staticmethod
+    def _read_kv3(buffer: NTROBuffer):
+        return read_valve_keyvalue3(buffer, lazy=True)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 from SourceIO.library.source2.utils.ntro_reader import NTROBuffer
 from SourceIO.library.utils import Buffer
@@ -28,6 +29,8 @@ class ResourceExternalReferenceList(list[ResourceExternalReference], BaseBlock):
     def __init__(self):
         list.__init__(self)
         self._mapping: dict[int, ResourceExternalReference] = {}
+        self._name_mapping: dict[str, ResourceExternalReference] = {}
+        self.hash_names: dict[int, str] = {}
 
     def __str__(self) -> str:
         str_data = list.__str__(self)
@@ -42,9 +45,16 @@ class ResourceExternalReferenceList(list[ResourceExternalReference], BaseBlock):
             for _ in range(count):
                 ref = ResourceExternalReference.from_buffer(buffer)
                 self._mapping[ref.hash] = ref
+                self._name_mapping.setdefault(ref.name, ref)
+                self.hash_names[ref.hash] = ref.name
                 self.append(ref)
         return self
 
+    def get_reference(self, name_or_id: str | int) -> Optional[ResourceExternalReference]:
+        if isinstance(name_or_id, str):
+            return self._name_mapping.get(name_or_id, None)
+        return self._mapping.get(name_or_id, None)
+
     def find_resource(self, resource_id: int):
         if res := self._mapping.get(resource_id & 0xFFFF_FFFF, None):
             return res.name
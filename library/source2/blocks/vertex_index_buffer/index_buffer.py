@@ -23,7 +23,7 @@ class IndexBuffer:
         data_size = buffer.read_uint32()
 
         with buffer.read_from_offset(data_offset):
-            data = buffer.read(data_size)
+            data = buffer.read_view(data_size)
             if data_size == index_size * index_count:
                 _index_buffer = MemoryBuffer(data)
             else:
@@ -101,7 +101,7 @@ class VertexBuffer:
                 attributes.append(VertexAttribute.from_buffer(buffer))
 
         with buffer.read_from_offset(data_offset):
-            data = buffer.read(data_size)
+            data = buffer.read_view(data_size)
             if data_size == vertex_size * vertex_count:
                 _vertex_buffer = MemoryBuffer(data)
             else:
@@ -1,5 +1,4 @@
 import warnings
-from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Optional, Type, TypeVar, Union, Collection
 
@@ -24,7 +23,8 @@ class CompiledResource:
     _buffer: Buffer
     _filepath: TinyPath
     _header: CompiledHeader
-    _blocks: dict[int, BaseBlock] = field(default_factory=lambda: defaultdict(None))
+    _blocks: dict[int, BaseBlock] = field(default_factory=dict)
+    _block_ids: dict[str, int] = field(default_factory=dict)
 
     @property
     def name(self):
@@ -42,63 +42,77 @@ class CompiledResource:
             ntro = self.get_block(ResourceIntrospectionManifest, block_name="NTRO")
             resource_list = self.get_block(ResourceExternalReferenceList, block_name="RERL")
             self._buffer.seek(info_block.absolute_offset)
-            buffer = NTROBuffer(self._buffer.read(info_block.size), ntro.info, {v.hash: v.name for v in resource_list})
+            buffer = NTROBuffer(self._buffer.read_view(info_block.size), ntro.info,
+                                resource_list.hash_names if resource_list is not None else {})
         else:
             self._buffer.seek(info_block.absolute_offset)
-            buffer = NTROBuffer(self._buffer.read(info_block.size), None, None)
+            buffer = NTROBuffer(self._buffer.read_view(info_block.size), None, None)
         data_block = block_class.from_buffer(buffer)
         data_block.custom_name = info_block.name
         return data_block
 
+    def _get_block_id(self, block_name: str) -> Optional[int]:
+        if not self._block_ids:
+            for block_id, block in enumerate(self._header.blocks):
+                self._block_ids.setdefault(block.name, block_id)
+        return self._block_ids.get(block_name, None)
+
+    def _get_block_info(self, block_name: str) -> Optional[BlockInfo]:
+        block_id = self._get_block_id(block_name)
+        if block_id is None:
+            return None
+        return self._header.blocks[block_id]
+
+    def _get_cached_block(self, block_class: Type[BlockT] | None, block_id: int) -> BlockT | None:
+        data_block = self._blocks.get(block_id, None)
+        # Same block can be requested as different classes, only reuse compatible ones
+        if data_block is not None and (block_class is None or isinstance(data_block, block_class)):
+            return data_block
+        data_block = self._get_block(block_class, self._header.blocks[block_id])
+        if data_block is not None:
+            self._blocks[block_id] = data_block
+        return data_block
+
     def get_block(self,
                   block_class: Type[BlockT] | None,
                   *,
                   block_id: Optional[int] = None,
                   block_name: Optional[str] = None) -> BlockT | None:
-
-        if data_block := self._blocks.get(block_id):
-            return data_block
-
         if block_id is not None:
             if block_id == -1:
                 return None
             if block_id == DATA_BLOCK:
                 block_id = len(self._header.blocks) - 1
-            if data_block := self._blocks.get(block_id):
-                return data_block
-            data_block = self._get_block(block_class, self._header.blocks[block_id])
-            self._blocks[block_id] = data_block
-            return data_block
         elif block_name is not None:
-            for block in self._header.blocks:
-                if block.name == block_name:
-                    return self._get_block(block_class, block)
-            return None
+            block_id = self._get_block_id(block_name)
+            if block_id is None:
+                return None
         else:
             raise ValueError("Either block_id or block_name must be provided")
+        return self._get_cached_block(block_class, block_id)
 
     def get_blocks(self,
                    block_class: Type[BlockT] | None,
                    block_name: str) -> Collection[BlockT]:
         blocks = []
-        for block in self._header.blocks:
+        for block_id, block in enumerate(self._header.blocks):
             if block.name == block_name:
-                data_block = self._get_block(block_class, block)
-                blocks.append(data_block)
+                blocks.append(self._get_cached_block(block_class, block_id))
         return blocks
 
     def has_block(self, block_name: str) -> bool:
-        for block in self._header.blocks:
-            if block.name == block_name:
-                return True
-        return False
+        return self._get_block_id(block_name) is not None
 
     @classmethod
     @timed
     def from_buffer(cls, buffer: Buffer, filename: TinyPath):
-        inmemory_buffer = MemoryBuffer(buffer.read())
-        header = CompiledHeader.from_buffer(inmemory_buffer)
-        return cls(inmemory_buffer, filename, header)
+        try:
+            # Memory and file backed buffers give out views into their data or file mapping, no copy is made
+            resource_buffer = buffer.slice()
+        except NotImplementedError:
+            resource_buffer = MemoryBuffer(buffer.read())
+        header = CompiledHeader.from_buffer(resource_buffer)
+        return cls(resource_buffer, filename, header)
 
     def has_child_resource(self, name_or_id: str | int, cm: ContentManager):
         resource_path = self.get_child_resource_path(name_or_id)
@@ -110,9 +124,11 @@ class CompiledResource:
 
     def get_child_resource_path(self, name_or_id: str | int) -> TinyPath | None:
         external_resource_list = self.get_block(ResourceExternalReferenceList, block_name='RERL')
-        for child_resource in external_resource_list:
-            if child_resource.hash == name_or_id or child_resource.name == name_or_id:
-                return TinyPath(child_resource.name + '_c')
+        if external_resource_list is None:
+            return None
+        child_resource = external_resource_list.get_reference(name_or_id)
+        if child_resource is not None:
+            return TinyPath(child_resource.name + '_c')
 
     def get_child_resource(self,
                            name_or_id: Union[str, int],
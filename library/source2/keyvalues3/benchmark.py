@@ -0,0 +1,76 @@
+"""Compare regular and plain KV3 decoding speed.
+
+Usage: python -m SourceIO.library.source2.keyvalues3.benchmark <file> [<file> ...] [--repeat N]
+
+Accepts compiled Source 2 resources (every KV3 block gets decoded) or raw binary KV3 files.
+"""
+import sys
+import time
+from typing import Callable, Iterator
+
+from SourceIO.library.source2.compiled_file_header import CompiledHeader
+from SourceIO.library.source2.keyvalues3.binary_keyvalues import read_valve_keyvalue3
+from SourceIO.library.source2.keyvalues3.enums import KV3Signatures
+from SourceIO.library.source2.keyvalues3.fast_decoder import to_plain
+from SourceIO.library.utils import MemoryBuffer
+
+
+def iter_kv3_blobs(data: bytes) -> Iterator[tuple[str, bytes]]:
+    if KV3Signatures.is_valid(data[:4]):
+        yield "KV3", data
+        return
+    header = CompiledHeader.from_buffer(MemoryBuffer(data))
+    for block_info in header.blocks:
+        blob = data[block_info.absolute_offset:block_info.absolute_offset + block_info.size]
+        if KV3Signatures.is_valid(blob[:4]):
+            yield block_info.name, blob
+
+
+def _measure(function: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark_blob(blob: bytes, repeat: int = 5) -> tuple[float, float, bool]:
+    regular_time = _measure(lambda: read_valve_keyvalue3(MemoryBuffer(blob)), repeat)
+    plain_time = _measure(lambda: read_valve_keyvalue3(MemoryBuffer(blob), plain=True), repeat)
+    regular = to_plain(read_valve_keyvalue3(MemoryBuffer(blob)))
+    plain = read_valve_keyvalue3(MemoryBuffer(blob), plain=True)
+    return regular_time, plain_time, repr(regular) == repr(plain)
+
+
+def main(argv: list[str]):
+    repeat = 5
+    if "--repeat" in argv:
+        index = argv.index("--repeat")
+        repeat = int(argv[index + 1])
+        del argv[index:index + 2]
+    if not argv:
+        print(__doc__)
+        return
+
+    total_regular = total_plain = 0.0
+    print("{0:<48}\t{1:<6}\t{2:<10}\t{3:<12}\t{4:<12}\t{5:<8}\t{6}".format("File", "Block", "size",
+                                                                          "regular, sec", "plain, sec",
+                                                                          "speedup", "match"))
+    for filepath in argv:
+        with open(filepath, "rb") as f:
+            data = f.read()
+        for block_name, blob in iter_kv3_blobs(data):
+            regular_time, plain_time, matches = benchmark_blob(blob, repeat)
+            total_regular += regular_time
+            total_plain += plain_time
+            print("{0:<48}\t{1:<6}\t{2:<10}\t{3:<12.5f}\t{4:<12.5f}\t{5:<8.2f}\t{6}".format(
+                filepath[-48:], block_name, len(blob), regular_time, plain_time,
+                regular_time / max(plain_time, 1e-9), matches))
+    if total_plain:
+        print(f"Total: regular {total_regular:.4f} sec, plain {total_plain:.4f} sec, "
+              f"speedup {total_regular / total_plain:.2f}x")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
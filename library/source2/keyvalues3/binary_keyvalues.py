@@ -7,6 +7,8 @@ from SourceIO.library.utils import Buffer, MemoryBuffer, WritableMemoryBuffer
 from SourceIO.library.utils.rustlib import LZ4ChainDecoder, lz4_decompress, zstd_decompress_stream, zstd_decompress
 from SourceIO.library.utils.perf_sampler import timed
 from .enums import *
+from .fast_decoder import KV3PlainDecoder, TYPE_MASK_LEGACY, TYPE_MASK_V3, to_plain
+from .lazy import KV3LazyDecoder
 from .types import *
 
 
@@ -61,24 +63,31 @@ def _legacy_block_decompress(in_buffer: Buffer) -> Buffer:
 
 
 @timed
-def read_valve_keyvalue3(buffer: Buffer) -> AnyKVType:
+def read_valve_keyvalue3(buffer: Buffer, plain: bool = False, lazy: bool = False) -> AnyKVType | Any:
+    """Read binary KV3 data.
+
+    With ``plain`` set, the value tree is decoded into plain dict/list/int/str values (see KV3PlainDecoder),
+    which is considerably faster for large blocks.
+    With ``lazy`` set, objects and arrays are only decoded when accessed (see KV3LazyDecoder).
+    """
+    decoder_class = KV3LazyDecoder if lazy else KV3PlainDecoder if plain else None
     sig = buffer.read(4)
     if not KV3Signatures.is_valid(sig):
         raise BufferError("Not a KV3 buffer")
     sig = KV3Signatures(sig)
     encoding = buffer.read(16)
     if sig == KV3Signatures.VKV_LEGACY:
-        return read_legacy(encoding, buffer)
+        return read_legacy(encoding, buffer, decoder_class)
     elif sig == KV3Signatures.KV3_V1:
-        return read_v1(encoding, buffer)
+        return read_v1(encoding, buffer, decoder_class)
     elif sig == KV3Signatures.KV3_V2:
-        return read_v2(encoding, buffer)
+        return read_v2(encoding, buffer, decoder_class)
     elif sig == KV3Signatures.KV3_V3:
-        return read_v3(encoding, buffer)
+        return read_v3(encoding, buffer, decoder_class)
     elif sig == KV3Signatures.KV3_V4:
-        return read_v4(encoding, buffer)
+        return read_v4(encoding, buffer, decoder_class)
     elif sig == KV3Signatures.KV3_V5:
-        return read_v5(encoding, buffer)
+        return read_v5(encoding, buffer, decoder_class)
 
 
 @dataclass
@@ -365,7 +374,7 @@ def split_buffer(data_buffer: Buffer, bytes_count: int, short_count: int, int_co
 
 
 @timed
-def read_legacy(encoding: bytes, buffer: Buffer):
+def read_legacy(encoding: bytes, buffer: Buffer, decoder_class: Optional[type[KV3PlainDecoder]] = None):
     if not KV3Encodings.is_valid(encoding):
         raise BufferError(f'Buffer contains unknown encoding: {encoding!r}')
     encoding = KV3Encodings(encoding)
@@ -398,11 +407,11 @@ def read_legacy(encoding: bytes, buffer: Buffer):
         active_buffer=buffers
     )
     root = context.read_value(context)
-    return root
+    return to_plain(root) if decoder_class is KV3PlainDecoder else root
 
 
 @timed
-def read_v1(encoding: bytes, buffer: Buffer):
+def read_v1(encoding: bytes, buffer: Buffer, decoder_class: Optional[type[KV3PlainDecoder]] = None):
     compression_method = buffer.read_uint32()
 
     bytes_count = buffer.read_uint32()
@@ -439,12 +448,14 @@ def read_v1(encoding: bytes, buffer: Buffer):
 
         active_buffer=kv_buffer
     )
+    if decoder_class is not None:
+        return decoder_class(context, TYPE_MASK_LEGACY).decode()
     root = context.read_value(context)
     return root
 
 
 @timed
-def read_v2(encoding: bytes, buffer: Buffer):
+def read_v2(encoding: bytes, buffer: Buffer, decoder_class: Optional[type[KV3PlainDecoder]] = None):
     compression_method = buffer.read_uint32()
     compression_dict_id = buffer.read_uint16()
     compression_frame_size = buffer.read_uint16()
@@ -565,12 +576,14 @@ def read_v2(encoding: bytes, buffer: Buffer):
         read_value=_read_value_legacy,
         active_buffer=buffers
     )
+    if decoder_class is not None:
+        return decoder_class(context, TYPE_MASK_LEGACY).decode()
     root = context.read_value(context)
     return root
 
 
 @timed
-def read_v3(encoding: bytes, buffer: Buffer):
+def read_v3(encoding: bytes, buffer: Buffer, decoder_class: Optional[type[KV3PlainDecoder]] = None):
     compression_method = buffer.read_uint32()
     compression_dict_id = buffer.read_uint16()
     compression_frame_size = buffer.read_uint16()
@@ -655,12 +668,14 @@ def read_v3(encoding: bytes, buffer: Buffer):
         read_value=_read_value_legacy,
         active_buffer=kv_buffer
     )
+    if decoder_class is not None:
+        return decoder_class(context, TYPE_MASK_V3).decode()
     root = context.read_value(context)
     return root
 
 
 @timed
-def read_v4(encoding: bytes, buffer: Buffer):
+def read_v4(encoding: bytes, buffer: Buffer, decoder_class: Optional[type[KV3PlainDecoder]] = None):
     compression_method = buffer.read_uint32()
     compression_dict_id = buffer.read_uint16()
     compression_frame_size = buffer.read_uint16()
@@ -750,12 +765,14 @@ def read_v4(encoding: bytes, buffer: Buffer):
         read_value=_read_value_legacy,
         active_buffer=kv_buffer
     )
+    if decoder_class is not None:
+        return decoder_class(context, TYPE_MASK_V3).decode()
     root = context.read_value(context)
     return root
 
 
 @timed
-def read_v5(encoding: bytes, buffer: Buffer):
+def read_v5(encoding: bytes, buffer: Buffer, decoder_class: Optional[type[KV3PlainDecoder]] = None):
     compression_method = buffer.read_uint32()
     compression_dict_id = buffer.read_uint16()
     compression_frame_size = buffer.read_uint16()
@@ -876,6 +893,8 @@ def read_v5(encoding: bytes, buffer: Buffer):
         read_value=_read_value_legacy,
         active_buffer=kv_buffer1
     )
+    if decoder_class is not None:
+        return decoder_class(context, v5_types=True).decode()
     root = context.read_value(context)
     return root
 
@@ -0,0 +1,352 @@
+from struct import calcsize
+from typing import TYPE_CHECKING, Any, Optional
+
+import numpy as np
+
+from SourceIO.library.utils import Buffer
+from .enums import KV3Type, Specifier
+from .types import *
+
+if TYPE_CHECKING:
+    from .binary_keyvalues import KV3Buffers, KV3ContextNew
+
+_NULL = KV3Type.NULL.value
+_BOOLEAN = KV3Type.BOOLEAN.value
+_INT64 = KV3Type.INT64.value
+_UINT64 = KV3Type.UINT64.value
+_DOUBLE = KV3Type.DOUBLE.value
+_STRING = KV3Type.STRING.value
+_BINARY_BLOB = KV3Type.BINARY_BLOB.value
+_ARRAY = KV3Type.ARRAY.value
+_OBJECT = KV3Type.OBJECT.value
+_ARRAY_TYPED = KV3Type.ARRAY_TYPED.value
+_INT32 = KV3Type.INT32.value
+_UINT32 = KV3Type.UINT32.value
+_BOOLEAN_TRUE = KV3Type.BOOLEAN_TRUE.value
+_BOOLEAN_FALSE = KV3Type.BOOLEAN_FALSE.value
+_INT64_ZERO = KV3Type.INT64_ZERO.value
+_INT64_ONE = KV3Type.INT64_ONE.value
+_DOUBLE_ZERO = KV3Type.DOUBLE_ZERO.value
+_DOUBLE_ONE = KV3Type.DOUBLE_ONE.value
+_FLOAT = KV3Type.FLOAT.value
+_INT16 = KV3Type.INT16.value
+_UINT16 = KV3Type.UINT16.value
+_INT8 = KV3Type.INT8.value
+_UINT8 = KV3Type.UINT8.value
+_ARRAY_TYPED_BYTE_LENGTH = KV3Type.ARRAY_TYPED_BYTE_LENGTH.value
+_ARRAY_TYPED_BYTE_LENGTH2 = KV3Type.ARRAY_TYPED_BYTE_LENGTH2.value
+
+_UNSPECIFIED = Specifier.UNSPECIFIED
+
+# Only used for values that carry a specifier, everything else is decoded into plain python types
+_SPECIFIED_TYPES = {
+    _BOOLEAN: Bool,
+    _INT64: Int64,
+    _UINT64: UInt64,
+    _DOUBLE: Double,
+    _STRING: String,
+    _BINARY_BLOB: BinaryBlob,
+    _INT32: Int32,
+    _UINT32: UInt32,
+    _FLOAT: Float,
+    _INT16: Int32,
+    _UINT16: UInt32,
+    _INT8: Int32,
+    _UINT8: UInt32,
+}
+
+# Legacy type flags, first set bit wins
+_TYPE_FLAG_SPECIFIERS = ((1, Specifier.RESOURCE), (2, Specifier.RESOURCE_NAME), (8, Specifier.PANORAMA),
+                         (16, Specifier.SOUNDEVENT), (32, Specifier.SUBCLASS))
+
+TYPE_MASK_LEGACY = 0x7F
+TYPE_MASK_V3 = 0x3F
+
+
+def _remaining_view(buffer: Optional[Buffer]) -> memoryview:
+    if buffer is None:
+        return memoryview(b"")
+    return buffer.read_view()
+
+
+def _as_array(data: memoryview, dtype: type) -> np.ndarray:
+    itemsize = np.dtype(dtype).itemsize
+    return np.frombuffer(data, dtype, len(data) // itemsize)
+
+
+def _as_view(data: memoryview, fmt: str) -> memoryview:
+    data = data.cast("B")
+    itemsize = calcsize(fmt)
+    return data[:len(data) - len(data) % itemsize].cast(fmt)
+
+
+class KV3Streams:
+    """Byte, short, int and double streams of KV3 buffer set with cursors into them.
+
+    By default streams are unpacked into python lists up front, which is fastest for one pass decoding.
+    With ``compact`` set they stay memoryviews over the source buffers, for decoders that are kept alive.
+    """
+
+    __slots__ = ("bytes", "byte_pos",
+                 "shorts", "short_pos",
+                 "ints", "ints_array", "int_floats", "int_pos",
+                 "doubles", "doubles_array", "doubles_int", "double_pos")
+
+    def __init__(self, buffers: 'KV3Buffers', compact: bool = False):
+        bytes_data = _remaining_view(buffers.byte_buffer)
+        shorts_data = _remaining_view(buffers.short_buffer)
+        ints_data = _remaining_view(buffers.int_buffer)
+        doubles_data = _remaining_view(buffers.double_buffer)
+        self.ints_array = _as_array(ints_data, np.int32)
+        self.doubles_array = _as_array(doubles_data, np.float64)
+        if compact:
+            self.bytes = bytes_data.cast("B")
+            self.shorts = _as_view(shorts_data, "h")
+            self.ints = _as_view(ints_data, "i")
+            self.int_floats = _as_view(ints_data, "f")
+            self.doubles = _as_view(doubles_data, "d")
+            self.doubles_int = _as_view(doubles_data, "q")
+        else:
+            self.bytes = bytes_data.tobytes()
+            self.shorts = _as_array(shorts_data, np.int16).tolist()
+            self.ints = self.ints_array.tolist()
+            self.int_floats = _as_array(ints_data, np.float32).tolist()
+            self.doubles = self.doubles_array.tolist()
+            self.doubles_int = _as_array(doubles_data, np.int64).tolist()
+        self.byte_pos = 0
+        self.short_pos = 0
+        self.int_pos = 0
+        self.double_pos = 0
+
+    def read_int(self) -> int:
+        value = self.ints[self.int_pos]
+        self.int_pos += 1
+        return value
+
+
+class KV3PlainDecoder:
+    """Decode KV3 value tree into plain python containers.
+
+    Objects become ``dict``, arrays ``list``, scalars ``bool``/``int``/``float``/``str``/``bytes``.
+    Numeric typed arrays are returned as numpy arrays, like in the regular reader.
+    Values that have a specifier set are returned as the matching KV3 type with the specifier attached.
+    """
+    compact_streams = False
+
+    def __init__(self, context: 'KV3ContextNew', type_mask: int = TYPE_MASK_LEGACY, v5_types: bool = False):
+        self.strings = context.strings
+        compact = self.compact_streams
+        types_data = _remaining_view(context.types_buffer)
+        self.types = types_data.cast("B") if compact else types_data.tobytes()
+        self.type_pos = 0
+        self._type_mask = type_mask
+        self._v5_types = v5_types
+
+        member_counts_shared = context.object_member_count_buffer is context.active_buffer.int_buffer
+        self.streams0 = KV3Streams(context.buffer0, compact)
+        self.streams1 = self.streams0 if context.buffer1 is context.buffer0 else KV3Streams(context.buffer1, compact)
+        self.active = self.streams1 if context.active_buffer is context.buffer1 else self.streams0
+        if member_counts_shared:
+            self.member_counts = None
+        elif compact:
+            self.member_counts = _as_view(_remaining_view(context.object_member_count_buffer), "I")
+        else:
+            self.member_counts = _as_array(_remaining_view(context.object_member_count_buffer), np.uint32).tolist()
+        self.member_count_pos = 0
+
+        self.blob_sizes = context.binary_blob_sizes
+        self.blob_index = 0
+        self.blob_data = _remaining_view(context.binary_blob_buffer)
+        self.blob_pos = 0
+
+    def decode(self) -> Any:
+        return self.read_value()
+
+    def read_type(self) -> tuple[int, Specifier]:
+        types = self.types
+        pos = self.type_pos
+        data_type = types[pos]
+        specifier = _UNSPECIFIED
+        if data_type & 0x80:
+            if self._v5_types:
+                specifier = Specifier(types[pos + 1])
+                data_type &= 0x7F
+            else:
+                data_type &= self._type_mask
+                flag = types[pos + 1]
+                for bit, flag_specifier in _TYPE_FLAG_SPECIFIERS:
+                    if flag & bit:
+                        specifier = flag_specifier
+                        break
+            self.type_pos = pos + 2
+        else:
+            self.type_pos = pos + 1
+        if self._v5_types:
+            if data_type & 0x40:
+                raise NotImplementedError(f"t & 0x40 != 0: {data_type & 0x40}")
+            data_type &= 0x3F
+        return data_type, specifier
+
+    def read_value(self) -> Any:
+        data_type, specifier = self.read_type()
+        return self.read_typed_value(data_type, specifier)
+
+    def read_member_count(self) -> int:
+        if self.member_counts is None:
+            return self.active.read_int() & 0xFFFFFFFF
+        count = self.member_counts[self.member_count_pos]
+        self.member_count_pos += 1
+        return count
+
+    def read_typed_value(self, data_type: int, specifier: Specifier) -> Any:
+        streams = self.active
+        if data_type == _OBJECT:
+            value = self.read_object()
+            if specifier != _UNSPECIFIED:
+                value = Object(value)
+                value.specifier = specifier
+            return value
+        elif data_type == _STRING:
+            str_id = streams.ints[streams.int_pos]
+            streams.int_pos += 1
+            value = "" if str_id == -1 else self.strings[str_id]
+        elif data_type == _DOUBLE:
+            value = streams.doubles[streams.double_pos]
+            streams.double_pos += 1
+        elif data_type == _INT32:
+            value = streams.ints[streams.int_pos]
+            streams.int_pos += 1
+        elif data_type == _FLOAT:
+            value = streams.int_floats[streams.int_pos]
+            streams.int_pos += 1
+        elif data_type == _ARRAY:
+            count = streams.ints[streams.int_pos]
+            streams.int_pos += 1
+            return [self.read_value() for _ in range(count)]
+        elif data_type == _ARRAY_TYPED:
+            count = streams.ints[streams.int_pos] & 0xFFFFFFFF
+            streams.int_pos += 1
+            return self.read_typed_array(count)
+        elif data_type == _ARRAY_TYPED_BYTE_LENGTH:
+            count = streams.bytes[streams.byte_pos]
+            streams.byte_pos += 1
+            return self.read_typed_array(count)
+        elif data_type == _ARRAY_TYPED_BYTE_LENGTH2:
+            count = streams.bytes[streams.byte_pos]
+            streams.byte_pos += 1
+            assert specifier == _UNSPECIFIED, f"Unsupported specifier {specifier!r}"
+            self.active = self.streams0
+            value = self.read_typed_array(count)
+            self.active = self.streams1
+            return value
+        elif data_type == _BOOLEAN_TRUE:
+            return True
+        elif data_type == _BOOLEAN_FALSE:
+            return False
+        elif data_type == _INT64_ZERO:
+            return 0
+        elif data_type == _INT64_ONE:
+            return 1
+        elif data_type == _DOUBLE_ZERO:
+            return 0.0
+        elif data_type == _DOUBLE_ONE:
+            return 1.0
+        elif data_type == _NULL:
+            return None
+        elif data_type == _BOOLEAN:
+            value = streams.bytes[streams.byte_pos] == 1
+            streams.byte_pos += 1
+        elif data_type == _INT64:
+            value = streams.doubles_int[streams.double_pos]
+            streams.double_pos += 1
+        elif data_type == _UINT64:
+            value = streams.doubles_int[streams.double_pos] & 0xFFFFFFFFFFFFFFFF
+            streams.double_pos += 1
+        elif data_type == _UINT32:
+            value = streams.ints[streams.int_pos] & 0xFFFFFFFF
+            streams.int_pos += 1
+        elif data_type == _INT16:
+            value = streams.shorts[streams.short_pos]
+            streams.short_pos += 1
+        elif data_type == _UINT16:
+            value = streams.shorts[streams.short_pos] & 0xFFFF
+            streams.short_pos += 1
+        elif data_type == _INT8 or data_type == _UINT8:
+            value = streams.bytes[streams.byte_pos]
+            streams.byte_pos += 1
+        elif data_type == _BINARY_BLOB:
+            value = self.read_blob()
+        else:
+            raise NotImplementedError(f"Reader for {KV3Type(data_type)!r} not implemented")
+
+        if specifier != _UNSPECIFIED:
+            value = _SPECIFIED_TYPES[data_type](value)
+            value.specifier = specifier
+        return value
+
+    def read_object(self) -> dict[str, Any]:
+        member_count = self.read_member_count()
+        obj = {}
+        strings = self.strings
+        for i in range(member_count):
+            streams = self.active
+            name_id = streams.ints[streams.int_pos]
+            streams.int_pos += 1
+            obj[strings[name_id] if name_id != -1 else str(i)] = self.read_value()
+        return obj
+
+    def read_blob(self) -> bytes:
+        if self.blob_sizes is not None:
+            size = self.blob_sizes[self.blob_index]
+            self.blob_index += 1
+            data = self.blob_data[self.blob_pos:self.blob_pos + size].tobytes()
+            assert len(data) == size, "Binary blob is smaller than expected"
+            self.blob_pos += size
+            return data
+        streams = self.active
+        size = streams.read_int()
+        data = bytes(streams.bytes[streams.byte_pos:streams.byte_pos + size])
+        streams.byte_pos += size
+        return data
+
+    def read_typed_array(self, count: int) -> np.ndarray | list:
+        data_type, specifier = self.read_type()
+        streams = self.active
+        if data_type == _DOUBLE_ZERO:
+            return np.zeros(count, np.float64)
+        elif data_type == _DOUBLE_ONE:
+            return np.ones(count, np.float64)
+        elif data_type == _INT64_ZERO:
+            return np.zeros(count, np.int64)
+        elif data_type == _INT64_ONE:
+            return np.ones(count, np.int64)
+        elif data_type in (_DOUBLE, _INT64, _UINT64):
+            pos = streams.double_pos
+            streams.double_pos += count
+            data = streams.doubles_array[pos:pos + count]
+            if data_type == _DOUBLE:
+                return data
+            return data.view(np.int64 if data_type == _INT64 else np.uint64)
+        elif data_type in (_INT32, _UINT32):
+            pos = streams.int_pos
+            streams.int_pos += count
+            data = streams.ints_array[pos:pos + count]
+            return data if data_type == _INT32 else data.view(np.uint32)
+        return [self.read_typed_value(data_type, specifier) for _ in range(count)]
+
+
+def to_plain(value: Any) -> Any:
+    """Convert value tree produced by regular KV3 reader into plain python containers."""
+    if isinstance(value, (Object, dict)):
+        plain = {key: to_plain(item) for key, item in value.items()}
+        if isinstance(value, BaseType) and value.specifier != _UNSPECIFIED:
+            plain = Object(plain)
+            plain.specifier = value.specifier
+        return plain
+    elif isinstance(value, (Array, TypedArray, list)):
+        return [to_plain(item) for item in value]
+    elif isinstance(value, BaseType) and value.specifier == _UNSPECIFIED:
+        if isinstance(value, Bool):
+            return bool(value)
+        return value.to_dict()
+    return value
@@ -0,0 +1,430 @@
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from .enums import KV3Type, Specifier
+from .fast_decoder import (KV3PlainDecoder, TYPE_MASK_LEGACY, _ARRAY, _ARRAY_TYPED, _ARRAY_TYPED_BYTE_LENGTH,
+                           _ARRAY_TYPED_BYTE_LENGTH2, _BINARY_BLOB, _BOOLEAN, _BOOLEAN_FALSE, _BOOLEAN_TRUE, _DOUBLE,
+                           _DOUBLE_ONE, _DOUBLE_ZERO, _FLOAT, _INT16, _INT32, _INT64, _INT64_ONE, _INT64_ZERO, _INT8,
+                           _NULL, _OBJECT, _STRING, _UINT16, _UINT32, _UINT64, _UINT8, _UNSPECIFIED)
+from .types import *
+
+if TYPE_CHECKING:
+    from .binary_keyvalues import KV3ContextNew
+
+# Same value types regular reader produces, so lazy trees can be used in place of regular ones
+_VALUE_TYPES = {
+    _BOOLEAN: Bool,
+    _BOOLEAN_TRUE: Bool,
+    _BOOLEAN_FALSE: Bool,
+    _INT64: Int64,
+    _INT64_ZERO: Int64,
+    _INT64_ONE: Int64,
+    _UINT64: UInt64,
+    _DOUBLE: Double,
+    _DOUBLE_ZERO: Double,
+    _DOUBLE_ONE: Double,
+    _STRING: String,
+    _BINARY_BLOB: BinaryBlob,
+    _INT32: Int32,
+    _UINT32: UInt32,
+    _FLOAT: Float,
+    _INT16: Int32,
+    _UINT16: UInt32,
+    _INT8: Int32,
+    _UINT8: UInt32,
+}
+
+_CONSTANT_TYPES = frozenset((_NULL, _BOOLEAN_TRUE, _BOOLEAN_FALSE, _INT64_ZERO, _INT64_ONE, _DOUBLE_ZERO, _DOUBLE_ONE))
+_BYTE_TYPES = frozenset((_BOOLEAN, _INT8, _UINT8))
+_SHORT_TYPES = frozenset((_INT16, _UINT16))
+_INT_TYPES = frozenset((_STRING, _INT32, _UINT32, _FLOAT))
+_DOUBLE_TYPES = frozenset((_DOUBLE, _INT64, _UINT64))
+
+
+class KV3LazyRef:
+    """Not yet decoded object or array, remembers decoder cursors at the start of the value.
+
+    Once materialized, ref drops its decoder and keeps only the decoded value.
+    """
+    __slots__ = ("decoder", "data_type", "specifier", "state", "value")
+
+    def __init__(self, decoder: 'KV3LazyDecoder', data_type: int, specifier: Specifier, state: tuple):
+        self.decoder = decoder
+        self.data_type = data_type
+        self.specifier = specifier
+        self.state = state
+        self.value = None
+
+    def materialize(self) -> 'LazyObject | LazyArray':
+        decoder = self.decoder
+        if decoder is None:
+            return self.value
+        return decoder.materialize(self)
+
+    def __repr__(self):
+        return f"<KV3LazyRef {KV3Type(self.data_type).name}>"
+
+
+class LazyMembers:
+    """Mixin for dict based containers that can hold KV3LazyRef values, refs are decoded on first access.
+
+    Methods that would hand out stored values as is (copying, comparison, merging into other dicts) decode
+    all members first, so KV3LazyRef never leaves the container.
+    """
+
+    def _materialize(self, key):
+        value = dict.__getitem__(self, key)
+        if type(value) is KV3LazyRef:
+            value = value.materialize()
+            dict.__setitem__(self, key, value)
+        return value
+
+    def _materialize_all(self):
+        for key in list(dict.keys(self)):
+            self._materialize(key)
+
+    def __getitem__(self, item):
+        if isinstance(item, tuple):
+            for key in item:
+                if dict.__contains__(self, key):
+                    return self._materialize(key)
+            raise KeyError(item)
+        return self._materialize(item)
+
+    def __iter__(self):
+        # Overriding __iter__ makes dict(obj), {**obj} and dict.update(obj) go through __getitem__
+        # instead of copying stored values directly
+        return iter(dict.keys(self))
+
+    def get(self, key, default=None):
+        if dict.__contains__(self, key):
+            return self._materialize(key)
+        return default
+
+    def setdefault(self, key, default=None):
+        if dict.__contains__(self, key):
+            return self._materialize(key)
+        return dict.setdefault(self, key, default)
+
+    def pop(self, key, *default):
+        if dict.__contains__(self, key):
+            value = self._materialize(key)
+            dict.__delitem__(self, key)
+            return value
+        return dict.pop(self, key, *default)
+
+    def popitem(self):
+        key, value = dict.popitem(self)
+        if type(value) is KV3LazyRef:
+            value = value.materialize()
+        return key, value
+
+    def values(self):
+        return [self._materialize(key) for key in dict.keys(self)]
+
+    def items(self):
+        return [(key, self._materialize(key)) for key in dict.keys(self)]
+
+    def copy(self):
+        self._materialize_all()
+        return dict.copy(self)
+
+    def __eq__(self, other):
+        self._materialize_all()
+        if isinstance(other, LazyMembers):
+            other._materialize_all()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __or__(self, other):
+        self._materialize_all()
+        return dict.__or__(self, other)
+
+    def __ror__(self, other):
+        self._materialize_all()
+        return dict.__ror__(self, other)
+
+    __hash__ = None
+
+
+class LazyItems:
+    """Mixin for list based containers that can hold KV3LazyRef values, refs are decoded on first access.
+
+    Methods that would hand out or compare stored values as is decode all items first,
+    so KV3LazyRef never leaves the container.
+    """
+
+    def _materialize(self, index: int):
+        value = list.__getitem__(self, index)
+        if type(value) is KV3LazyRef:
+            value = value.materialize()
+            list.__setitem__(self, index, value)
+        return value
+
+    def _materialize_all(self):
+        for index in range(len(self)):
+            self._materialize(index)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self._materialize(index) for index in range(*item.indices(len(self)))]
+        return self._materialize(item)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self._materialize(index)
+
+    def __reversed__(self):
+        for index in range(len(self) - 1, -1, -1):
+            yield self._materialize(index)
+
+    def pop(self, index: int = -1):
+        value = self._materialize(index)
+        list.__delitem__(self, index)
+        return value
+
+    def copy(self):
+        self._materialize_all()
+        return list.copy(self)
+
+    def index(self, value, *args):
+        self._materialize_all()
+        return list.index(self, value, *args)
+
+    def count(self, value):
+        self._materialize_all()
+        return list.count(self, value)
+
+    def remove(self, value):
+        self._materialize_all()
+        list.remove(self, value)
+
+    def sort(self, *, key=None, reverse=False):
+        self._materialize_all()
+        list.sort(self, key=key, reverse=reverse)
+
+    def __contains__(self, value):
+        self._materialize_all()
+        return list.__contains__(self, value)
+
+    def __add__(self, other):
+        self._materialize_all()
+        return list.__add__(self, other)
+
+    def __radd__(self, other):
+        self._materialize_all()
+        return list(other) + list.copy(self)
+
+    def __mul__(self, count):
+        self._materialize_all()
+        return list.__mul__(self, count)
+
+    __rmul__ = __mul__
+
+    def _compare(self, other, operator):
+        self._materialize_all()
+        if isinstance(other, LazyItems):
+            other._materialize_all()
+        return operator(self, other)
+
+    def __eq__(self, other):
+        return self._compare(other, list.__eq__)
+
+    def __ne__(self, other):
+        return self._compare(other, list.__ne__)
+
+    def __lt__(self, other):
+        return self._compare(other, list.__lt__)
+
+    def __le__(self, other):
+        return self._compare(other, list.__le__)
+
+    def __gt__(self, other):
+        return self._compare(other, list.__gt__)
+
+    def __ge__(self, other):
+        return self._compare(other, list.__ge__)
+
+    __hash__ = None
+
+
+class LazyObject(LazyMembers, Object):
+    pass
+
+
+class LazyArray(LazyItems, Array):
+    pass
+
+
+class LazyTypedArray(LazyItems, TypedArray):
+    pass
+
+
+class KV3LazyDecoder(KV3PlainDecoder):
+    """Decode KV3 value tree into containers that decode their child objects and arrays on first access.
+
+    Scalars are returned as the same KV3 types regular reader produces. On the first pass objects and arrays
+    are only skipped, recording cursors at their start and end, later access decodes just one level of them.
+    Streams are kept as memoryviews over the source buffers, and are released once no refs are left to decode.
+    """
+    compact_streams = True
+
+    def __init__(self, context: 'KV3ContextNew', type_mask: int = TYPE_MASK_LEGACY, v5_types: bool = False):
+        super().__init__(context, type_mask, v5_types)
+        self._container_ends: dict[tuple, tuple] = {}
+        self._pending_refs = 0
+        self._lock = Lock()
+
+    def decode(self) -> Any:
+        value = self.read_value()
+        if type(value) is KV3LazyRef:
+            return value.materialize()
+        return value
+
+    def _save_state(self) -> tuple:
+        streams0 = self.streams0
+        streams1 = self.streams1
+        return (self.type_pos, self.active is streams0, self.member_count_pos, self.blob_index, self.blob_pos,
+                streams0.byte_pos, streams0.short_pos, streams0.int_pos, streams0.double_pos,
+                streams1.byte_pos, streams1.short_pos, streams1.int_pos, streams1.double_pos)
+
+    def _restore_state(self, state: tuple):
+        streams0 = self.streams0
+        streams1 = self.streams1
+        (self.type_pos, active_is_streams0, self.member_count_pos, self.blob_index, self.blob_pos,
+         streams0.byte_pos, streams0.short_pos, streams0.int_pos, streams0.double_pos,
+         streams1.byte_pos, streams1.short_pos, streams1.int_pos, streams1.double_pos) = state
+        self.active = streams0 if active_is_streams0 else streams1
+
+    def materialize(self, ref: KV3LazyRef) -> LazyObject | LazyArray:
+        with self._lock:
+            if ref.decoder is None:
+                return ref.value
+            self._restore_state(ref.state)
+            if ref.data_type == _OBJECT:
+                value = LazyObject()
+                member_count = self.read_member_count()
+                strings = self.strings
+                for i in range(member_count):
+                    streams = self.active
+                    name_id = streams.ints[streams.int_pos]
+                    streams.int_pos += 1
+                    dict.__setitem__(value, strings[name_id] if name_id != -1 else str(i), self.read_value())
+                value.specifier = ref.specifier
+            else:
+                streams = self.active
+                count = streams.ints[streams.int_pos]
+                streams.int_pos += 1
+                value = LazyArray([self.read_value() for _ in range(count)])
+            ref.value = value
+            ref.decoder = None
+            self._pending_refs -= 1
+            if self._pending_refs == 0:
+                self._release()
+            return value
+
+    def _release(self):
+        self.streams0 = self.streams1 = self.active = None
+        self.types = self.member_counts = self.strings = None
+        self.blob_sizes = self.blob_data = None
+        self._container_ends.clear()
+
+    def read_typed_value(self, data_type: int, specifier: Specifier) -> Any:
+        if data_type == _OBJECT or data_type == _ARRAY:
+            self._pending_refs += 1
+            return KV3LazyRef(self, data_type, specifier, self._skip_container(data_type))
+        value = super().read_typed_value(data_type, _UNSPECIFIED)
+        if value is None:
+            return None
+        value_type = _VALUE_TYPES.get(data_type, None)
+        if value_type is not None:
+            value = value_type(value)
+            value.specifier = specifier
+        elif isinstance(value, BaseType):
+            value.specifier = specifier
+        return value
+
+    def read_typed_array(self, count: int) -> np.ndarray | LazyTypedArray:
+        type_pos = self.type_pos
+        data_type, specifier = self.read_type()
+        self.type_pos = type_pos
+        array = super().read_typed_array(count)
+        if isinstance(array, np.ndarray):
+            return array
+        return LazyTypedArray(KV3Type(data_type), specifier, array)
+
+    def _skip_container(self, data_type: int) -> tuple:
+        start = self._save_state()
+        end = self._container_ends.get(start, None)
+        if end is not None:
+            self._restore_state(end)
+            return start
+        if data_type == _OBJECT:
+            for _ in range(self.read_member_count()):
+                self.active.int_pos += 1
+                self._skip_typed(*self.read_type())
+        else:
+            streams = self.active
+            count = streams.ints[streams.int_pos]
+            streams.int_pos += 1
+            for _ in range(count):
+                self._skip_typed(*self.read_type())
+        self._container_ends[start] = self._save_state()
+        return start
+
+    def _skip_typed(self, data_type: int, specifier: Specifier):
+        streams = self.active
+        if data_type == _OBJECT or data_type == _ARRAY:
+            self._skip_container(data_type)
+        elif data_type in _INT_TYPES:
+            streams.int_pos += 1
+        elif data_type in _DOUBLE_TYPES:
+            streams.double_pos += 1
+        elif data_type in _BYTE_TYPES:
+            streams.byte_pos += 1
+        elif data_type in _SHORT_TYPES:
+            streams.short_pos += 1
+        elif data_type in _CONSTANT_TYPES:
+            pass
+        elif data_type == _ARRAY_TYPED:
+            count = streams.ints[streams.int_pos] & 0xFFFFFFFF
+            streams.int_pos += 1
+            self._skip_typed_array(count)
+        elif data_type == _ARRAY_TYPED_BYTE_LENGTH:
+            count = streams.bytes[streams.byte_pos]
+            streams.byte_pos += 1
+            self._skip_typed_array(count)
+        elif data_type == _ARRAY_TYPED_BYTE_LENGTH2:
+            count = streams.bytes[streams.byte_pos]
+            streams.byte_pos += 1
+            self.active = self.streams0
+            self._skip_typed_array(count)
+            self.active = self.streams1
+        elif data_type == _BINARY_BLOB:
+            if self.blob_sizes is not None:
+                self.blob_pos += self.blob_sizes[self.blob_index]
+                self.blob_index += 1
+            else:
+                streams.byte_pos += streams.read_int()
+        else:
+            raise NotImplementedError(f"Reader for {KV3Type(data_type)!r} not implemented")
+
+    def _skip_typed_array(self, count: int):
+        data_type, specifier = self.read_type()
+        streams = self.active
+        if data_type in _INT_TYPES:
+            streams.int_pos += count
+        elif data_type in _DOUBLE_TYPES:
+            streams.double_pos += count
+        elif data_type in _BYTE_TYPES:
+            streams.byte_pos += count
+        elif data_type in _SHORT_TYPES:
+            streams.short_pos += count
+        elif data_type not in _CONSTANT_TYPES:
+            for _ in range(count):
+                self._skip_typed(data_type, specifier)
@@ -9,12 +9,24 @@ import numpy.typing as npt
 from SourceIO.library.source2.blocks.resource_edit_info import ResourceEditInfo, ResourceEditInfo2
 from SourceIO.library.utils.perf_sampler import timed
 from SourceIO.library.utils.rustlib import lz4_decompress, decode_texture
+from SourceIO.library.utils.texture_cache import get_decoded_texture_cache
 from SourceIO.library.source2.blocks.texture_data import CompressedMip, TextureData, VTexExtraData, \
     VTexFlags, VTexFormat
 from SourceIO.library.source2.compiled_resource import CompiledResource
 
 logger = logging.getLogger('CompiledTextureResource')
 
+_BLOCK_COMPRESSED_FORMATS = (
+    VTexFormat.DXT1,
+    VTexFormat.DXT5,
+    VTexFormat.BC6H,
+    VTexFormat.BC7,
+    VTexFormat.ETC2,
+    VTexFormat.ETC2_EAC,
+    VTexFormat.ATI1N,
+    VTexFormat.ATI2N,
+)
+
 
 @dataclass(slots=True)
 class CompiledTextureResource(CompiledResource):
@@ -29,16 +41,7 @@ class CompiledTextureResource(CompiledResource):
         depth = texture_info.depth >> mip_level
         if depth < 1:
             depth = 1
-        if texture_info.pixel_format in [
-            VTexFormat.DXT1,
-            VTexFormat.DXT5,
-            VTexFormat.BC6H,
-            VTexFormat.BC7,
-            VTexFormat.ETC2,
-            VTexFormat.ETC2_EAC,
-            VTexFormat.ATI1N,
-            VTexFormat.ATI2N,
-        ]:
+        if texture_info.pixel_format in _BLOCK_COMPRESSED_FORMATS:
             misalign = width % 4
             if misalign > 0:
                 width += 4 - misalign
@@ -76,40 +79,56 @@ class CompiledTextureResource(CompiledResource):
         height = texture_info.height >> mip_level
         return width, height
 
-    def get_cubemap_face(self, face: int = 0, mip_level: int = 0):
-        if not self.is_cubemap():
-            return None
-        info_block = None
-        for block in self._header.blocks:
-            if block.name == 'DATA':
-                info_block = block
-                break
-        data_block = self.get_block(TextureData,block_name='DATA')
+    def get_mip_count(self) -> int:
+        data_block = self.get_block(TextureData, block_name='DATA')
+        return data_block.texture_info.mip_count
+
+    def select_mip_level(self, target_size: int) -> int:
+        """Return the smallest mip level which longest side is still at least target_size pixels."""
+        texture_info = self.get_block(TextureData, block_name='DATA').texture_info
+        mip_level = 0
+        while (mip_level + 1 < texture_info.mip_count and
+               max(texture_info.width >> (mip_level + 1), texture_info.height >> (mip_level + 1)) >= target_size):
+            mip_level += 1
+        return mip_level
+
+    def _read_mip_data(self, mip_level: int, face: Optional[int] = None) -> bytes | memoryview:
+        """Read decompressed data of mip level. Cubemaps contain all 6 faces unless single face is requested."""
+        info_block = self._get_block_info('DATA')
+        data_block = self.get_block(TextureData, block_name='DATA')
         buffer = self._buffer
         buffer.seek(info_block.absolute_offset + info_block.size)
-
         compression_info: Optional[CompressedMip] = data_block.extra_data.get(VTexExtraData.COMPRESSED_MIP_SIZE, None)
 
+        face_count = 6 if self.is_cubemap() else 1
         face_size = self._calculate_buffer_size_for_mip(data_block, mip_level)
-
+        mip_size = face_size * face_count
         if compression_info and compression_info.compressed:
+            buffer.seek(sum(compression_info.mip_sizes[mip_level + 1:]), io.SEEK_CUR)
             compressed_size = compression_info.mip_sizes[mip_level]
-            total_size = 0
-            for size in reversed(compression_info.mip_sizes[mip_level + 1:]):
-                total_size += size
-            buffer.seek(total_size, io.SEEK_CUR)
-            data = buffer.read(compressed_size)
-            if compressed_size != face_size * 6:
-                data = lz4_decompress(data, face_size * 6)
-            assert len(data) == face_size * 6, "Uncompressed data size != expected uncompressed size"
-        else:
-            total_size = 0
-            for i in range(data_block.texture_info.mip_count - 1, mip_level, -1):
-                total_size += self._calculate_buffer_size_for_mip(data_block, i) * 6
-            buffer.seek(total_size, io.SEEK_CUR)
-            data = buffer.read(face_size * 6)
+            data = buffer.read_view(compressed_size)
+            if compressed_size != mip_size:
+                # Whole mip is a single LZ4 block, so other faces can not be skipped here
+                data = memoryview(lz4_decompress(data, mip_size))
+            assert len(data) == mip_size, "Uncompressed data size != expected uncompressed size"
+            if face is not None:
+                data = data[face_size * face:face_size * face + face_size]
+            return data
+
+        total_size = 0
+        for i in range(data_block.texture_info.mip_count - 1, mip_level, -1):
+            total_size += self._calculate_buffer_size_for_mip(data_block, i) * face_count
+        if face is not None:
+            total_size += face_size * face
+            mip_size = face_size
+        buffer.seek(total_size, io.SEEK_CUR)
+        return buffer.read_view(mip_size)
 
-        face_data = data[face_size * face:face_size * face + face_size]
+    def get_cubemap_face(self, face: int = 0, mip_level: int = 0):
+        if not self.is_cubemap():
+            return None
+        data_block = self.get_block(TextureData,block_name='DATA')
+        face_data = self._read_mip_data(mip_level, face)
 
         pixel_format = data_block.texture_info.pixel_format
         width = data_block.texture_info.width >> mip_level
@@ -120,50 +139,75 @@ class CompiledTextureResource(CompiledResource):
 
     @timed
     def get_texture_data(self, mip_level: int = 0):
-        logger.info(f'Loading texture {self._filepath.as_posix()!r}')
-        info_block = None
-        for block in self._header.blocks:
-            if block.name == 'DATA':
-                info_block = block
-                break
+        """Decode mip level into float32 RGBA array of (width, height, 4) shape, I8 included.
 
+        Returned size is the size of the selected mip level, not of the full texture.
+        """
+        logger.info(f'Loading texture {self._filepath.as_posix()!r}')
         data_block = self.get_block(TextureData,block_name='DATA')
-        buffer = self._buffer
-        buffer.seek(info_block.absolute_offset + info_block.size)
-        compression_info: Optional[CompressedMip] = data_block.extra_data.get(VTexExtraData.COMPRESSED_MIP_SIZE, None)
-
-        desired_mip_size = self._calculate_buffer_size_for_mip(data_block, mip_level)
-        if self.is_cubemap():
-            desired_mip_size *= 6
-        if compression_info and compression_info.compressed:
-            compressed_size = compression_info.mip_sizes[mip_level]
-            total_size = 0
-            for size in reversed(compression_info.mip_sizes[mip_level + 1:]):
-                total_size += size
-            buffer.seek(total_size, io.SEEK_CUR)
-            data = buffer.read(compressed_size)
-            if compressed_size < desired_mip_size:
-                data = lz4_decompress(data, desired_mip_size)
-            assert len(data) == desired_mip_size, "Uncompressed data size != expected uncompressed size"
-        else:
-            total_size = 0
-            for i in range(data_block.texture_info.mip_count - 1, mip_level, -1):
-                total_size += self._calculate_buffer_size_for_mip(data_block, i)
-            if self.is_cubemap():
-                total_size *= 6
-            buffer.seek(total_size, io.SEEK_CUR)
-            data = buffer.read(desired_mip_size)
+        data = self._read_mip_data(mip_level)
 
         pixel_format = data_block.texture_info.pixel_format
-        width = data_block.texture_info.width
-        height = data_block.texture_info.height
+        width = data_block.texture_info.width >> mip_level
+        height = data_block.texture_info.height >> mip_level
         if self.is_cubemap():
             height *= 6
         data = self._decompress_texture(data, height, pixel_format, width)
         return data, (width, height)
 
     @timed
-    def _decompress_texture(self, data: bytes, height, pixel_format, width):
+    def get_native_texture_data(self, mip_level: int = 0, face: Optional[int] = None,
+                                region: Optional[tuple[int, int, int, int]] = None):
+        """Decode mip level without promoting it to float32.
+
+        Returns (height, width, 4) RGBA array, uint8 for LDR and float16 for HDR formats, and its size.
+        ``face`` selects a single cubemap face, otherwise cubemaps are returned as a strip of all 6 faces.
+        ``region`` is (x, y, width, height) rectangle in pixels of the selected mip, only the blocks covering it
+        are decoded.
+        """
+        data_block = self.get_block(TextureData, block_name='DATA')
+        pixel_format = data_block.texture_info.pixel_format
+        width = max(data_block.texture_info.width >> mip_level, 1)
+        height = max(data_block.texture_info.height >> mip_level, 1)
+        if self.is_cubemap() and face is None:
+            height *= 6
+        data = self._read_mip_data(mip_level, face)
+
+        crop = None
+        if region is not None:
+            data, width, height, crop = self._extract_region(data, width, height, pixel_format, region)
+        pixels = self._decode_native(data, width, height, pixel_format, np.float16)
+        if pixels is None:
+            logger.warning(f"Unsupported texture format: {pixel_format!r}")
+            return None, (width, height)
+        if crop is not None:
+            pixels = pixels[crop]
+        return pixels, (pixels.shape[1], pixels.shape[0])
+
+    @staticmethod
+    def _extract_region(data: bytes | memoryview, width: int, height: int, pixel_format: VTexFormat,
+                        region: tuple[int, int, int, int]):
+        x, y, region_width, region_height = region
+        if region_width <= 0 or region_height <= 0 or x < 0 or y < 0 or \
+                x + region_width > width or y + region_height > height:
+            raise ValueError(f"Region {region} is outside of {width}x{height} texture")
+        block_dim = 4 if pixel_format in _BLOCK_COMPRESSED_FORMATS else 1
+        block_size = VTexFormat.block_size(pixel_format)
+        blocks_x = -(-width // block_dim)
+        blocks_y = -(-height // block_dim)
+        blocks = np.frombuffer(data, np.uint8, blocks_x * blocks_y * block_size).reshape((blocks_y, blocks_x,
+                                                                                          block_size))
+        start_x = x // block_dim
+        start_y = y // block_dim
+        end_x = -(-(x + region_width) // block_dim)
+        end_y = -(-(y + region_height) // block_dim)
+        region_data = blocks[start_y:end_y, start_x:end_x].tobytes()
+        offset_x = x - start_x * block_dim
+        offset_y = y - start_y * block_dim
+        crop = (slice(offset_y, offset_y + region_height), slice(offset_x, offset_x + region_width))
+        return region_data, (end_x - start_x) * block_dim, (end_y - start_y) * block_dim, crop
+
+    def _get_compiler_options(self) -> tuple[bool, bool, bool, bool, bool]:
         resource_info_block = (self.get_block(ResourceEditInfo, block_name="REDI") or
                                self.get_block(ResourceEditInfo2, block_name="RED2"))
 
@@ -188,49 +232,63 @@ class CompiledTextureResource(CompiledResource):
                     normalize = True
                 elif spec.string == "Texture Compiler Version Image YCoCg Conversion":
                     y_co_cg = True
+        return invert, normalize, hemi_oct_aniso_roughness, y_co_cg, hemi_oct_normal
+
+    def _decode_native(self, data: bytes | memoryview, width: int, height: int, pixel_format: VTexFormat,
+                       hdr_dtype: npt.DTypeLike) -> Optional[np.ndarray]:
+        cache = get_decoded_texture_cache()
+        if cache is None or pixel_format not in _BLOCK_COMPRESSED_FORMATS:
+            return self._decode_pixels(data, width, height, pixel_format, hdr_dtype)
+        key = cache.make_key(data, pixel_format.name, width, height, np.dtype(hdr_dtype).name,
+                             *self._get_compiler_options())
+        pixels = cache.get(key)
+        if pixels is None:
+            pixels = self._decode_pixels(data, width, height, pixel_format, hdr_dtype)
+            if pixels is not None:
+                cache.put(key, pixels)
+        return pixels
+
+    def _decode_pixels(self, data: bytes | memoryview, width: int, height: int, pixel_format: VTexFormat,
+                       hdr_dtype: npt.DTypeLike) -> Optional[np.ndarray]:
+        invert, normalize, hemi_oct_aniso_roughness, y_co_cg, hemi_oct_normal = self._get_compiler_options()
 
         if pixel_format == VTexFormat.RGBA8888:
-            data = np.frombuffer(data, np.uint8).reshape((width, height, 4)).astype(np.float32) / 255
+            return np.frombuffer(data, np.uint8, width * height * 4).reshape((height, width, 4))
         elif pixel_format == VTexFormat.BC6H:
             t_data = decode_texture(data, width, height, "BC6")
-            tmp = np.frombuffer(t_data, np.float32, width * height * 3).reshape((width, height, 3))
-            data = np.ones((width, height, 4), dtype=np.float32)
-            data[:, :, :3] = tmp
+            tmp = np.frombuffer(t_data, np.float32, width * height * 3).reshape((height, width, 3))
+            output = np.ones((height, width, 4), dtype=hdr_dtype)
+            output[:, :, :3] = tmp
+            return output
         elif pixel_format == VTexFormat.BC7:
             data = decode_texture(data, width, height, "BC7")
-            data = np.frombuffer(data, np.uint8).reshape((width, height, 4))
-            output = data.copy()
-            del data
+            output = np.frombuffer(data, np.uint8).reshape((height, width, 4)).copy()
             if hemi_oct_aniso_roughness:
                 output = self._hemi_oct_aniso_roughness(output)
             if hemi_oct_normal:
                 output = self._hemi_oct_normal(output)
             if invert:
                 output[:, :, 1] = np.invert(output[:, :, 1])
-
-            data = output.astype(np.float32) / 255
+            return output
         elif pixel_format == VTexFormat.ATI1N:
             data = decode_texture(data, width, height, "ATI1N")
-            data = np.frombuffer(data, np.uint8).reshape((width, height, 4)).astype(np.float32) / 255
+            return np.frombuffer(data, np.uint8).reshape((height, width, 4))
         elif pixel_format == VTexFormat.ATI2N:
             data = decode_texture(data, width, height, "ATI2N")
-            data = np.frombuffer(data, np.uint8).reshape((width, height, 4))
-            data = data.copy()
+            output = np.frombuffer(data, np.uint8).reshape((height, width, 4)).copy()
             if normalize:
-                data = self._normalize(data)
+                output = self._normalize(output)
             if hemi_oct_aniso_roughness:
-                data = self._hemi_oct_aniso_roughness(data)
+                output = self._hemi_oct_aniso_roughness(output)
             if invert:
-                data[:, :, 1] = np.invert(data[:, :, 1])
-
-            data = data.astype(np.float32) / 255
+                output[:, :, 1] = np.invert(output[:, :, 1])
+            return output
         elif pixel_format == VTexFormat.DXT1:
             data = decode_texture(data, width, height, "DXT1")
-            data = np.frombuffer(data, np.uint8).reshape((width, height, 4)).astype(np.float32) / 255
+            return np.frombuffer(data, np.uint8).reshape((height, width, 4))
         elif pixel_format == VTexFormat.DXT5:
             data = decode_texture(data, width, height, "DXT5")
-            data = np.frombuffer(data, np.uint8).reshape((width, height, 4))
-            output = data.copy()
+            output = np.frombuffer(data, np.uint8).reshape((height, width, 4)).copy()
             if y_co_cg:
                 output = self._y_co_cg(output)
             if normalize:
@@ -240,20 +298,29 @@ class CompiledTextureResource(CompiledResource):
                     output = self._normalize(output)
             if invert:
                 output[:, :, 1] = 1 - output[:, :, 1]
-
-            data = output
-            data = data.astype(np.float32) / 255
+            return output
         elif pixel_format == VTexFormat.RGBA16161616F:
-            data = np.frombuffer(data, np.float16, width * height * 4).astype(np.float32).reshape((width, height, 4))
+            output = np.frombuffer(data, np.float16, width * height * 4).reshape((height, width, 4))
+            return output.astype(hdr_dtype, copy=False)
         elif pixel_format == VTexFormat.I8:
-            r = np.frombuffer(data, np.uint8)[:, None]
-            data = np.repeat(r, 4, axis=1).astype(np.float32) / 255
-            data[:, 3] = 1
-            data.reshape((width, height, 4))
-        else:
+            r = np.frombuffer(data, np.uint8, width * height).reshape((height, width, 1))
+            output = np.repeat(r, 4, axis=2)
+            output[:, :, 3] = 255
+            return output
+        return None
+
+    @timed
+    def _decompress_texture(self, data: bytes | memoryview, height, pixel_format, width):
+        pixels = self._decode_native(data, width, height, pixel_format, np.float32)
+        if pixels is None:
             logger.warning(f"Unsupported texture format: {pixel_format!r}")
-            data = np.frombuffer(data, np.float32).reshape((width, height, 4)).astype(np.float32) / 255
-        return data
+            return np.frombuffer(data, np.float32).reshape((width, height, 4)).astype(np.float32) / 255
+        if pixels.dtype == np.uint8:
+            pixels = pixels.astype(np.float32) / 255
+        else:
+            pixels = pixels.astype(np.float32, copy=False)
+        # Keep (width, height) shape callers of float decoding expect, memory layout is the same
+        return pixels.reshape((width, height, 4))
 
     @staticmethod
     def _hemi_oct_normal(output: np.ndarray) -> np.ndarray:
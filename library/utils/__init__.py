@@ -1,7 +1,7 @@
 import time
 
 from .extended_enum import ExtendedEnum
-from .file_utils import (Buffer, FileBuffer, MemoryBuffer, Readable,
+from .file_utils import (Buffer, FileBuffer, MemoryBuffer, MMapBuffer, Readable,
                          WritableMemoryBuffer)
 from .tiny_path import TinyPath
 from .path_utilities import path_stem, backwalk_file_resolver, corrected_path
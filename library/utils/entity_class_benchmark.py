@@ -0,0 +1,78 @@
+"""Compare cold start cost of importing generated entity class modules and loading them through the lazy registry.
+
+Usage: python -m SourceIO.library.utils.entity_class_benchmark [--repeat N] [--no-bytecode]
+
+Every measurement runs in a fresh interpreter and includes importing the registry itself. With ``--no-bytecode``
+cached .pyc files are not used for generated modules, like on the first start after install.
+"""
+import subprocess
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from SourceIO.library.utils.entity_class_registry import find_entity_class_modules
+from SourceIO.library.utils.tiny_path import TinyPath
+
+_PACKAGE_ROOT = Path(__file__).parent.parent.parent
+
+_SCRIPT = """
+import sys, time
+sys.path.insert(0, {parent!r})
+import {package}
+start = time.perf_counter()
+{setup}
+for module_name in {module_names!r}:
+    {load}
+print(time.perf_counter() - start)
+"""
+
+_EAGER_LOAD = "importlib.import_module(module_name)"
+_LAZY_LOAD = "load_entity_classes(module_name)"
+_EAGER_SETUP = "import importlib"
+_LAZY_SETUP = "from SourceIO.library.utils.entity_class_registry import load_entity_classes"
+_NO_BYTECODE_SETUP = "sys.pycache_prefix = {prefix!r}"
+
+
+def get_module_names() -> list[str]:
+    root = TinyPath(_PACKAGE_ROOT)
+    names = []
+    for source_path in find_entity_class_modules(root):
+        relative = source_path.relative_to(root).with_suffix("")
+        names.append("SourceIO." + relative.as_posix().replace("/", "."))
+    return names
+
+
+def _measure(setup: str, load: str, module_names: list[str], repeat: int, no_bytecode: bool) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        with TemporaryDirectory() as pycache_prefix:
+            run_setup = setup
+            if no_bytecode:
+                # Fresh empty bytecode cache for every run
+                run_setup = _NO_BYTECODE_SETUP.format(prefix=pycache_prefix) + "\n" + setup
+            script = _SCRIPT.format(parent=str(_PACKAGE_ROOT.parent), package=_PACKAGE_ROOT.name,
+                                    setup=run_setup, module_names=module_names, load=load)
+            result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+        best = min(best, float(result.stdout.strip().splitlines()[-1]))
+    return best
+
+
+def main(argv: list[str]):
+    repeat = 3
+    if "--repeat" in argv:
+        index = argv.index("--repeat")
+        repeat = int(argv[index + 1])
+        del argv[index:index + 2]
+    no_bytecode = "--no-bytecode" in argv
+
+    module_names = get_module_names()
+    print(f"{len(module_names)} generated entity class modules, best of {repeat} runs")
+    eager_time = _measure(_EAGER_SETUP, _EAGER_LOAD, module_names, repeat, no_bytecode)
+    lazy_time = _measure(_LAZY_SETUP, _LAZY_LOAD, module_names, repeat, no_bytecode)
+    print(f"import modules:  {eager_time:.4f} sec")
+    print(f"lazy registry:   {lazy_time:.4f} sec")
+    print(f"speedup:         {eager_time / lazy_time:.2f}x")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,255 @@
+import ast
+import builtins
+import pickle
+import sys
+import zlib
+from importlib.util import find_spec
+from threading import RLock
+from typing import Any
+
+from SourceIO.library.utils.tiny_path import TinyPath
+from SourceIO.logger import SourceLogMan
+
+logger = SourceLogMan().get_logger("EntityClassRegistry")
+
+_TABLE_VERSION = 1
+_TABLE_SUFFIX = ".pickle"
+_HANDLE_NAME = "entity_class_handle"
+
+# Number of the first line of top level statement and its source lines
+SourceChunk = tuple[int, str]
+
+
+def _is_class_module_import(node: ast.stmt) -> bool:
+    return isinstance(node, ast.ImportFrom) and node.level > 0 and (node.module or "").endswith("_entity_classes")
+
+
+def build_entity_class_table(source: str, digest: str) -> dict[str, Any]:
+    """Split generated *_entity_classes module source into separately compilable class definitions.
+
+    Class sources are compressed one by one, so loading the table does not unpack classes nobody asks for.
+
+    Classes redefined later in the module keep their earlier definitions under "name@line" keys,
+    so classes deriving from them get the same bases as they would on regular import.
+    """
+    tree = ast.parse(source)
+    lines = source.splitlines(keepends=True)
+    prelude: list[SourceChunk] = []
+    imports: dict[str, tuple[str, str]] = {}
+    classes: dict[str, tuple[int, str, tuple[str, ...], bytes]] = {}
+    handle: dict[str, str] = {}
+    current: dict[str, str] = {}
+
+    final_lines = {node.name: node.lineno for node in tree.body if isinstance(node, ast.ClassDef)}
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            key = node.name if final_lines[node.name] == node.lineno else f"{node.name}@{node.lineno}"
+            bases = tuple(current.get(base.id, base.id) for base in node.bases)
+            class_source = "".join(lines[node.lineno - 1:node.end_lineno]).encode("utf8")
+            classes[key] = node.lineno, node.name, bases, zlib.compress(class_source, 9)
+            current[node.name] = key
+        elif _is_class_module_import(node):
+            for alias in node.names:
+                imports[alias.asname or alias.name] = ("." * node.level + node.module, alias.name)
+        elif (isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name)
+              and node.targets[0].id == _HANDLE_NAME):
+            for key_node, value_node in zip(node.value.keys, node.value.values):
+                handle[key_node.value] = current.get(value_node.id, value_node.id)
+        else:
+            prelude.append((node.lineno, "".join(lines[node.lineno - 1:node.end_lineno])))
+    return {"version": _TABLE_VERSION, "digest": digest, "prelude": prelude,
+            "imports": imports, "classes": classes, "handle": handle}
+
+
+def _source_digest(source: bytes) -> str:
+    return f"{len(source):x}-{zlib.crc32(source):08x}"
+
+
+def get_entity_class_table_path(source_path: TinyPath) -> TinyPath:
+    return source_path.with_suffix(_TABLE_SUFFIX)
+
+
+def write_entity_class_table(source_path: TinyPath) -> dict[str, Any]:
+    """Build class table of generated module and store it next to the module.
+
+    Called by entity class generator, tables of all modules can be rebuilt with
+    python -m SourceIO.library.utils.entity_class_registry
+    """
+    with source_path.open("rb") as f:
+        source = f.read()
+    table = build_entity_class_table(source.decode("utf8"), _source_digest(source))
+    with get_entity_class_table_path(source_path).open("wb") as f:
+        pickle.dump(table, f, pickle.HIGHEST_PROTOCOL)
+    return table
+
+
+def load_entity_class_table(source_path: TinyPath) -> dict[str, Any]:
+    """Load precomputed class table stored next to the module.
+
+    Missing or outdated table is built in memory only, addon folder is never written to at runtime.
+    """
+    with source_path.open("rb") as f:
+        source = f.read()
+    digest = _source_digest(source)
+    table_path = get_entity_class_table_path(source_path)
+    if table_path.exists():
+        try:
+            with table_path.open("rb") as f:
+                table = pickle.loads(f.read())
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError) as ex:
+            logger.warn(f"Failed to read {table_path.name!r} entity class table: {ex}")
+            table = None
+        if table and table.get("version") == _TABLE_VERSION and table.get("digest") == digest:
+            return table
+    logger.warn(f"Entity class table for {source_path.name!r} is missing or outdated, "
+                f"run python -m SourceIO.library.utils.entity_class_registry to rebuild it")
+    return build_entity_class_table(source.decode("utf8"), digest)
+
+
+class LazyEntityClassRef:
+    """Entity class that was not created yet, remembers module it comes from and its key in that module."""
+    __slots__ = ("module", "key")
+
+    def __init__(self, module: 'EntityClassModule', key: str):
+        self.module = module
+        self.key = key
+
+    def materialize(self) -> type:
+        return self.module.get_class(self.key)
+
+    def __repr__(self):
+        return f"<LazyEntityClassRef {self.module.name}.{self.key}>"
+
+
+class EntityClassLookupTable(dict):
+    """Classname to entity class mapping, classes held as LazyEntityClassRef are created on first access.
+
+    Membership tests and copies never create classes, so handlers can extend and check tables for free.
+    """
+
+    def _materialize(self, key):
+        value = dict.__getitem__(self, key)
+        if type(value) is LazyEntityClassRef:
+            value = value.materialize()
+            dict.__setitem__(self, key, value)
+        return value
+
+    def __getitem__(self, item):
+        return self._materialize(item)
+
+    def get(self, key, default=None):
+        if dict.__contains__(self, key):
+            return self._materialize(key)
+        return default
+
+    def values(self):
+        return [self._materialize(key) for key in dict.keys(self)]
+
+    def items(self):
+        return [(key, self._materialize(key)) for key in dict.keys(self)]
+
+    def copy(self) -> 'EntityClassLookupTable':
+        return EntityClassLookupTable(self)
+
+
+class EntityClassModule:
+    """Stand-in for generated *_entity_classes module that executes class definitions only when requested.
+
+    Helpers defined in the module and its entity classes are available as attributes,
+    entity_class_handle is an EntityClassLookupTable of lazy references.
+    """
+
+    def __init__(self, name: str, source_path: TinyPath):
+        self.name = name
+        self.source_path = source_path
+        table = load_entity_class_table(source_path)
+        self._imports: dict[str, tuple[str, str]] = table["imports"]
+        self._classes: dict[str, tuple[int, str, tuple[str, ...], bytes]] = table["classes"]
+        self._built: dict[str, type] = {}
+        self._lock = RLock()
+        self._namespace: dict[str, Any] = {"__name__": name, "__file__": str(source_path),
+                                           "__builtins__": builtins}
+        for lineno, chunk in table["prelude"]:
+            self._exec(lineno, chunk)
+        self.entity_class_handle = EntityClassLookupTable(
+            (classname, LazyEntityClassRef(self, key)) for classname, key in table["handle"].items())
+
+    def _exec(self, lineno: int, chunk: str):
+        # Pad with empty lines so tracebacks point at the right line of the generated module
+        exec(compile("\n" * (lineno - 1) + chunk, str(self.source_path), "exec"), self._namespace)
+
+    def _resolve(self, key: str) -> Any:
+        if key in self._built:
+            return self._built[key]
+        if key in self._classes:
+            return self._build_class(key)
+        if key in self._imports:
+            module_name, attr = self._imports[key]
+            relative_name = module_name.lstrip(".")
+            level = len(module_name) - len(relative_name)
+            package = self.name.rsplit(".", level)[0]
+            return getattr(load_entity_classes(f"{package}.{relative_name}"), attr)
+        if key in self._namespace:
+            return self._namespace[key]
+        return getattr(builtins, key)
+
+    def _build_class(self, key: str) -> type:
+        lineno, class_name, bases, source = self._classes[key]
+        for base in bases:
+            self._namespace[base.partition("@")[0]] = self._resolve(base)
+        self._exec(lineno, zlib.decompress(source).decode("utf8"))
+        cls = self._built[key] = self._namespace[class_name]
+        return cls
+
+    def get_class(self, key: str) -> type:
+        """Return entity class by its key in the table, creating it and its bases on first request."""
+        with self._lock:
+            return self._resolve(key)
+
+    def __getattr__(self, item: str) -> Any:
+        if item.startswith("_"):
+            raise AttributeError(item)
+        try:
+            return self.get_class(item)
+        except AttributeError:
+            raise AttributeError(f"Entity class module {self.name!r} has no attribute {item!r}") from None
+
+    def __repr__(self):
+        return f"<EntityClassModule {self.name!r}>"
+
+
+_modules: dict[str, EntityClassModule] = {}
+_modules_lock = RLock()
+
+
+def load_entity_classes(module_name: str) -> EntityClassModule:
+    """Return lazy stand-in for generated entity class module, module itself is never imported."""
+    with _modules_lock:
+        module = _modules.get(module_name, None)
+        if module is None:
+            spec = find_spec(module_name)
+            if spec is None or spec.origin is None:
+                raise ImportError(f"Entity class module {module_name!r} not found", name=module_name)
+            module = _modules[module_name] = EntityClassModule(module_name, TinyPath(spec.origin))
+        return module
+
+
+def find_entity_class_modules(root: TinyPath) -> list[TinyPath]:
+    """Generated class modules under root, those are the ones defining entity_class_handle."""
+    modules = []
+    for path in root.rglob("*_entity_classes.py"):
+        with open(path, "r", encoding="utf8") as f:
+            if f"\n{_HANDLE_NAME} = " in f.read():
+                modules.append(TinyPath(path))
+    return sorted(modules)
+
+
+def main(argv: list[str]):
+    root = TinyPath(argv[0]) if argv else TinyPath(__file__).parent.parent.parent
+    for source_path in find_entity_class_modules(root):
+        table = write_entity_class_table(source_path)
+        print(f"{source_path.relative_to(root).as_posix()}: {len(table['classes'])} classes")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
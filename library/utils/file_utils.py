@@ -2,6 +2,8 @@ import abc
 import binascii
 import contextlib
 import io
+import logging
+import mmap
 import os
 import struct
 from pathlib import Path
@@ -13,6 +15,7 @@ try:
 except ImportError:
     TinyPath = Path
 
+logger = logging.getLogger('FileUtils')
 
 class Buffer(abc.ABC, io.RawIOBase):
     def __init__(self):
@@ -74,6 +77,10 @@ class Buffer(abc.ABC, io.RawIOBase):
     def read_fmt(self, fmt):
         return unpack(self._endian + fmt, self.read(calcsize(self._endian + fmt)))
 
+    def read_view(self, size: int = -1) -> memoryview:
+        """Read data as memoryview, memory backed buffers return it without copying."""
+        return memoryview(self.read(size))
+
     def _read(self, fmt):
         return unpack(self._endian + fmt, self.read(calcsize(self._endian + fmt)))[0]
 
@@ -257,13 +264,16 @@ class MemoryBuffer(Buffer):
         return len(_b)
 
     def read(self, _size: int = -1) -> Optional[bytes]:
-        if _size == -1:
+        return self.read_view(_size).tobytes()
+
+    def read_view(self, size: int = -1) -> memoryview:
+        if size == -1:
             data = self._buffer[self._offset:]
             self._offset += len(data)
-            return data.tobytes()
-        data = self._buffer[self._offset:self._offset + _size]
-        self._offset += _size
-        return data.tobytes()
+            return data
+        data = self._buffer[self._offset:self._offset + size]
+        self._offset += size
+        return data
 
     def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
         if whence == io.SEEK_SET:
@@ -271,7 +281,7 @@ class MemoryBuffer(Buffer):
         elif whence == io.SEEK_CUR:
             self._offset += offset
         elif whence == io.SEEK_END:
-            self._offset = self.size() - offset
+            self._offset = self.size() + offset
         else:
             raise ValueError("Invalid whence argument")
 
@@ -293,10 +303,30 @@ class MemoryBuffer(Buffer):
     def close(self) -> None:
         self._buffer = None
 
+    def seekable(self) -> bool:
+        return True
+
+    def readable(self) -> bool:
+        return True
+
+    def _find_terminator(self, start: int) -> int:
+        obj = self._buffer.obj
+        if isinstance(obj, (bytes, bytearray, mmap.mmap)) and len(obj) == self._buffer.nbytes:
+            end = obj.find(b"\x00", start)
+            return self._buffer.nbytes if end == -1 else end
+        # View into a part of bigger object, offsets of the underlying object do not match ours
+        size = self._buffer.nbytes
+        while start < size:
+            chunk_end = self._buffer[start:start + 64].tobytes().find(b"\x00")
+            if chunk_end != -1:
+                return start + chunk_end
+            start += 64
+        return size
+
     def read_nt_string(self: 'MemoryBuffer'):
-        end = self._buffer.obj.index(b"\x00", self._offset)
+        end = self._find_terminator(self._offset)
         string = self._buffer[self._offset:end]
-        self._offset+=end-self._offset+1
+        self._offset = end + 1
         return string.tobytes().decode("utf8")
 
     def slice(self, offset: Optional[int] = None, size: int = -1) -> 'MemorySlice':
@@ -372,6 +402,36 @@ class FileBuffer(io.FileIO, Buffer):
             return MemorySlice(self.read(size), slice_offset)
 
 
+class MMapBuffer(MemoryBuffer):
+    """Read-only buffer over memory mapped file, slices and read_view() are zero-copy views into the mapping."""
+
+    def __init__(self, filepath: Union[str, TinyPath, Path]):
+        with open(filepath, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                self._mmap = None
+                super().__init__(b"")
+            else:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                super().__init__(self._mmap)
+        self.name = str(filepath)
+
+    def __str__(self) -> str:
+        return f'<MMapBuffer: {self.name!r} {self.tell()}/{self.size()}>'
+
+    def close(self) -> None:
+        if self._buffer is None:
+            return
+        if self._mmap is not None:
+            self._buffer.release()
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Views into the mapping are still alive, it gets unmapped only once they are collected
+                logger.warning(f"{self.name!r} is still referenced, file stays mapped until references are dropped")
+            self._mmap = None
+        super().close()
+
+
 class MemorySlice(MemoryBuffer):
     def __init__(self, buffer: Union[bytes, bytearray, memoryview], offset: int):
         super().__init__(buffer)
@@ -390,4 +450,4 @@ class Readable(Protocol):
         ...
 
 
-__all__ = ['Buffer', 'MemoryBuffer', 'WritableMemoryBuffer', 'FileBuffer', 'MemorySlice', 'Readable']
+__all__ = ['Buffer', 'MemoryBuffer', 'WritableMemoryBuffer', 'FileBuffer', 'MMapBuffer', 'MemorySlice', 'Readable']
@@ -57,6 +57,38 @@ def backwalk_file_resolver(current_path, file_to_find) -> Optional[TinyPath]:
     return None
 
 
+# directory path -> (mtime, lowercase subdirectory names, lowercase file names), both mapping to real names
+_DIRECTORY_LISTING_CACHE: dict[str, tuple[int, dict[str, str], dict[str, str]]] = {}
+
+
+def _list_directory(directory: str) -> Optional[tuple[dict[str, str], dict[str, str]]]:
+    directory = directory or "/"
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+    except OSError:
+        return None
+    cached = _DIRECTORY_LISTING_CACHE.get(directory, None)
+    if cached is not None and cached[0] == mtime:
+        return cached[1], cached[2]
+    dirs = {}
+    files = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    dirs.setdefault(entry.name.lower(), entry.name)
+                else:
+                    files.setdefault(entry.name.lower(), entry.name)
+    except OSError:
+        return None
+    _DIRECTORY_LISTING_CACHE[directory] = mtime, dirs, files
+    return dirs, files
+
+
+def clear_directory_listing_cache():
+    _DIRECTORY_LISTING_CACHE.clear()
+
+
 def corrected_path(path: TinyPath):
     if platform.system() == "Windows" or path.exists():  # Shortcut for windows
         return path
@@ -64,15 +96,19 @@ def corrected_path(path: TinyPath):
 
     new_path = TinyPath(root)
     for part in parts:
-        for dir_name in new_path.iterdir():
-            if dir_name.is_file():
-                continue
-            if dir_name.name.lower() == part.lower():
-                new_path = dir_name
-                break
-    for file_name in new_path.iterdir():
-        if file_name.is_file() and file_name.name.lower() == fname.lower():
-            return file_name
+        listing = _list_directory(new_path)
+        if listing is None:
+            return path
+        dir_name = listing[0].get(part.lower(), None)
+        if dir_name is None:
+            return path
+        new_path = new_path / dir_name
+    listing = _list_directory(new_path)
+    if listing is None:
+        return path
+    file_name = listing[1].get(fname.lower(), None)
+    if file_name is not None:
+        return new_path / file_name
     return path
 
 
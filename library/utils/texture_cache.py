@@ -0,0 +1,186 @@
+import os
+import struct
+from collections import OrderedDict
+from hashlib import blake2b
+from threading import Lock, get_ident
+from typing import Optional
+
+import numpy as np
+
+from SourceIO.library.shared.content_manager.cache import CacheStats
+from SourceIO.library.utils.rustlib import lz4_compress, lz4_decompress
+from SourceIO.library.utils.tiny_path import TinyPath
+from SourceIO.logger import SourceLogMan
+
+logger = SourceLogMan().get_logger("TextureCache")
+
+DEFAULT_TEXTURE_CACHE_BUDGET = 2 * 1024 * 1024 * 1024
+
+_MAGIC = b"SIOT"
+_VERSION = 1
+_SUFFIX = ".siotex"
+# magic, version, compression, dtype, ndim, data size
+_HEADER = struct.Struct("<4sBBBBQ")
+_COMPRESSION_NONE = 0
+_COMPRESSION_LZ4 = 1
+_DTYPES = [np.dtype(np.uint8), np.dtype(np.float16), np.dtype(np.float32)]
+
+
+class DecodedTextureCache:
+    """On disk cache of decoded texture pixels with a byte budget, least recently used entries are evicted first.
+
+    Entries are keyed by a hash of the encoded source data plus decoding parameters, so renamed or re-mounted
+    files still hit and modified ones never do. Values are stored as native arrays (uint8, float16 or float32),
+    LZ4 compressed when that makes them smaller. Lookups are safe to do from decoding threads.
+    """
+
+    def __init__(self, cache_dir: TinyPath | str, budget: int = DEFAULT_TEXTURE_CACHE_BUDGET):
+        self.cache_dir = TinyPath(cache_dir)
+        self.budget = budget
+        self.stats = CacheStats()
+        self._entries: Optional[OrderedDict[str, int]] = None
+        self._used = 0
+        self._lock = Lock()
+
+    @staticmethod
+    def make_key(data: bytes | memoryview, *params) -> str:
+        hasher = blake2b(data, digest_size=16)
+        for param in params:
+            hasher.update(b"\x00" + str(param).encode("utf8"))
+        return hasher.hexdigest()
+
+    @property
+    def used(self) -> int:
+        with self._lock:
+            self._load_index()
+            return self._used
+
+    def _entry_path(self, key: str) -> TinyPath:
+        return self.cache_dir / (key + _SUFFIX)
+
+    def _load_index(self):
+        if self._entries is not None:
+            return
+        entries = []
+        if self.cache_dir.is_dir():
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith(_SUFFIX) and entry.is_file():
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, entry.name[:-len(_SUFFIX)], stat.st_size))
+        entries.sort()
+        self._entries = OrderedDict((key, size) for _, key, size in entries)
+        self._used = sum(self._entries.values())
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        with self._lock:
+            self._load_index()
+            if key not in self._entries:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+        path = self._entry_path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+            array = self._unpack(data)
+        except (OSError, ValueError) as ex:
+            logger.warn(f"Dropping broken texture cache entry {key}: {ex}")
+            self._remove(key)
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return array
+
+    def put(self, key: str, array: np.ndarray):
+        data = self._pack(array)
+        if len(data) > self.budget:
+            return
+        path = self._entry_path(key)
+        tmp_path = self.cache_dir / f"{key}.{os.getpid()}.{get_ident()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as ex:
+            logger.warn(f"Failed to store texture cache entry {key}: {ex}")
+            return
+        with self._lock:
+            self._load_index()
+            if (old_size := self._entries.pop(key, None)) is not None:
+                self._used -= old_size
+            self._entries[key] = len(data)
+            self._used += len(data)
+            self._shrink()
+
+    def _remove(self, key: str):
+        with self._lock:
+            if (size := self._entries.pop(key, None)) is not None:
+                self._used -= size
+        try:
+            os.remove(self._entry_path(key))
+        except OSError:
+            pass
+
+    def _shrink(self):
+        while self._used > self.budget and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._used -= size
+            self.stats.evictions += 1
+            try:
+                os.remove(self._entry_path(key))
+            except OSError:
+                pass
+
+    def clear(self):
+        with self._lock:
+            self._load_index()
+            while self._entries:
+                key, _ = self._entries.popitem()
+                try:
+                    os.remove(self._entry_path(key))
+                except OSError:
+                    pass
+            self._used = 0
+
+    @staticmethod
+    def _pack(array: np.ndarray) -> bytes:
+        array = np.ascontiguousarray(array)
+        raw = array.data.cast("B")
+        compression = _COMPRESSION_NONE
+        payload = raw
+        compressed = lz4_compress(raw)
+        if 0 < len(compressed) < len(raw):
+            compression = _COMPRESSION_LZ4
+            payload = compressed
+        header = _HEADER.pack(_MAGIC, _VERSION, compression, _DTYPES.index(array.dtype), array.ndim, len(raw))
+        return header + struct.pack(f"<{array.ndim}I", *array.shape) + bytes(payload)
+
+    @staticmethod
+    def _unpack(data: bytes) -> np.ndarray:
+        if len(data) < _HEADER.size:
+            raise ValueError("Truncated entry")
+        magic, version, compression, dtype_id, ndim, raw_size = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION or dtype_id >= len(_DTYPES):
+            raise ValueError("Unknown entry format")
+        shape = struct.unpack_from(f"<{ndim}I", data, _HEADER.size)
+        payload = memoryview(data)[_HEADER.size + 4 * ndim:]
+        if compression == _COMPRESSION_LZ4:
+            payload = lz4_decompress(payload, raw_size)
+        if len(payload) != raw_size:
+            raise ValueError("Entry size mismatch")
+        # Callers are free to modify decoded pixels in place, so hand out a writable copy
+        return np.frombuffer(bytearray(payload), _DTYPES[dtype_id]).reshape(shape)
+
+
+_active_cache: Optional[DecodedTextureCache] = None
+
+
+def get_decoded_texture_cache() -> Optional[DecodedTextureCache]:
+    return _active_cache
+
+
+def set_decoded_texture_cache(cache: Optional[DecodedTextureCache]):
+    global _active_cache
+    _active_cache = cache
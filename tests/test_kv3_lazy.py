@@ -0,0 +1,95 @@
+import copy
+
+from SourceIO.library.source2.keyvalues3.enums import Specifier
+from SourceIO.library.source2.keyvalues3.fast_decoder import _ARRAY, _OBJECT
+from SourceIO.library.source2.keyvalues3.lazy import KV3LazyRef, LazyArray, LazyObject
+from SourceIO.library.source2.keyvalues3.types import Int32, String
+
+
+class _TreeDecoder:
+    """Materializes refs from plain python values stored in their state."""
+
+    def materialize(self, ref: KV3LazyRef):
+        if ref.data_type == _OBJECT:
+            value = LazyObject()
+            for key, item in ref.state.items():
+                dict.__setitem__(value, key, _wrap(self, item))
+            return value
+        return LazyArray([_wrap(self, item) for item in ref.state])
+
+
+def _wrap(decoder: _TreeDecoder, value):
+    if isinstance(value, dict):
+        return KV3LazyRef(decoder, _OBJECT, Specifier.UNSPECIFIED, value)
+    if isinstance(value, list):
+        return KV3LazyRef(decoder, _ARRAY, Specifier.UNSPECIFIED, value)
+    return value
+
+
+_TREE = {"name": String("root"), "child": {"value": Int32(1)}, "items": [{"value": Int32(2)}, [Int32(3)]]}
+
+
+def _make_tree():
+    return _wrap(_TreeDecoder(), copy.deepcopy(_TREE)).materialize()
+
+
+def _assert_no_refs(value):
+    assert type(value) is not KV3LazyRef
+    if isinstance(value, dict):
+        for item in dict.values(value):
+            _assert_no_refs(item)
+    elif isinstance(value, list):
+        for item in list.__iter__(value):
+            _assert_no_refs(item)
+
+
+def _assert_shallow_no_refs(value):
+    items = dict.values(value) if isinstance(value, dict) else list.__iter__(value)
+    for item in items:
+        assert type(item) is not KV3LazyRef
+
+
+def test_object_copies_are_materialized():
+    for make_copy in (dict, lambda obj: {**obj}, lambda obj: obj.copy(), lambda obj: obj | {},
+                      lambda obj: {} | obj, copy.copy, lambda obj: dict(obj.items())):
+        _assert_shallow_no_refs(make_copy(_make_tree()))
+    merged = {}
+    merged.update(_make_tree())
+    _assert_shallow_no_refs(merged)
+
+
+def test_object_accessors_are_materialized():
+    tree = _make_tree()
+    assert type(tree.setdefault("child")) is LazyObject
+    assert type(tree.pop("items")) is LazyArray
+    assert type(_make_tree().popitem()[1]) is not KV3LazyRef
+    assert all(type(value) is not KV3LazyRef for value in _make_tree().values())
+    assert all(type(value) is not KV3LazyRef for _, value in _make_tree().items())
+
+
+def test_object_comparison_materializes_both_sides():
+    assert _make_tree() == _make_tree()
+    assert not (_make_tree() != _make_tree())
+    assert _make_tree() == {"name": "root", "child": {"value": 1}, "items": [{"value": 2}, [3]]}
+
+
+def test_array_copies_are_materialized():
+    for make_copy in (list, lambda arr: arr.copy(), lambda arr: arr + [], lambda arr: [] + arr,
+                      lambda arr: arr * 1, lambda arr: 1 * arr, lambda arr: arr[:], lambda arr: [*arr],
+                      copy.copy):
+        _assert_shallow_no_refs(make_copy(_make_tree()["items"]))
+
+
+def test_array_accessors_are_materialized():
+    assert type(_make_tree()["items"].pop()) is LazyArray
+    assert _make_tree()["items"].index([3]) == 1
+    assert _make_tree()["items"].count({"value": 2}) == 1
+    assert [3] in _make_tree()["items"]
+    assert _make_tree()["items"] == _make_tree()["items"]
+    assert _make_tree()["items"] == [{"value": 2}, [3]]
+
+
+def test_full_materialization_leaves_no_refs():
+    tree = _make_tree()
+    assert tree == _make_tree()
+    _assert_no_refs(tree)
@@ -0,0 +1,306 @@
+import random
+import struct
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from SourceIO.library.shared.app_id import SteamAppId
+from SourceIO.library.source1.bsp.datatypes.static_prop_lump import STATIC_PROP_DTYPE, StaticPropFlag, \
+    StaticPropLump
+from SourceIO.library.utils import Buffer, MemoryBuffer
+
+
+class ReferenceStaticProp:
+    """Struct based static prop parser StaticPropLump replaced, copied as it was apart from logging."""
+
+    def __init__(self):
+        self.origin = []
+        self.rotation = []
+        self.prop_type = 0
+        self.first_leaf = 0
+        self.leaf_count = 0
+        self.solid = 0
+        self.flags = StaticPropFlag.NONE
+        self.skin = 0
+        self.fade_min_dist = 0.0
+        self.fade_max_dist = 0.0
+        self.lighting_origin = []
+        self.forced_fade_scale = 0.0
+        self.min_dx_level = 0
+        self.max_dx_level = 0
+        self.lightmap_resolution = []
+        self.min_cpu_level = 0
+        self.max_cpu_level = 0
+        self.min_gpu_level = 0
+        self.max_gpu_level = 0
+        self.diffuse_modulation = []
+        self.disable_x360 = 0
+        self.flags_ex = 0
+        self.uniform_scale = 0.0
+        self.uniform_scale_yz = 0.0, 0.0
+        self.scaling = [1.0, 1.0, 1.0]
+
+    def parse(self, reader: Buffer, version: int, bsp_version: tuple[int, int], size: int, app_id: int):
+        if bsp_version == (20, 4):
+            self._parse_v6(reader)
+            reader.skip(72)
+            return
+
+        if app_id == SteamAppId.LEFT_4_DEAD and version == 7 and size == 68:
+            self._parse_v7_l4d(reader)
+            return
+
+        if app_id == SteamAppId.TEAM_FORTRESS_2 and version == 7 and size == 72:
+            self._parse_v10(reader)
+            return
+
+        if app_id == SteamAppId.COUNTER_STRIKE_GO and version in (10, 11):
+            if version == 10:
+                self._parse_v10_csgo(reader)
+            else:
+                self._parse_v11_csgo(reader)
+            return
+
+        if app_id == SteamAppId.BLACK_MESA and version in (10, 11):
+            if version == 10 and size == 72:
+                self._parse_v10(reader)
+                return
+            elif version == 11:
+                if size == 76:
+                    self._parse_v11_lite(reader)
+                    return
+                elif size == 80:
+                    self._parse_v11(reader)
+                    return
+
+        if version == 4:
+            self._parse_v4(reader)
+            return
+
+        if version == 5:
+            self._parse_v5(reader)
+            return
+
+        if version == 6:
+            if app_id == SteamAppId.VINDICTUS:
+                self._parse_v6_vin(reader)
+                return
+            else:
+                self._parse_v6(reader)
+                return
+
+        if version == 7:
+            if app_id == SteamAppId.VINDICTUS:
+                self._parse_v7_vin(reader)
+                return
+
+            if app_id == SteamAppId.LEFT_4_DEAD and size == 68:
+                self._parse_v7_l4d(reader)
+                return
+
+            if app_id == SteamAppId.TEAM_FORTRESS_2 and size == 72:
+                self._parse_v10(reader)
+                return
+
+        if version == 8:
+            self._parse_v8(reader)
+            return
+
+        if version == 9:
+            self._parse_v9(reader)
+            return
+
+        if version == 10:
+            if app_id == SteamAppId.COUNTER_STRIKE_GO:
+                self._parse_v10_csgo(reader)
+                return
+
+            self._parse_v10(reader)
+            return
+
+        if version == 11:
+            if app_id == SteamAppId.COUNTER_STRIKE_GO:
+                self._parse_v11_csgo(reader)
+                return
+
+            if app_id == SteamAppId.BLACK_MESA:
+                if size == 76:
+                    self._parse_v11_lite(reader)
+                    return
+                elif size == 80:
+                    self._parse_v11(reader)
+                    return
+
+            self._parse_v11(reader)
+            return
+
+        if version == 12:
+            self._parse_v12(reader)
+            return
+        if version == 13:
+            self._parse_v13_strata(reader)
+            return
+
+        raise NotImplementedError(f"No reference parser for static prop of version {version}")
+
+    def _parse_v4(self, reader: Buffer):
+        self.origin = reader.read_fmt('3f')
+        self.rotation = reader.read_fmt('3f')
+        self.prop_type, self.first_leaf, self.leaf_count = reader.read_fmt('3H')
+        self.solid, self.flags = reader.read_fmt('2B')
+        self.skin = reader.read_int32()
+        self.fade_min_dist, self.fade_max_dist = reader.read_fmt('2f')
+        self.lighting_origin = reader.read_fmt('3f')
+
+    def _parse_v5(self, reader: Buffer):
+        self._parse_v4(reader)
+        self.forced_fade_scale = reader.read_float()
+
+    def _parse_v6_vin(self, reader: Buffer):
+        self._parse_v5(reader)
+
+    def _parse_v6(self, reader: Buffer):
+        self._parse_v5(reader)
+        self.min_dx_level, self.max_dx_level = reader.read_fmt('2H')
+
+    def _parse_v7_l4d(self, reader: Buffer):
+        self._parse_v6(reader)
+        self.diffuse_modulation = reader.read_fmt('4B')
+
+    def _parse_v7_vin(self, reader: Buffer):
+        self._parse_v6(reader)
+
+    def _parse_v8(self, reader: Buffer):
+        self._parse_v5(reader)
+        self.min_cpu_level, self.max_cpu_level, self.min_gpu_level, self.max_gpu_level = reader.read_fmt('4B')
+        self.diffuse_modulation = reader.read_fmt('4B')
+
+    def _parse_v9(self, reader: Buffer):
+        self._parse_v8(reader)
+        self.disable_x360 = reader.read_fmt('I')
+
+    def _parse_v10(self, reader: Buffer):
+        self._parse_v6(reader)
+        self.flags = StaticPropFlag(reader.read_uint32())
+        self.lightmap_resolution = reader.read_fmt('2H')
+
+    def _parse_v10_csgo(self, reader: Buffer):
+        self._parse_v9(reader)
+        reader.skip(4)
+
+    def _parse_v11_lite(self, reader: Buffer):
+        self._parse_v10(reader)
+        self.diffuse_modulation = reader.read_fmt('4B')
+
+    def _parse_v11(self, reader: Buffer):
+        self._parse_v11_lite(reader)
+        self.flags_ex = reader.read_int32()
+
+    def _parse_v11_csgo(self, reader: Buffer):
+        self._parse_v10_csgo(reader)
+        self.uniform_scale = reader.read_float()
+
+    def _parse_v12(self, reader: Buffer):
+        self.origin = reader.read_fmt('3f')
+        self.rotation = reader.read_fmt('3f')
+        self.prop_type = reader.read_int16()
+        reader.skip(4 + 2)
+        self.skin = reader.read_int32()
+        reader.skip(12 * 4)
+
+    def _parse_v13_strata(self, reader: Buffer):
+        self._parse_v11_csgo(reader)
+        self.uniform_scale_yz = reader.read_fmt("2f")
+
+
+# Game lump version, BSP version, app id, record size for versions where dispatch depends on it
+CASES = [
+    (4, (19, 0), SteamAppId.UNKNOWN, None),
+    (5, (20, 0), SteamAppId.UNKNOWN, None),
+    (6, (20, 0), SteamAppId.UNKNOWN, None),
+    (6, (20, 0), SteamAppId.VINDICTUS, None),
+    (6, (20, 4), SteamAppId.UNKNOWN, None),
+    (7, (20, 0), SteamAppId.LEFT_4_DEAD, 68),
+    (7, (20, 0), SteamAppId.TEAM_FORTRESS_2, 72),
+    (7, (20, 0), SteamAppId.VINDICTUS, None),
+    (8, (20, 0), SteamAppId.UNKNOWN, None),
+    (9, (20, 0), SteamAppId.UNKNOWN, None),
+    (10, (20, 0), SteamAppId.UNKNOWN, None),
+    (10, (21, 0), SteamAppId.COUNTER_STRIKE_GO, None),
+    (10, (20, 0), SteamAppId.BLACK_MESA, 72),
+    (11, (20, 0), SteamAppId.UNKNOWN, None),
+    (11, (20, 0), SteamAppId.BLACK_MESA, 76),
+    (11, (20, 0), SteamAppId.BLACK_MESA, 80),
+    (11, (21, 0), SteamAppId.COUNTER_STRIKE_GO, None),
+    (12, (21, 0), SteamAppId.UNKNOWN, None),
+    (13, (21, 0), SteamAppId.UNKNOWN, None),
+]
+
+
+def _reference_record_size(version: int, bsp_version: tuple[int, int], app_id: SteamAppId,
+                           size: int | None) -> int:
+    reader = MemoryBuffer(bytes(256))
+    ReferenceStaticProp().parse(reader, version, bsp_version, size or 0, app_id)
+    return reader.tell()
+
+
+def _pack_lump(version: int, app_id: SteamAppId, records: bytes, count: int, scaling: dict[int, bytes]) -> bytes:
+    data = bytearray(struct.pack("<i", 2) + b"models/a.mdl".ljust(128, b"\x00") + b"models/b.mdl".ljust(128, b"\x00"))
+    data += struct.pack("<i3" + ("I" if version >= 13 else "H"), 3, 1, 2, 3)
+    if version == 12:
+        data += struct.pack("<2i", 0, 0)
+    if app_id == SteamAppId.VINDICTUS:
+        data += struct.pack("<I", len(scaling))
+        for prop_id, scale in scaling.items():
+            data += struct.pack("<i", prop_id) + scale
+    data += struct.pack("<i", count) + records
+    return bytes(data)
+
+
+def _expected_field(value, dtype: np.dtype) -> np.ndarray:
+    if isinstance(value, (list, tuple)) and len(value) == 0:
+        return np.zeros(dtype.shape, dtype.base)
+    return np.asarray(value, dtype.base).reshape(dtype.shape)
+
+
+@pytest.mark.parametrize("version, bsp_version, app_id, size", CASES)
+def test_static_props_match_reference_parser(version, bsp_version, app_id, size):
+    rng = random.Random(version * 1000 + int(app_id) + (size or 0))
+    record_size = _reference_record_size(version, bsp_version, app_id, size)
+    assert size is None or record_size == size
+    count = 16
+    records = rng.randbytes(record_size * count)
+    scaling = {}
+    if app_id == SteamAppId.VINDICTUS:
+        scaling = {prop_id: rng.randbytes(12) for prop_id in rng.sample(range(count), count // 2)}
+
+    lump = StaticPropLump(SimpleNamespace(version=version))
+    lump.parse(MemoryBuffer(_pack_lump(version, app_id, records, count, scaling)),
+               SimpleNamespace(version=bsp_version, steam_app_id=app_id))
+
+    assert lump.model_names == ["models/a.mdl", "models/b.mdl"]
+    assert lump.leafs.tolist() == [1, 2, 3]
+    assert lump.prop_count == count
+    reader = MemoryBuffer(records)
+    for prop_id in range(count):
+        reference = ReferenceStaticProp()
+        reference.parse(reader, version, bsp_version, record_size, app_id)
+        prop = lump.static_props[prop_id]
+        for name in STATIC_PROP_DTYPE.names:
+            if name == "scaling":
+                continue
+            expected = _expected_field(getattr(reference, name), STATIC_PROP_DTYPE.fields[name][0])
+            assert np.array_equal(prop[name], expected, equal_nan=True), f"prop {prop_id} {name}"
+
+        expected_scale = np.ones(3, np.float32)
+        uniform_scale = np.float32(reference.uniform_scale)
+        if uniform_scale != 0:
+            expected_scale[:] = uniform_scale
+        for axis, value in enumerate(np.asarray(reference.uniform_scale_yz, np.float32), 1):
+            if value != 0:
+                expected_scale[axis] = value
+        if prop_id in scaling:
+            expected_scale = np.frombuffer(scaling[prop_id], np.float32)
+        assert np.array_equal(lump.scales[prop_id], expected_scale, equal_nan=True), f"prop {prop_id} scale"
+    assert reader.tell() == len(records)